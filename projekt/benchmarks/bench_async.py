@@ -0,0 +1,96 @@
+"""Latency of AsyncUser operations for thousands of clients on one event loop.
+
+A slow rate refresh runs in the background to show it does not stall the loop.
+Run from the ``projekt`` directory::
+
+    python -m benchmarks.bench_async --clients 5000 --operations 20
+"""
+
+import argparse
+import asyncio
+import time
+from unittest.mock import patch
+
+from src.async_bank import AsyncBank, AsyncUser
+from src.auth import Auth
+from src.bank import Bank
+from src.user import User
+
+CURRENCIES = {"PLN": 1.0, "USD": 3.7642, "EUR": 4.2757}
+
+
+def percentile(values, fraction):
+    """Returns the value below which the given fraction of sorted values falls."""
+
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+async def client(async_user, account_number, operations, latencies):
+    for step in range(operations):
+        start = time.perf_counter()
+        if step % 3 == 0:
+            await async_user.deposit(10, account_number, "123456")
+        elif step % 3 == 1:
+            await async_user.withdraw(5, account_number, "123456")
+        else:
+            await async_user.get_balance(account_number)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0)
+
+
+async def run(clients, operations, refresh_delay):
+    bank = Bank("PKO BP", "1120", currencies=CURRENCIES)
+    async_bank = AsyncBank(bank)
+    auth = Auth()
+    tasks = []
+    latencies = []
+
+    for user_id in range(clients):
+        user = User(
+            id=user_id,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+        auth.login(user, user.email, "Password123!")
+        user.open_bank_account(bank, "123456", balance=1000)
+        account_number = next(iter(user.bank_accounts))
+        tasks.append(
+            client(AsyncUser(user, auth), account_number, operations, latencies)
+        )
+
+    def slow_fetch():
+        time.sleep(refresh_delay)
+        return CURRENCIES
+
+    with patch.object(bank, "_fetch_currencies", side_effect=slow_fetch):
+        start = time.perf_counter()
+        await asyncio.gather(async_bank.update_currencies(), *tasks)
+        elapsed = time.perf_counter() - start
+
+    return elapsed, sorted(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--operations", type=int, default=20)
+    parser.add_argument("--refresh-delay", type=float, default=0.5)
+    args = parser.parse_args()
+
+    elapsed, latencies = asyncio.run(
+        run(args.clients, args.operations, args.refresh_delay)
+    )
+
+    print(f"clients:     {args.clients}")
+    print(f"operations:  {len(latencies)} in {elapsed:.2f}s")
+    print(f"throughput:  {len(latencies) / elapsed:.0f} ops/s")
+    for label, fraction in (("p50", 0.5), ("p99", 0.99), ("p99.9", 0.999)):
+        print(f"{label:<12} {percentile(latencies, fraction) * 1e6:.1f} us")
+    print(f"max:         {latencies[-1] * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""pytest-benchmark suite for the hot paths of the banking core.
+
+Not collected by the unit test run; use ``python -m benchmarks.gate`` to save a
+baseline or to compare against it, or run directly::
+
+    python -m pytest benchmarks/bench_hot_paths.py --benchmark-only
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.auth import Auth  # noqa: E402
+from src.bank import Bank  # noqa: E402
+from src.bank_account import BankAccount  # noqa: E402
+from src.passwords import PasswordHasher, set_default_hasher  # noqa: E402
+from src.user import User  # noqa: E402
+
+# Key derivation at the production cost would dominate the login and user
+# benchmarks; bench_login measures the hash itself.
+set_default_hasher(PasswordHasher(cost=4))
+
+CURRENCIES = {
+    "PLN": 1.0,
+    "USD": 3.7642,
+    "EUR": 4.2757,
+    "GBP": 5.0205,
+    "CHF": 4.5595,
+}
+
+USER_FIELDS = {
+    "id": 1,
+    "name": "John",
+    "last_name": "Doe",
+    "email": "john.doe@example.com",
+    "password": "Password123!",
+    "phone": "781234567",
+}
+
+
+@pytest.fixture
+def bank():
+    return Bank("PKO BP", "1120", currencies=CURRENCIES)
+
+
+@pytest.fixture
+def user():
+    return User(**USER_FIELDS)
+
+
+@pytest.mark.parametrize("target_currency", ["PLN", "EUR"], ids=["same", "cross"])
+def test_transfer(benchmark, bank, user, target_currency):
+    source = BankAccount(user, bank, "123456", balance=10**12)
+    target = BankAccount(user, bank, "123456", currency=target_currency)
+
+    benchmark(source.transfer, 1, target.account_number, "123456", bank)
+
+
+@pytest.mark.parametrize("history", [100, 10_000, 100_000])
+def test_get_transactions_by_date(benchmark, bank, history):
+    account_number = "11200000000000000000000001"
+    start = datetime(2020, 1, 1)
+    for index in range(history):
+        bank.add_new_transaction(
+            {"type": "deposit", "amount": 1, "date": start + timedelta(hours=index)},
+            account_number,
+        )
+    middle = start + timedelta(hours=history // 2)
+
+    benchmark(
+        bank.get_transactions_by_date,
+        middle,
+        middle + timedelta(days=7),
+        account_number,
+    )
+
+
+def test_user_init(benchmark):
+    benchmark(User, **USER_FIELDS)
+
+
+def test_auth_login(benchmark, user):
+    auth = Auth()
+
+    def logout():
+        if auth.is_logged_in(user):
+            auth.logout(user)
+
+    benchmark.pedantic(
+        auth.login,
+        args=(user, user.email, USER_FIELDS["password"]),
+        setup=logout,
+        rounds=2000,
+    )
+
+
+def test_get_total_balance(benchmark, user):
+    auth = Auth()
+    auth.login(user, user.email, USER_FIELDS["password"])
+    for index, currency in enumerate(CURRENCIES):
+        bank = Bank(f"Bank {index}", f"{1000 + index}", currencies=CURRENCIES)
+        user.open_bank_account(bank, "123456", currency=currency, balance=1000)
+
+    benchmark(user.get_total_balance, auth)
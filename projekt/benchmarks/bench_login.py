@@ -0,0 +1,85 @@
+"""Logins per second for each password hash cost and verification pool size.
+
+Concurrent clients log in and out in threads. Pool size 0 verifies on the
+calling threads; larger sizes use a VerificationPool with that many worker
+processes. Run from the ``projekt`` directory::
+
+    python -m benchmarks.bench_login --costs 10 12 14 --workers 0 1 2 4
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.auth import Auth
+from src.passwords import PasswordHasher, VerificationPool, set_default_hasher
+from src.user import User
+
+PASSWORD = "Password123!"
+
+
+def client(auth, user, logins):
+    """Logs one user in and out repeatedly."""
+
+    for _ in range(logins):
+        auth.login(user, user.email, PASSWORD)
+        auth.logout(user)
+
+
+def measure(users, workers, logins):
+    """Returns logins per second with the given verification pool size."""
+
+    pool = VerificationPool(workers) if workers else None
+    auth = Auth(pool=pool)
+    per_client = max(1, logins // len(users))
+
+    try:
+        if pool is not None:
+            pool.verify(PASSWORD, users[0].password_hash)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(len(users)) as executor:
+            for future in [
+                executor.submit(client, auth, user, per_client) for user in users
+            ]:
+                future.result()
+        elapsed = time.perf_counter() - start
+    finally:
+        if pool is not None:
+            pool.close()
+
+    return per_client * len(users) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--costs", type=int, nargs="+", default=[10, 12, 14])
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument(
+        "--algorithm", default="scrypt", choices=["scrypt", "pbkdf2_sha256"]
+    )
+    args = parser.parse_args()
+
+    print(f"{'cost':>4}" + "".join(f"{f'pool={w}':>12}" for w in args.workers))
+
+    for cost in args.costs:
+        set_default_hasher(PasswordHasher(args.algorithm, cost=cost))
+        users = [
+            User(
+                id=index,
+                name="John",
+                last_name="Doe",
+                email=f"john.doe{index}@example.com",
+                password=PASSWORD,
+                phone="781234567",
+            )
+            for index in range(args.clients)
+        ]
+        rates = [measure(users, workers, args.logins) for workers in args.workers]
+        print(f"{cost:>4}" + "".join(f"{rate:>10.1f}/s" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
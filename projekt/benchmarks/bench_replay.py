@@ -0,0 +1,58 @@
+"""Time to rebuild a whole bank and single accounts from an event log.
+
+Run from the ``projekt`` directory::
+
+    python -m benchmarks.bench_replay --events 10000000 --accounts 100000
+"""
+
+import argparse
+import random
+import time
+
+from src.bank_account import AccountStatus
+from src.events import EventStore
+
+
+def build(events, accounts, snapshot_interval):
+    store = EventStore(snapshot_interval=snapshot_interval, clock=lambda: 0.0)
+    numbers = [f"1120{index:022d}" for index in range(accounts)]
+
+    for number in numbers:
+        store.append(number, "opened", (0.0, AccountStatus.ACTIVE, "PLN", "123456", 0))
+
+    rng = random.Random(0)
+    for _ in range(events - accounts):
+        store.append(rng.choice(numbers), "balance", rng.random() * 1000, 0.0)
+
+    return store, numbers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10_000_000)
+    parser.add_argument("--accounts", type=int, default=100_000)
+    parser.add_argument("--snapshot-interval", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    store, numbers = build(args.events, args.accounts, args.snapshot_interval)
+    print(f"append:         {len(store)} events in {time.perf_counter() - start:.2f}s")
+
+    for label, until in (
+        ("replay start:", 0),
+        ("replay middle:", len(store) // 2),
+        ("replay end:", None),
+    ):
+        start = time.perf_counter()
+        store.replay_bank(until)
+        print(f"{label:<15} {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    for number in numbers[:1000]:
+        store.replay_account(number)
+    elapsed = time.perf_counter() - start
+    print(f"account replay: {elapsed:.3f} ms per account")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Time to fast-forward a month of recurring payments with a simulated clock.
+
+Every account gets a monthly standing order to the next account, and optionally
+a daily fee. Run from the ``projekt`` directory::
+
+    python -m benchmarks.bench_scheduler --accounts 1000000
+"""
+
+import argparse
+import time
+
+from src.bank import Bank
+from src.bank_account import BankAccount
+from src.scheduler import DAY, Scheduler, SimulatedClock
+from src.user import User
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--daily-fee", action="store_true")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    bank = Bank("PKO BP", "1120", currencies={"PLN": 1.0})
+    user = User(
+        id=1,
+        name="John",
+        last_name="Doe",
+        email="john.doe@example.com",
+        password="Password123!",
+        phone="781234567",
+    )
+    numbers = [
+        BankAccount(
+            user, bank, "123456", balance=1000, account_number=f"1120{index:022d}"
+        ).account_number
+        for index in range(args.accounts)
+    ]
+
+    clock = SimulatedClock()
+    scheduler = Scheduler(bank, clock=clock, batch_size=args.batch_size)
+    for index, number in enumerate(numbers):
+        target = numbers[(index + 1) % len(numbers)]
+        scheduler.schedule(
+            (number, "transfer", 100, target, "123456", bank),
+            at=args.days * DAY,
+            interval=args.days * DAY,
+        )
+        if args.daily_fee:
+            scheduler.schedule((number, "withdraw", 1, "123456"), at=DAY, interval=DAY)
+    print(f"setup:       {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    executed, failures = scheduler.run_until(args.days * DAY)
+    elapsed = time.perf_counter() - start
+
+    print(f"runs:        {executed} in {elapsed:.2f}s ({len(failures)} failed)")
+    print(f"throughput:  {executed / elapsed:.0f} runs/s")
+
+
+if __name__ == "__main__":
+    main()
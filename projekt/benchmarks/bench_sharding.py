@@ -0,0 +1,82 @@
+"""Throughput of ShardedBank for a growing number of shard processes.
+
+Run from the ``projekt`` directory::
+
+    python -m benchmarks.bench_sharding --accounts 2000 --operations 200000
+"""
+
+import argparse
+import os
+import random
+import time
+
+from src.sharding import ShardedBank
+from src.user import User
+
+CURRENCIES = {"PLN": 1.0, "USD": 3.7642, "EUR": 4.2757}
+
+
+def run(shards, accounts, operations, batch_size):
+    """Measures batched deposit/withdraw throughput for one shard count.
+
+    Args:
+        shards (int): Number of worker processes.
+        accounts (int): Number of accounts to open.
+        operations (int): Number of operations to execute.
+        batch_size (int): Operations sent per execute_batch call.
+
+    Returns:
+        float: Operations per second.
+    """
+
+    user = User(
+        id=1,
+        name="John",
+        last_name="Doe",
+        email="john.doe@example.com",
+        password="Password123!",
+        phone="781234567",
+    )
+    rng = random.Random(42)
+
+    with ShardedBank("PKO BP", "1120", CURRENCIES, shards=shards) as bank:
+        numbers = [
+            bank.open_account(user, "123456", balance=1_000_000)
+            for _ in range(accounts)
+        ]
+
+        workload = [
+            (rng.choice(numbers), rng.choice(("deposit", "withdraw")), 1.0, "123456")
+            for _ in range(operations)
+        ]
+
+        start = time.perf_counter()
+        for offset in range(0, operations, batch_size):
+            bank.execute_batch(workload[offset : offset + batch_size])
+        elapsed = time.perf_counter() - start
+
+    return operations / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=2000)
+    parser.add_argument("--operations", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=20_000)
+    parser.add_argument("--max-shards", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    shard_counts = [1]
+    while shard_counts[-1] * 2 <= args.max_shards:
+        shard_counts.append(shard_counts[-1] * 2)
+
+    baseline = None
+    print(f"{'shards':>6} {'ops/s':>12} {'speedup':>8}")
+    for shards in shard_counts:
+        throughput = run(shards, args.accounts, args.operations, args.batch_size)
+        baseline = baseline or throughput
+        print(f"{shards:>6} {throughput:>12.0f} {throughput / baseline:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Throughput of monthly statement rendering across worker processes.
+
+Run from the ``projekt`` directory::
+
+    python -m benchmarks.bench_statements --accounts 1000000 --workers 8
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime
+
+from src.bank import Bank
+from src.bank_account import BankAccount
+from src.rollups import DailyRollups
+from src.statements import StatementGenerator
+from src.user import User
+
+
+def build(accounts, transactions):
+    bank = Bank("PKO BP", "1120", currencies={"PLN": 1.0})
+    user = User(
+        id=1,
+        name="John",
+        last_name="Doe",
+        email="john.doe@example.com",
+        password="Password123!",
+        phone="781234567",
+    )
+
+    for index in range(accounts):
+        account = BankAccount(
+            user, bank, "123456", balance=1000, account_number=f"1120{index:022d}"
+        )
+        for day in range(transactions):
+            bank.add_new_transaction(
+                {
+                    "type": "deposit" if day % 2 else "withdraw",
+                    "amount": 10,
+                    "date": datetime(2024, 1, 1 + day % 28, 12),
+                },
+                account.account_number,
+            )
+
+    return bank
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=1_000_000)
+    parser.add_argument("--transactions", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--format", choices=("text", "csv"), default="text")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    bank = build(args.accounts, args.transactions)
+    rollups = DailyRollups(bank)
+    print(f"setup:       {time.perf_counter() - start:.2f}s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        generator = StatementGenerator(
+            bank, directory, rollups, workers=args.workers, format=args.format
+        )
+
+        start = time.perf_counter()
+        paths, count = generator.generate(
+            datetime(2024, 1, 1), datetime(2024, 1, 31, 23, 59, 59, 999999)
+        )
+        elapsed = time.perf_counter() - start
+
+    print(f"workers:     {generator.workers}")
+    print(f"statements:  {count} in {elapsed:.2f}s ({len(paths)} files)")
+    print(f"throughput:  {count / elapsed:.0f} statements/s")
+
+
+if __name__ == "__main__":
+    main()
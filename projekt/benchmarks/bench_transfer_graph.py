@@ -0,0 +1,86 @@
+"""Latency of multi-hop transfer traces over a graph of millions of edges.
+
+Random transfers between accounts are spread evenly over a week. Each trace
+starts from a random account at a random hour. Run from the ``projekt``
+directory::
+
+    python -m benchmarks.bench_transfer_graph --edges 1000000 --accounts 20000
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from src.bank import Bank
+from src.transfer_graph import TransferGraph
+
+
+def build(edges, accounts, seed):
+    """Returns a graph of random transfers spread over a week."""
+
+    rng = random.Random(seed)
+    bank = Bank(name="PKO BP", bank_code="1120", currencies={"PLN": 1.0})
+    graph = TransferGraph(bank)
+    names = [str(index) for index in range(accounts)]
+    step = timedelta(weeks=1) / edges
+    date = datetime(2024, 1, 1)
+
+    for _ in range(edges):
+        graph.add_edge(
+            names[rng.randrange(accounts)],
+            names[rng.randrange(accounts)],
+            rng.random() * 1000,
+            date,
+        )
+        date += step
+
+    return graph, names
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--accounts", type=int, default=20_000)
+    parser.add_argument("--traces", type=int, default=100)
+    parser.add_argument("--min-amount", type=float, default=500.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    graph, names = build(args.edges, args.accounts, args.seed)
+    print(f"built {len(graph)} edges in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    for key in graph.window_keys:
+        graph.windows[key].index()
+    print(f"indexed {len(graph.windows)} windows in {time.perf_counter() - start:.2f}s")
+
+    rng = random.Random(args.seed)
+    first = datetime(2024, 1, 1)
+
+    print(f"{'hours':>5} {'hops':>4} {'p50 ms':>8} {'max ms':>8} {'edges':>6}")
+    for hours, hops in [(1, 3), (6, 3), (24, 3), (24, 5)]:
+        samples = []
+        for _ in range(args.traces):
+            since = first + timedelta(hours=rng.randrange(24 * 6))
+            started = time.perf_counter()
+            trace = graph.trace(
+                names[rng.randrange(len(names))],
+                since,
+                timedelta(hours=hours),
+                max_hops=hops,
+                min_amount=args.min_amount,
+            )
+            samples.append((time.perf_counter() - started, len(trace)))
+
+        samples.sort()
+        median = samples[len(samples) // 2]
+        print(
+            f"{hours:>5} {hops:>4} {median[0] * 1e3:>8.2f}"
+            f" {samples[-1][0] * 1e3:>8.2f} {median[1]:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
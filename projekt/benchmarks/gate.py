@@ -0,0 +1,48 @@
+"""Saves or checks the hot-path benchmark baseline.
+
+Baselines are machine specific and stored under ``benchmarks/.baseline``. Run
+from the ``projekt`` directory::
+
+    python -m benchmarks.gate save
+    python -m benchmarks.gate check --threshold 25
+
+``check`` fails when the median of any benchmark is more than ``threshold``
+percent slower than the latest saved baseline.
+"""
+
+import argparse
+import os
+import sys
+
+import pytest
+
+SUITE = os.path.join(os.path.dirname(__file__), "bench_hot_paths.py")
+STORAGE = os.path.join(os.path.dirname(__file__), ".baseline")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=("save", "check"))
+    parser.add_argument("--threshold", type=int, default=25)
+    args = parser.parse_args()
+
+    options = [
+        SUITE,
+        "-q",
+        "--benchmark-only",
+        f"--benchmark-storage=file://{STORAGE}",
+    ]
+
+    if args.command == "save":
+        options.append("--benchmark-save=baseline")
+    else:
+        options += [
+            "--benchmark-compare",
+            f"--benchmark-compare-fail=median:{args.threshold}%",
+        ]
+
+    sys.exit(pytest.main(options))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Load test of the banking core with a seeded synthetic workload.
+
+Runs offline against local exchange rates. Run from the ``projekt`` directory::
+
+    python -m benchmarks.load_test --users 10000 --operations 200000 --seed 1
+"""
+
+import argparse
+import time
+
+from src.passwords import PasswordHasher, set_default_hasher
+from src.workload import DEFAULT_MIX, WorkloadGenerator, run_workload
+
+
+def parse_mix(text):
+    """Parses ``deposit=30,withdraw=20`` into a weight dictionary."""
+
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        mix[name.strip()] = int(weight)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--operations", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="comma-separated operation=weight pairs",
+    )
+    parser.add_argument(
+        "--password-cost",
+        type=int,
+        default=4,
+        help="log2 scrypt cost of user passwords; low by default to keep setup fast",
+    )
+    args = parser.parse_args()
+
+    set_default_hasher(PasswordHasher(cost=args.password_cost))
+    generator = WorkloadGenerator(users=args.users, mix=args.mix, seed=args.seed)
+    start = time.perf_counter()
+    generator.build()
+    print(f"setup: {args.users} users in {time.perf_counter() - start:.2f}s")
+
+    report = run_workload(generator.operations(args.operations))
+
+    print(
+        f"total: {report['operations']} operations in {report['elapsed']:.2f}s, "
+        f"{report['throughput']:.0f} ops/s, peak RSS {report['peak_rss_kb']} KiB"
+    )
+    print(
+        f"{'operation':<26}{'count':>9}{'errors':>8}{'ops/s':>10}"
+        f"{'p50 us':>9}{'p90 us':>9}{'p99 us':>9}{'max us':>10}{'RSS+ KiB':>10}"
+    )
+    for name, stats in report["by_operation"].items():
+        print(
+            f"{name:<26}{stats['count']:>9}{stats['errors']:>8}"
+            f"{stats['throughput']:>10.0f}{stats['p50'] * 1e6:>9.1f}"
+            f"{stats['p90'] * 1e6:>9.1f}{stats['p99'] * 1e6:>9.1f}"
+            f"{stats['max'] * 1e6:>10.1f}{stats['rss_growth_kb']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
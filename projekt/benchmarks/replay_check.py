@@ -0,0 +1,92 @@
+"""Records a seeded workload, replays it and fails on any divergence.
+
+The replay runs against the current code, optionally with an alternative
+ledger configuration, and compares every outcome and the final balances and
+ledgers. Run from the ``projekt`` directory::
+
+    python -m benchmarks.replay_check --operations 1000000
+    python -m benchmarks.replay_check --save ops.pickle
+    python -m benchmarks.replay_check --load ops.pickle --tiered
+"""
+
+import argparse
+import sys
+import time
+
+from src.differential import Recorder, Recording, replay
+from src.ledger import TieredTransactions
+from src.passwords import PasswordHasher, set_default_hasher
+from src.workload import WorkloadGenerator
+
+
+def record(users, operations, seed, capture_results):
+    """Records a workload and returns the recording and its duration."""
+
+    recorder = Recorder(capture_results=capture_results)
+
+    with recorder:
+        generator = WorkloadGenerator(users=users, seed=seed)
+        generator.build()
+
+        start = time.perf_counter()
+        for _, method, args in generator.operations(operations):
+            try:
+                method(*args)
+            except (ValueError, TypeError, PermissionError):
+                pass
+        elapsed = time.perf_counter() - start
+
+    return recorder.recording(), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--results", action="store_true", help="compare return values")
+    parser.add_argument(
+        "--tiered", action="store_true", help="replay on tiered ledgers"
+    )
+    parser.add_argument("--save", help="write the recording to this file")
+    parser.add_argument("--load", help="replay this recording instead of recording")
+    args = parser.parse_args()
+
+    set_default_hasher(PasswordHasher(cost=4))
+
+    if args.load:
+        recording = Recording.load(args.load)
+    else:
+        recording, elapsed = record(
+            args.users, args.operations, args.seed, args.results
+        )
+        print(f"recorded {len(recording)} operations in {elapsed:.2f}s")
+
+    if args.save:
+        recording.save(args.save)
+
+    setup = None
+    if args.tiered:
+        setup = lambda bank: TieredTransactions(bank, hot_size=64, segment_size=64)
+
+    start = time.perf_counter()
+    report = replay(recording, setup=setup)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"replayed {report['operations']} operations in {elapsed:.2f}s,"
+        f" {report['divergent_operations']} divergent,"
+        f" {len(report['state_divergences'])} accounts differ"
+    )
+
+    for divergence in report["divergences"][:10]:
+        print(divergence)
+    for divergence in report["state_divergences"][:10]:
+        print(divergence)
+
+    if report["divergent_operations"] or report["state_divergences"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
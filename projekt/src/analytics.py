@@ -0,0 +1,432 @@
+import heapq
+import math
+import random
+from array import array
+from itertools import count
+
+TRANSFER_TYPES = ("transfer", "interbank_transfer")
+REFUND_TYPES = ("interbank_refund",)
+
+
+class TopN:
+    """Keeps the ``n`` items with the largest keys using a bounded min-heap."""
+
+    def __init__(self, n):
+        """Initializes a new TopN instance.
+
+        Args:
+            n (int): Number of items to keep.
+
+        Raises:
+            ValueError: If n is not positive.
+        """
+
+        if n <= 0:
+            raise ValueError("N must be positive.")
+
+        self.n = n
+        self.heap = []
+        self.counter = count()
+
+    def __len__(self):
+        return len(self.heap)
+
+    def add(self, key, item):
+        """Offers an item, keeping it only if it is among the largest seen.
+
+        Args:
+            key (float): Ranking key.
+            item (Any): The item stored with the key.
+        """
+
+        if len(self.heap) < self.n:
+            heapq.heappush(self.heap, (key, next(self.counter), item))
+        elif key > self.heap[0][0]:
+            heapq.heapreplace(self.heap, (key, next(self.counter), item))
+
+    def items(self):
+        """Returns the kept items, largest first.
+
+        Returns:
+            list[tuple[float, Any]]: Key and item pairs.
+        """
+
+        return [(key, item) for key, _, item in sorted(self.heap, reverse=True)]
+
+
+class KLLSketch:
+    """KLL quantile sketch with memory proportional to ``k * log(n / k)``.
+
+    Values are held in a stack of compactors. When a compactor fills up, it is
+    sorted and every other value is promoted to the next level with twice the
+    weight, so the rank error stays around ``1.7 / k`` of the stream length.
+    """
+
+    def __init__(self, k=200, seed=None):
+        """Initializes a new KLLSketch instance.
+
+        Args:
+            k (int, optional): Accuracy parameter, the size of the top compactor.
+                Defaults to 200.
+            seed (int, optional): Seed for the coin flips used by compaction.
+
+        Raises:
+            ValueError: If k is smaller than 8.
+        """
+
+        if k < 8:
+            raise ValueError("K must be at least 8.")
+
+        self.k = k
+        self.random = random.Random(seed)
+        self.compactors = [[]]
+        self.count = 0
+        self.size = 0
+        self.max_size = self._capacity(0)
+
+    def __len__(self):
+        return self.count
+
+    def add(self, value):
+        """Adds a value to the sketch.
+
+        Args:
+            value (float): The value to add.
+        """
+
+        self.compactors[0].append(value)
+        self.count += 1
+        self.size += 1
+
+        if self.size >= self.max_size:
+            self._compress()
+
+    def quantile(self, fraction):
+        """Returns an approximate quantile of the added values.
+
+        Args:
+            fraction (float): Quantile to return, between 0 and 1.
+
+        Raises:
+            ValueError: If the fraction is out of range or the sketch is empty.
+
+        Returns:
+            float: The approximate quantile.
+        """
+
+        if not 0 <= fraction <= 1:
+            raise ValueError("Quantile must be between 0 and 1.")
+
+        if not self.count:
+            raise ValueError("Sketch is empty.")
+
+        weighted = sorted(
+            (value, 1 << level)
+            for level, compactor in enumerate(self.compactors)
+            for value in compactor
+        )
+        target = fraction * sum(weight for _, weight in weighted)
+        cumulative = 0
+
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+
+        return weighted[-1][0]
+
+    def _capacity(self, level):
+        """Returns the capacity of a compactor; lower levels get geometrically less."""
+
+        depth = len(self.compactors) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        """Compacts full levels until the sketch fits its memory budget again."""
+
+        for level, compactor in enumerate(self.compactors):
+            if len(compactor) < self._capacity(level):
+                continue
+
+            if level + 1 == len(self.compactors):
+                self.compactors.append([])
+                self.max_size = sum(
+                    self._capacity(height) for height in range(len(self.compactors))
+                )
+
+            compactor.sort()
+            kept = [compactor.pop(0)] if len(compactor) % 2 else []
+            promoted = compactor[self.random.getrandbits(1) :: 2]
+            self.compactors[level + 1].extend(promoted)
+            self.size -= len(compactor) - len(promoted)
+            compactor[:] = kept
+
+            if self.size < self.max_size:
+                break
+
+
+class CountMinSketch:
+    """Approximate per-key totals in fixed memory; estimates never undercount."""
+
+    def __init__(self, width=2048, depth=4):
+        """Initializes a new CountMinSketch instance.
+
+        Args:
+            width (int, optional): Counters per row. Defaults to 2048.
+            depth (int, optional): Number of rows. Defaults to 4.
+
+        Raises:
+            ValueError: If the width or depth is not positive.
+        """
+
+        if width <= 0 or depth <= 0:
+            raise ValueError("Width and depth must be positive.")
+
+        self.width = width
+        self.depth = depth
+        self.rows = [array("d", bytes(8 * width)) for _ in range(depth)]
+
+    def _slots(self, key):
+        """Returns the counter index of a key in each row."""
+
+        first = hash(key)
+        second = (first >> 16) | 1
+        return [(first + row * second) % self.width for row in range(self.depth)]
+
+    def add(self, key, weight=1.0):
+        """Adds weight to a key and returns its new estimate.
+
+        Args:
+            key (Hashable): The key.
+            weight (float, optional): Weight to add. Defaults to 1.
+
+        Returns:
+            float: The estimated total of the key.
+        """
+
+        estimate = math.inf
+
+        for row, slot in zip(self.rows, self._slots(key)):
+            row[slot] += weight
+            estimate = min(estimate, row[slot])
+
+        return estimate
+
+    def estimate(self, key):
+        """Returns the estimated total of a key.
+
+        Args:
+            key (Hashable): The key.
+
+        Returns:
+            float: The estimated total.
+        """
+
+        return min(row[slot] for row, slot in zip(self.rows, self._slots(key)))
+
+
+class HeavyHitters:
+    """Tracks the ``k`` keys with the largest totals on top of a count-min sketch."""
+
+    def __init__(self, k=10, width=2048, depth=4):
+        """Initializes a new HeavyHitters instance.
+
+        Args:
+            k (int, optional): Number of keys to track. Defaults to 10.
+            width (int, optional): Count-min sketch width. Defaults to 2048.
+            depth (int, optional): Count-min sketch depth. Defaults to 4.
+
+        Raises:
+            ValueError: If k is not positive.
+        """
+
+        if k <= 0:
+            raise ValueError("K must be positive.")
+
+        self.k = k
+        self.sketch = CountMinSketch(width, depth)
+        self.candidates = {}
+        self.heap = []
+
+    def add(self, key, weight=1.0):
+        """Adds weight to a key.
+
+        Args:
+            key (Hashable): The key.
+            weight (float, optional): Weight to add. Defaults to 1.
+        """
+
+        estimate = self.sketch.add(key, weight)
+
+        if key in self.candidates:
+            # The old heap entry goes stale; eviction re-pushes it when reached.
+            self.candidates[key] = estimate
+            return
+
+        if len(self.candidates) < self.k:
+            self.candidates[key] = estimate
+            heapq.heappush(self.heap, (estimate, key))
+            return
+
+        while self.heap:
+            smallest, candidate = self.heap[0]
+            current = self.candidates[candidate]
+
+            if current != smallest:
+                heapq.heapreplace(self.heap, (current, candidate))
+                continue
+
+            if estimate > smallest:
+                heapq.heapreplace(self.heap, (estimate, key))
+                del self.candidates[candidate]
+                self.candidates[key] = estimate
+
+            return
+
+    def top(self):
+        """Returns the tracked keys, heaviest first.
+
+        Returns:
+            list[tuple[Hashable, float]]: Keys with their estimated totals.
+        """
+
+        return sorted(self.candidates.items(), key=lambda item: item[1], reverse=True)
+
+
+class TransactionAnalytics:
+    """Streaming risk analytics kept up to date as transactions are added.
+
+    Tracks the largest transfers per day, amount quantiles per currency and the
+    accounts moving the most money. Memory depends on the configured sizes and
+    the number of retained days, never on the length of the ledgers. Incoming
+    legs of transfers and refunds of failed transfers are skipped so each
+    movement of money is counted once. Ledger entries of accounts held by other
+    banks, such as the source legs of their transfers, are skipped as well.
+    """
+
+    def __init__(
+        self,
+        bank,
+        top_n=10,
+        heavy_hitters=10,
+        days=31,
+        k=200,
+        width=2048,
+        depth=4,
+        seed=None,
+    ):
+        """Initializes a new TransactionAnalytics and attaches it to the bank.
+
+        Args:
+            bank (Bank): The bank to analyse.
+            top_n (int, optional): Transfers kept per day. Defaults to 10.
+            heavy_hitters (int, optional): Accounts tracked by volume. Defaults to 10.
+            days (int, optional): Days of top transfers retained. Defaults to 31.
+            k (int, optional): Accuracy parameter of the quantile sketches.
+                Defaults to 200.
+            width (int, optional): Count-min sketch width. Defaults to 2048.
+            depth (int, optional): Count-min sketch depth. Defaults to 4.
+            seed (int, optional): Seed for the quantile sketches.
+
+        Raises:
+            ValueError: If the number of retained days is not positive.
+        """
+
+        if days <= 0:
+            raise ValueError("Number of days must be positive.")
+
+        self.bank = bank
+        self.top_n = top_n
+        self.days = days
+        self.k = k
+        self.seed = seed
+        self.transfers = {}
+        self.sketches = {}
+        self.heavy = HeavyHitters(heavy_hitters, width, depth)
+
+        bank.add_transaction_listener(self.record)
+
+    def record(self, transaction, account_number):
+        """Feeds a transaction added to the ledger into the aggregators.
+
+        Args:
+            transaction (dict): The transaction added to the ledger.
+            account_number (str): The account the transaction belongs to.
+        """
+
+        amount = transaction.get("amount")
+        kind = transaction["type"]
+        if amount is None or kind.startswith("incoming_") or kind in REFUND_TYPES:
+            return
+
+        account = self.bank.accounts.get(account_number)
+        if account is None:
+            return
+
+        currency = account.currency
+        amount_pln = amount * self.bank.currencies[currency]
+
+        sketch = self.sketches.get(currency)
+        if sketch is None:
+            sketch = self.sketches[currency] = KLLSketch(self.k, self.seed)
+        sketch.add(amount)
+
+        self.heavy.add(account_number, amount_pln)
+
+        if transaction["type"] in TRANSFER_TYPES:
+            day = transaction["date"].date()
+            top = self.transfers.get(day)
+
+            if top is None:
+                top = self.transfers[day] = TopN(self.top_n)
+                if len(self.transfers) > self.days:
+                    del self.transfers[min(self.transfers)]
+
+            top.add(amount_pln, (account_number, transaction))
+
+    def largest_transfers(self, day):
+        """Returns the largest transfers of a day, measured in PLN.
+
+        Args:
+            day (date): The day.
+
+        Returns:
+            list[tuple[float, str, dict]]: PLN amount, source account and
+                transaction, largest first.
+        """
+
+        top = self.transfers.get(day)
+        if top is None:
+            return []
+
+        return [(amount, number, tx) for amount, (number, tx) in top.items()]
+
+    def quantile(self, currency, fraction):
+        """Returns an approximate quantile of transaction amounts in a currency.
+
+        Args:
+            currency (str): The currency code.
+            fraction (float): Quantile to return, between 0 and 1.
+
+        Raises:
+            ValueError: If no transactions in the currency were seen.
+
+        Returns:
+            float: The approximate quantile.
+        """
+
+        sketch = self.sketches.get(currency)
+        if sketch is None:
+            raise ValueError("No transactions in this currency.")
+
+        return sketch.quantile(fraction)
+
+    def heaviest_accounts(self):
+        """Returns the accounts moving the most money.
+
+        Returns:
+            list[tuple[str, float]]: Account numbers with their estimated PLN
+                volume, heaviest first.
+        """
+
+        return self.heavy.top()
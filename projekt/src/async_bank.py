@@ -0,0 +1,246 @@
+import asyncio
+import csv
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+_storage_executors = weakref.WeakKeyDictionary()
+
+
+class AsyncBank:
+    """Asyncio facade over a Bank.
+
+    Ledger reads run inline on the event loop; network and disk I/O is moved to an
+    executor so it never blocks other clients. Banks backed by storage read and
+    write SQLite on every call, so their calls run on the storage's worker
+    thread instead (see ``storage_executor``).
+    """
+
+    def __init__(self, bank, executor=None):
+        """Initializes a new AsyncBank instance.
+
+        Args:
+            bank (Bank): The wrapped bank.
+            executor (concurrent.futures.Executor, optional): Executor for blocking I/O.
+                Defaults to the event loop's default executor.
+        """
+
+        self.bank = bank
+        self.executor = executor
+        self.storage_executor = storage_executor(bank.storage)
+        self._refresh = None
+
+    async def update_currencies(self):
+        """Refreshes the exchange rates without blocking the event loop.
+
+        Concurrent callers share a single in-flight request to the NBP API.
+
+        Returns:
+            bool: True if the update was successful.
+        """
+
+        if self._refresh is None:
+            loop = asyncio.get_running_loop()
+            self._refresh = loop.run_in_executor(
+                self.executor, self.bank._fetch_currencies
+            )
+
+        refresh = self._refresh
+        try:
+            currencies = await asyncio.shield(refresh)
+        finally:
+            if self._refresh is refresh and refresh.done():
+                self._refresh = None
+
+        self.bank.currencies = currencies
+
+        return True
+
+    async def get_transactions(self, account_number):
+        """Asynchronous counterpart of Bank.get_transactions."""
+
+        return await _call(
+            self.storage_executor, self.bank.get_transactions, account_number
+        )
+
+    async def get_transactions_by_date(self, date_from, date_to, account_number):
+        """Asynchronous counterpart of Bank.get_transactions_by_date."""
+
+        return await _call(
+            self.storage_executor,
+            self.bank.get_transactions_by_date,
+            date_from,
+            date_to,
+            account_number,
+        )
+
+    async def export_transactions(self, account_number, path):
+        """Writes an account's transactions to a CSV file in the executor.
+
+        The file is flushed and fsynced before the coroutine completes.
+
+        Args:
+            account_number (str): The account to export.
+            path (str): Destination file path.
+
+        Returns:
+            int: Number of exported transactions.
+        """
+
+        transactions = list(await self.get_transactions(account_number))
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            self.executor, _write_transactions_csv, transactions, path
+        )
+
+
+class AsyncUser:
+    """Asyncio facade over a User bound to an authentication system."""
+
+    INLINE_OPERATIONS = (
+        "close_bank_account",
+        "get_total_balance",
+        "get_balance",
+        "change_pin",
+        "withdraw",
+        "deposit",
+        "transfer",
+        "get_transactions",
+        "get_transactions_by_date",
+        "unlock_account",
+        "change_currency",
+        "calculate_intrest",
+        "get_user",
+        "get_users",
+    )
+
+    def __init__(self, user, auth, storage=None):
+        """Initializes a new AsyncUser instance.
+
+        Args:
+            user (User): The wrapped user.
+            auth (Auth): The authentication system passed to every operation.
+            storage (SQLiteStorage, optional): Storage backing the user's banks.
+                Operations then run on its worker thread instead of the event loop.
+        """
+
+        self.user = user
+        self.auth = auth
+        self.storage_executor = storage_executor(storage)
+
+    async def open_bank_account(self, bank, pin_code, currency="PLN", balance=0):
+        """Asynchronous counterpart of User.open_bank_account."""
+
+        return await _call(
+            self.storage_executor,
+            self.user.open_bank_account,
+            bank,
+            pin_code,
+            currency,
+            balance,
+        )
+
+    async def update_currencies(self, async_bank):
+        """Refreshes the bank's exchange rates. Only available to admins.
+
+        Args:
+            async_bank (AsyncBank): The bank whose rates are refreshed.
+
+        Raises:
+            PermissionError: If the user is not logged in.
+            PermissionError: If the user does not have admin privileges.
+
+        Returns:
+            bool: True if the currency rates were successfully updated.
+        """
+
+        if not self.auth.is_logged_in(self.user):
+            raise PermissionError("User not logged in")
+        if not self.auth.is_admin(self.user):
+            raise PermissionError("U have not permission to perform this action")
+
+        return await async_bank.update_currencies()
+
+
+def storage_executor(storage):
+    """Returns the single worker thread running the calls that touch a storage.
+
+    SQLite connections and the storage's write queue are not safe for concurrent
+    use, so every AsyncBank and AsyncUser of one storage shares one worker.
+
+    Args:
+        storage (SQLiteStorage | None): The storage, or None for in-memory banks.
+
+    Returns:
+        ThreadPoolExecutor | None: The storage's executor, or None if there is no
+        storage and calls can run on the event loop.
+    """
+
+    if storage is None:
+        return None
+
+    executor = _storage_executors.get(storage)
+    if executor is None:
+        executor = _storage_executors[storage] = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="storage"
+        )
+
+    return executor
+
+
+async def _call(executor, function, *args, **kwargs):
+    """Runs a call inline, or in the executor if one is given."""
+
+    if executor is None:
+        return function(*args, **kwargs)
+
+    loop = asyncio.get_running_loop()
+
+    return await loop.run_in_executor(executor, partial(function, *args, **kwargs))
+
+
+def _inline_operation(name):
+    """Builds a coroutine method running ``User.<name>`` for an AsyncUser."""
+
+    async def operation(self, *args, **kwargs):
+        return await _call(
+            self.storage_executor,
+            getattr(self.user, name),
+            *args,
+            auth=self.auth,
+            **kwargs,
+        )
+
+    operation.__name__ = name
+    operation.__doc__ = f"Asynchronous counterpart of User.{name}."
+
+    return operation
+
+
+for _name in AsyncUser.INLINE_OPERATIONS:
+    setattr(AsyncUser, _name, _inline_operation(_name))
+
+
+def _write_transactions_csv(transactions, path):
+    """Writes transactions to a CSV file and fsyncs it."""
+
+    fields = []
+    for transaction in transactions:
+        for field in transaction:
+            if field not in fields:
+                fields.append(field)
+
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        for transaction in transactions:
+            row = dict(transaction)
+            if "bank" in row:
+                row["bank"] = row["bank"].bank_code
+            writer.writerow(row)
+        file.flush()
+        os.fsync(file.fileno())
+
+    return len(transactions)
@@ -3,8 +3,16 @@ from src.user import UserRole
 
 class Auth:
 
-    def __init__(self):
+    def __init__(self, pool=None):
+        """Initializes a new Auth instance.
+
+        Args:
+            pool (VerificationPool, optional): Worker processes verifying passwords.
+                Passwords are verified on the calling thread when omitted.
+        """
+
         self.logged_users = {}
+        self.pool = pool
 
     def login(self, user, email, password):
 
@@ -14,7 +22,12 @@ class Auth:
         if not isinstance(password, str):
             raise TypeError("Password must be a string")
 
-        if email != user.email or password != user.password:
+        if self.pool is not None:
+            verified = self.pool.verify(password, user.password_hash)
+        else:
+            verified = user.check_password(password)
+
+        if email != user.email or not verified:
             raise PermissionError("Invalid credentials !")
 
         if user.id in self.logged_users:
@@ -1,17 +1,51 @@
 from datetime import datetime
-import requests
+import random
+import sys
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
+from itertools import islice
+from operator import itemgetter
+
+from src.ledger import TieredLedger
+from src.snapshot import BankSnapshot
+
+BULK_OPERATIONS = frozenset(
+    {
+        "close",
+        "withdraw",
+        "deposit",
+        "transfer",
+        "unlock_account",
+        "change_currency",
+        "change_pin",
+        "calculate_intrest",
+    }
+)
+
+
+def __getattr__(name):
+    """Imports ``requests`` on first use; it is only needed to fetch exchange rates."""
+
+    if name == "requests":
+        import requests
+
+        globals()["requests"] = requests
+        return requests
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Bank:
     """Class representing a bank in Banking System."""
 
-    def __init__(self, name, bank_code):
+    def __init__(self, name, bank_code, currencies=None, storage=None):
         """Initializes a new Bank instance.
 
         Args:
             name (str): name of the bank
             bank_code (str): bank code
+            currencies (dict[str, float], optional): preloaded exchange rates; fetched from the NBP API when omitted
+            storage (SQLiteStorage, optional): storage backend for users, accounts and the ledger
         """
 
         self.name = name
@@ -19,8 +53,27 @@ class Bank:
         self.accounts = {}
         self.users = {}
         self.transactions = defaultdict(list)
-        self.currencies = self._fetch_currencies()
+        self.currencies = (
+            dict(currencies) if currencies is not None else self._fetch_currencies()
+        )
         self.created_at = datetime.now()
+        self.pre_commit_checks = []
+        self.transaction_listeners = []
+        self.pin_attempt_limiter = None
+        self.snapshots = {}
+        self.account_observers = []
+        self.unsorted_ledgers = set()
+        self.checked_ledgers = {}
+        self.users_by_role = defaultdict(dict)
+        self.accounts_by_status = defaultdict(dict)
+        self.accounts_by_currency = defaultdict(dict)
+        self.storage = storage
+
+        if storage is not None:
+            storage.attach(self)
+
+            for user in self.users.values():
+                self._index_user(user)
 
     def get_user(self, user_id):
         """Returns a user by their unique ID.
@@ -52,11 +105,276 @@ class Bank:
     def add_user(self, user):
         """Adds a new user to the system.
 
+        Re-adding an ID replaces the user registered under it.
+
         Args:
             user (User): The user object to be added.
         """
 
+        previous = self.users.get(user.id)
+        if previous is not None:
+            self.users_by_role[previous.role].pop(user.id, None)
+            previous._banks = tuple(
+                bank for bank in previous._banks if bank is not self
+            )
+
         self.users[user.id] = user
+        self._index_user(user)
+
+        if self.storage is not None:
+            self.storage.save_user(self, user)
+
+    def add_account(self, account):
+        """Registers a newly opened bank account.
+
+        Account observers see the opening as the account number changing from None.
+
+        Args:
+            account (BankAccount): The account to register.
+        """
+
+        self.accounts[account.account_number] = account
+        self.index_account(account.account_number, account.status, account.currency)
+
+        for observer in self.account_observers:
+            observer(account, "account_number", None, account.account_number)
+
+    def add_account_observer(self, observer):
+        """Registers an observer notified right before an account's state changes.
+
+        The observer is called as ``observer(account, field, old_value, new_value)``
+        for changes of balance, status, currency, pin and failedWithdrawCount, and
+        when an account is opened.
+
+        Args:
+            observer (callable): The observer to register.
+        """
+
+        self.account_observers.append(observer)
+
+    def account_changing(self, account, field, old_value, new_value):
+        """Notifies open snapshots and account observers about an upcoming change.
+
+        Args:
+            account (BankAccount): The account about to change.
+            field (str): Name of the changing attribute.
+            old_value (Any): Current value.
+            new_value (Any): Value about to be set.
+        """
+
+        if self.snapshots:
+            self.preserve_for_snapshots(account.account_number)
+
+        if field == "status":
+            self.index_account(
+                account.account_number,
+                new_value,
+                account.currency,
+                previous=(old_value, account.currency),
+            )
+        elif field == "currency":
+            self.index_account(
+                account.account_number,
+                account.status,
+                new_value,
+                previous=(account.status, old_value),
+            )
+
+        for observer in self.account_observers:
+            observer(account, field, old_value, new_value)
+
+    def index_account(self, account_number, status, currency, previous=None):
+        """Files an account number under its status and currency indexes.
+
+        Args:
+            account_number (str): The account number.
+            status (AccountStatus): Status to index the account under.
+            currency (str): Currency to index the account under.
+            previous (tuple, optional): Status and currency the account is currently
+                indexed under. Only indexes whose key changes are touched, so the
+                account keeps its position in the others.
+        """
+
+        old_status, old_currency = previous if previous is not None else (None, None)
+
+        if status != old_status:
+            if old_status is not None:
+                self.accounts_by_status[old_status].pop(account_number, None)
+            self.accounts_by_status[status][account_number] = None
+
+        if currency != old_currency:
+            if old_currency is not None:
+                self.accounts_by_currency[old_currency].pop(account_number, None)
+            self.accounts_by_currency[currency][account_number] = None
+
+    def change_user_role(self, user, role):
+        """Changes a registered user's role and moves them in the role index.
+
+        Args:
+            user (User): The registered user.
+            role (UserRole): The new role.
+
+        Raises:
+            ValueError: If the user is not registered in the bank.
+        """
+
+        if self.users.get(user.id) is not user:
+            raise ValueError(f"User {user.id} not found.")
+
+        user.role = role
+
+    def user_role_changed(self, user, previous):
+        """Moves a registered user in the role index after their role changed.
+
+        Called by the ``User.role`` setter for every bank the user is registered in.
+
+        Args:
+            user (User): The user whose role changed.
+            previous (UserRole): The user's previous role.
+        """
+
+        if self.users.get(user.id) is not user:
+            return
+
+        self.users_by_role[previous].pop(user.id, None)
+        self.users_by_role[user.role][user.id] = None
+
+        if self.storage is not None:
+            self.storage.save_user(self, user)
+
+    def _index_user(self, user):
+        """Files a registered user in the role index and links the user to the bank."""
+
+        self.users_by_role[user.role][user.id] = None
+
+        if not any(bank is self for bank in user._banks):
+            user._banks += (self,)
+
+    def list_users(self, role=None, offset=0, limit=100):
+        """Returns one page of registered users in registration order.
+
+        With a role filter the page is read from the role index, so it costs
+        O(offset + limit) whatever the size of the bank.
+
+        Args:
+            role (UserRole, optional): Only list users with this role.
+            offset (int, optional): Number of matching users to skip. Defaults to 0.
+            limit (int, optional): Maximum page size. Defaults to 100.
+
+        Raises:
+            ValueError: If the offset is negative or the limit is not positive.
+
+        Returns:
+            tuple[list[User], int]: The page and the total number of matching users.
+        """
+
+        self._validate_page(offset, limit)
+
+        ids = self.users if role is None else self.users_by_role.get(role, {})
+        page = [self.users[user_id] for user_id in islice(ids, offset, offset + limit)]
+
+        return page, len(ids)
+
+    def list_accounts(self, status=None, currency=None, offset=0, limit=100):
+        """Returns one page of accounts, oldest entry in the matching index first.
+
+        Filters are answered from the status and currency indexes: a single filter
+        costs O(offset + limit), both together cost O(size of the smaller index).
+
+        Args:
+            status (AccountStatus, optional): Only list accounts with this status.
+            currency (str, optional): Only list accounts in this currency.
+            offset (int, optional): Number of matching accounts to skip. Defaults to 0.
+            limit (int, optional): Maximum page size. Defaults to 100.
+
+        Raises:
+            ValueError: If the offset is negative or the limit is not positive.
+
+        Returns:
+            tuple[list[BankAccount], int]: The page and the total number of matching
+            accounts.
+        """
+
+        self._validate_page(offset, limit)
+
+        if status is None and currency is None:
+            numbers = list(islice(self.accounts, offset, offset + limit))
+            total = len(self.accounts)
+        elif currency is None or status is None:
+            index = (
+                self.accounts_by_status.get(status, {})
+                if currency is None
+                else self.accounts_by_currency.get(currency.upper(), {})
+            )
+            numbers = list(islice(index, offset, offset + limit))
+            total = len(index)
+        else:
+            by_status = self.accounts_by_status.get(status, {})
+            by_currency = self.accounts_by_currency.get(currency.upper(), {})
+            if len(by_currency) < len(by_status):
+                by_status, by_currency = by_currency, by_status
+            matching = [number for number in by_status if number in by_currency]
+            numbers = matching[offset : offset + limit]
+            total = len(matching)
+
+        return [self.accounts[number] for number in numbers], total
+
+    @staticmethod
+    def _validate_page(offset, limit):
+        """Checks pagination arguments."""
+
+        if offset < 0:
+            raise ValueError("Offset must not be negative.")
+
+        if limit <= 0:
+            raise ValueError("Limit must be positive.")
+
+    def add_pre_commit_check(self, check):
+        """Registers a check consulted before a withdrawal or transfer is applied.
+
+        The check is called as ``check(account, operation, amount, to_account)``
+        and rejects the operation by raising an exception.
+
+        Args:
+            check (callable): The check to register.
+        """
+
+        self.pre_commit_checks.append(check)
+
+    def add_transaction_listener(self, listener):
+        """Registers a listener notified about every transaction added to the ledger.
+
+        The listener is called as ``listener(transaction, account_number)``.
+
+        Args:
+            listener (callable): The listener to register.
+        """
+
+        self.transaction_listeners.append(listener)
+
+    def snapshot_view(self):
+        """Returns a consistent, immutable view of balances and ledgers.
+
+        Writers keep running while the view is open; the state they are about to
+        overwrite is copied into the view on first touch.
+
+        Returns:
+            BankSnapshot: The view of the bank at this moment.
+        """
+
+        return BankSnapshot(self)
+
+    def preserve_for_snapshots(self, account_number):
+        """Copies an account's current state into every open snapshot before it changes.
+
+        Args:
+            account_number (str): The account about to change.
+        """
+
+        for reference in list(self.snapshots.values()):
+            snapshot = reference()
+            if snapshot is not None:
+                snapshot.preserve(account_number)
 
     def _fetch_currencies(self):
         """Fetches current exchange rates from the NBP API.
@@ -68,6 +386,8 @@ class Bank:
             dict[str, float]: A dictionary mapping currency codes to their rates.
         """
 
+        import requests
+
         url = "https://api.nbp.pl/api/exchangerates/tables/A/?format=json"
 
         response = requests.get(url)
@@ -105,20 +425,235 @@ class Bank:
             bool: True if the transaction was added successfully.
         """
 
-        self.transactions[account_number].append(transaction)
+        if self.snapshots:
+            self.preserve_for_snapshots(account_number)
+
+        if self.storage is not None:
+            self.storage.add_transaction(self, transaction, account_number)
+        else:
+            ledger = self.transactions[account_number]
+            if ledger and transaction["date"] < ledger[-1]["date"]:
+                self.unsorted_ledgers.add(account_number)
+            ledger.append(transaction)
+
+        for listener in self.transaction_listeners:
+            listener(transaction, account_number)
 
         return True
 
+    def execute_bulk(self, operations):
+        """Runs many account operations in order, collecting each outcome.
+
+        A failing operation does not stop the ones after it.
+
+        Args:
+            operations (Iterable[tuple]): Tuples of account number, BankAccount method
+                name and its positional arguments.
+
+        Raises:
+            ValueError: If any operation names an unsupported method. Nothing is run.
+
+        Returns:
+            list[tuple[bool, Any]]: For every operation, a success flag and either the
+            result or the raised exception, in input order.
+        """
+
+        operations = list(operations)
+
+        for _, method, *_ in operations:
+            if method not in BULK_OPERATIONS:
+                raise ValueError(f"Unsupported account operation: {method}")
+
+        accounts = self.accounts
+        results = []
+
+        for account_number, method, *args in operations:
+            try:
+                account = accounts.get(account_number)
+                if account is None:
+                    raise ValueError("Account not found.")
+                results.append((True, getattr(account, method)(*args)))
+            except Exception as error:
+                results.append((False, error))
+
+        return results
+
+    def open_accounts_bulk(self, rows):
+        """Opens many accounts at once, e.g. for a migration, collecting each outcome.
+
+        Each row must pass the checks of ``BankAccount`` and the
+        one-account-per-bank rule of ``User.open_bank_account``. All rows are
+        validated before any account is built. Account numbers are drawn in one
+        block, and accounts are assembled without running ``BankAccount.__init__``
+        again, then registered in the bank, its indexes and their owners in a
+        single pass. Owners who are not yet bank users are registered too.
+
+        Args:
+            rows (Iterable[tuple]): Tuples of owner (User), PIN code and optionally
+                currency (defaults to PLN) and initial balance (defaults to 0).
+
+        Returns:
+            list[tuple[bool, Any]]: For every row, a success flag and either the new
+            account number or the exception explaining the rejection, in input order.
+        """
+
+        from src.bank_account import AccountStatus, BankAccount
+        from src.user import User
+
+        rows = list(rows)
+        results = [None] * len(rows)
+        valid = []
+
+        for index, row in enumerate(rows):
+            try:
+                try:
+                    owner, pin_code, *rest = row
+                except (TypeError, ValueError):
+                    raise ValueError("Row must hold an owner and a PIN code")
+                currency = rest[0] if rest else "PLN"
+                balance = rest[1] if len(rest) > 1 else 0
+
+                try:
+                    balance = float(balance)
+                except (TypeError, ValueError):
+                    raise TypeError("Bank account balance must be a number")
+                if balance < 0:
+                    raise ValueError("Bank account balance must be a positive number")
+                if not isinstance(owner, User):
+                    raise TypeError("Bank account owner must be a User")
+                if not isinstance(currency, str):
+                    raise TypeError("Bank account currency must be a string")
+                if currency not in self.currencies:
+                    raise ValueError(
+                        "Bank account currency must be a valid bank currency code"
+                    )
+                if not isinstance(pin_code, str):
+                    raise TypeError("pin code must be a string")
+                if len(pin_code) != 6 or not pin_code.isdecimal():
+                    raise ValueError(
+                        "Pin code to your account has to be exactly 6 digits"
+                    )
+            except (TypeError, ValueError) as error:
+                results[index] = (False, error)
+            else:
+                valid.append(
+                    (index, owner, pin_code, sys.intern(currency.upper()), balance)
+                )
+
+        blocking = (AccountStatus.ACTIVE, AccountStatus.INACTIVE, AccountStatus.LOCKED)
+        owner_statuses = {}
+        accepted = []
+
+        for row in valid:
+            owner = row[1]
+            if id(owner) in owner_statuses:
+                status = owner_statuses[id(owner)]
+            else:
+                status = next(
+                    (
+                        account.status
+                        for account in owner.bank_accounts.values()
+                        if account.bank is self and account.status in blocking
+                    ),
+                    None,
+                )
+
+            if status is None:
+                accepted.append(row)
+                owner_statuses[id(owner)] = AccountStatus.ACTIVE
+            else:
+                results[row[0]] = (
+                    False,
+                    ValueError(
+                        "You have a locked account in this bank. Please unlock it first."
+                        if status == AccountStatus.LOCKED
+                        else "You already have an active or inactive account in this bank."
+                    ),
+                )
+                owner_statuses[id(owner)] = status
+
+        numbers = self._allocate_account_numbers(len(accepted))
+        created_at = datetime.now()
+        accounts = self.accounts
+        users = self.users
+        by_status = self.accounts_by_status[AccountStatus.ACTIVE]
+        by_currency = self.accounts_by_currency
+        observers = self.account_observers
+
+        for (index, owner, pin_code, currency, balance), number in zip(
+            accepted, numbers
+        ):
+            if owner.id not in users:
+                self.add_user(owner)
+
+            account = BankAccount.__new__(BankAccount)
+            account.account_number = number
+            account.owner = owner
+            account.bank = self
+            account._balance = balance
+            account._status = AccountStatus.ACTIVE
+            account._currency = currency
+            account._pin = pin_code
+            account._failed_withdraw_count = 0
+            account.created_at = created_at
+            account.last_transaction_date = None
+
+            accounts[number] = account
+            by_status[number] = None
+            by_currency[currency][number] = None
+            for observer in observers:
+                observer(account, "account_number", None, number)
+
+            owner.bank_accounts[number] = account
+            results[index] = (True, number)
+
+        return results
+
+    def _allocate_account_numbers(self, count):
+        """Draws a block of unused, distinct account numbers of this bank.
+
+        Args:
+            count (int): Number of account numbers needed.
+
+        Returns:
+            list[str]: 26-digit account numbers starting with the bank code.
+        """
+
+        numbers = {}
+        randrange = random.randrange
+
+        while len(numbers) < count:
+            for _ in range(count - len(numbers)):
+                number = f"{self.bank_code}{randrange(10**22):022d}"
+                if number not in self.accounts:
+                    numbers[number] = None
+
+        return list(numbers)
+
     def get_transactions(self, account_number):
         """Retrieves all transactions for a given account.
 
+        Only a plain in-memory ledger is returned as the live list. Tiered
+        ledgers (see ``TieredTransactions``) and storage-backed banks return a
+        new list on every call, so appending to or removing from it does not
+        change the ledger.
+
         Args:
             account_number (str): The account number.
 
         Returns:
             list[dict]: A list of transactions for the account.
         """
-        return self.transactions[account_number]
+
+        if self.storage is not None:
+            return self.storage.get_transactions(self, account_number)
+
+        ledger = self.transactions[account_number]
+
+        if isinstance(ledger, TieredLedger):
+            return list(ledger)
+
+        return ledger
 
     def get_transactions_by_date(self, date_from, date_to, account_number):
         """Retrieves transactions within a date range for a specific account.
@@ -142,8 +677,60 @@ class Bank:
         if date_from > date_to:
             raise ValueError("Start date must be before end date.")
 
+        if self.storage is not None:
+            return self.storage.get_transactions_by_date(
+                self, account_number, date_from, date_to
+            )
+
+        ledger = self.transactions[account_number]
+
+        if self._ledger_sorted(account_number, ledger):
+            if isinstance(ledger, TieredLedger):
+                return ledger.between(date_from, date_to)
+
+            start = bisect_left(ledger, date_from, key=itemgetter("date"))
+            stop = bisect_right(ledger, date_to, start, key=itemgetter("date"))
+            return ledger[start:stop]
+
         return [
             transaction
-            for transaction in self.transactions[account_number]
+            for transaction in ledger
             if date_from <= transaction["date"] <= date_to
         ]
+
+    def _ledger_sorted(self, account_number, ledger):
+        """Returns whether a ledger is in date order.
+
+        Entries appended to a list ledger directly bypass ``add_new_transaction``,
+        so every query checks the entries added since the previous one and
+        flags the ledger as unsorted once an entry is out of order. Tiered
+        ledgers track their order themselves.
+        """
+
+        if account_number in self.unsorted_ledgers:
+            return False
+
+        if isinstance(ledger, TieredLedger):
+            if not ledger.ordered:
+                self.unsorted_ledgers.add(account_number)
+            return ledger.ordered
+
+        length = len(ledger)
+        checked = self.checked_ledgers.get(account_number)
+        position = 0
+        if checked is not None and checked[0] is ledger and checked[1] <= length:
+            position = checked[1]
+
+        if position < length:
+            previous = ledger[position - 1]["date"] if position else None
+            for transaction in ledger[position:]:
+                date = transaction["date"]
+                if previous is not None and date < previous:
+                    self.unsorted_ledgers.add(account_number)
+                    self.checked_ledgers.pop(account_number, None)
+                    return False
+                previous = date
+
+        self.checked_ledgers[account_number] = (ledger, length)
+
+        return True
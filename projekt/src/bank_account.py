@@ -1,5 +1,6 @@
 import random
-from datetime import datetime
+import sys
+from datetime import datetime, timedelta
 import re
 from enum import Enum
 
@@ -14,9 +15,45 @@ class AccountStatus(Enum):
     CLOSED = "closed"
 
 
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_timestamp(value):
+    """Converts a naive datetime into integer microseconds since the epoch."""
+
+    return (value - EPOCH) // MICROSECOND
+
+
+def _from_timestamp(value):
+    """Converts integer microseconds since the epoch back into a naive datetime."""
+
+    return EPOCH + timedelta(microseconds=value)
+
+
 class BankAccount:
 
-    def __init__(self, owner, bank, pin_code, balance=0, currency="PLN"):
+    # Slots instead of a per-instance __dict__: millions of accounts are held in
+    # memory. Currency codes are interned and the opening time is kept as epoch
+    # microseconds; last_transaction_date stays a datetime because it is the same
+    # object as the date of the latest ledger entry.
+    __slots__ = (
+        "account_number",
+        "owner",
+        "bank",
+        "_balance",
+        "_status",
+        "_currency",
+        "_pin",
+        "_failed_withdraw_count",
+        "_created_at",
+        "last_transaction_date",
+        "__weakref__",
+    )
+
+    def __init__(
+        self, owner, bank, pin_code, balance=0, currency="PLN", account_number=None
+    ):
         """Initializes a new BankAccount instance.
 
         Args:
@@ -25,11 +62,13 @@ class BankAccount:
             pin_code (str): The PIN code for accessing the account.
             balance (float, optional): Initial account balance. Must be non-negative. Defaults to 0.
             currency (str, optional): Currency code (e.g., 'PLN'). Must be supported by the bank. Defaults to 'PLN'.
+            account_number (str, optional): Preassigned account number. Generated when omitted.
 
         Raises:
             TypeError: If balance is not a number, owner is not a User, bank is not a Bank,
                        or currency is not a string.
-            ValueError: If balance is negative or currency is not supported by the bank.
+            ValueError: If balance is negative, currency is not supported by the bank
+                        or the preassigned account number is already taken.
         """
         from src.user import User
 
@@ -53,17 +92,97 @@ class BankAccount:
         if currency not in bank.currencies:
             raise ValueError("Bank account currency must be a valid bank currency code")
 
-        self.balance = balance
+        if account_number is not None and account_number in bank.accounts:
+            raise ValueError("Bank account number already exists")
+
+        self._balance = balance
         self.owner = owner
         self.bank = bank
-        self.status = AccountStatus.ACTIVE
-        self.pin = self._validate_pin_code(pin_code)
+        self._status = AccountStatus.ACTIVE
+        self._pin = self._validate_pin_code(pin_code)
         self.last_transaction_date = None
-        self.created_at = datetime.now()
-        self.failedWithdrawCount = 0
-        self.currency = currency.upper()
-        self.account_number = self._generate_account_number()
-        bank.accounts[self.account_number] = self
+        self._created_at = _to_timestamp(datetime.now())
+        self._failed_withdraw_count = 0
+        self._currency = sys.intern(currency.upper())
+        self.account_number = (
+            account_number
+            if account_number is not None
+            else self._generate_account_number()
+        )
+        bank.add_account(self)
+
+    @property
+    def balance(self):
+        """float: Current balance of the account."""
+
+        return self._balance
+
+    @balance.setter
+    def balance(self, value):
+        bank = self.bank
+        if bank.snapshots or bank.account_observers:
+            bank.account_changing(self, "balance", self._balance, value)
+        self._balance = value
+
+    @property
+    def status(self):
+        """AccountStatus: Current status of the account."""
+
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        self.bank.account_changing(self, "status", self._status, value)
+        self._status = value
+
+    @property
+    def currency(self):
+        """str: Currency code of the account."""
+
+        return self._currency
+
+    @currency.setter
+    def currency(self, value):
+        self.bank.account_changing(self, "currency", self._currency, value)
+        self._currency = sys.intern(value)
+
+    @property
+    def created_at(self):
+        """datetime: When the account was opened."""
+
+        return _from_timestamp(self._created_at)
+
+    @created_at.setter
+    def created_at(self, value):
+        self._created_at = _to_timestamp(value)
+
+    @property
+    def pin(self):
+        """str: PIN code of the account."""
+
+        return self._pin
+
+    @pin.setter
+    def pin(self, value):
+        bank = self.bank
+        if bank.snapshots or bank.account_observers:
+            bank.account_changing(self, "pin", self._pin, value)
+        self._pin = value
+
+    @property
+    def failedWithdrawCount(self):
+        """int: Number of consecutive failed PIN attempts."""
+
+        return self._failed_withdraw_count
+
+    @failedWithdrawCount.setter
+    def failedWithdrawCount(self, value):
+        bank = self.bank
+        if bank.snapshots or bank.account_observers:
+            bank.account_changing(
+                self, "failedWithdrawCount", self._failed_withdraw_count, value
+            )
+        self._failed_withdraw_count = value
 
     def close(self, pin_code):
         """Closes the bank account after validating access and ensuring zero balance.
@@ -101,14 +220,18 @@ class BankAccount:
         if amount > self.balance:
             raise ValueError("Amount cannot be greater than the balance.")
 
+        for check in self.bank.pre_commit_checks:
+            check(self, "withdraw", amount, None)
+
         self.balance -= amount
 
-        self.last_transaction_date = datetime.now()
+        now = datetime.now()
+        self.last_transaction_date = now
 
         transaction = {
             "type": "withdraw",
             "amount": amount,
-            "date": self.last_transaction_date,
+            "date": now,
         }
         return self.bank.add_new_transaction(transaction, self.account_number)
 
@@ -139,12 +262,13 @@ class BankAccount:
 
         self.balance += amount
 
-        self.last_transaction_date = datetime.now()
+        now = datetime.now()
+        self.last_transaction_date = now
 
         transaction = {
             "type": "deposit",
             "amount": amount,
-            "date": self.last_transaction_date,
+            "date": now,
         }
 
         return self.bank.add_new_transaction(transaction, self.account_number)
@@ -188,6 +312,9 @@ class BankAccount:
         if other_account.status != AccountStatus.ACTIVE:
             raise ValueError("Other account is not active.")
 
+        for check in self.bank.pre_commit_checks:
+            check(self, "transfer", amount, other_account)
+
         if other_account.currency != self.currency:
             source_rate = bank.currencies[self.currency]
             target_rate = bank.currencies[other_account.currency]
@@ -265,7 +392,13 @@ class BankAccount:
             bool: True if the account was successfully unlocked.
         """
 
+        limiter = self.bank.pin_attempt_limiter
+        if limiter is not None:
+            limiter.check(self.account_number)
+
         if pin_code != self.pin:
+            if limiter is not None:
+                limiter.record_failure(self.account_number)
             raise PermissionError("Incorrect PIN.")
 
         if self.status not in [AccountStatus.INACTIVE, AccountStatus.LOCKED]:
@@ -417,7 +550,8 @@ class BankAccount:
         """Validates access to the account using the provided PIN code.
 
         If the PIN is incorrect, the failed attempt counter increases. After 3 failed attempts,
-        the account is locked. Access is also denied if the account is not active.
+        the account is locked. Access is also denied if the account is not active or if the
+        bank's PIN attempt limiter throttles the client or the account.
 
         Args:
             pin_code (str): The PIN code to authenticate access.
@@ -434,9 +568,15 @@ class BankAccount:
         if self.status != AccountStatus.ACTIVE:
             raise ValueError("Account is not active.")
 
+        limiter = self.bank.pin_attempt_limiter
+        if limiter is not None:
+            limiter.check(self.account_number)
+
         if pin_code != self.pin:
             self.failedWithdrawCount += 1
+            if limiter is not None:
+                limiter.record_failure(self.account_number)
             raise PermissionError("Incorrect PIN.")
 
-        if pin_code == self.pin:
+        if self.failedWithdrawCount:
             self.failedWithdrawCount = 0
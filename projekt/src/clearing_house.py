@@ -0,0 +1,233 @@
+from array import array
+from datetime import datetime
+
+from src.bank_account import AccountStatus
+
+
+class ClearingHouse:
+    """Class queueing transfers between banks and settling them in netted cycles."""
+
+    def __init__(self, banks=()):
+        """Initializes a new ClearingHouse instance.
+
+        Args:
+            banks (Iterable[Bank], optional): Banks taking part in the clearing.
+        """
+
+        self.banks = []
+        self.bank_index = {}
+        self.positions = {}
+        self.cycle = 0
+        self._reset_queue()
+
+        for bank in banks:
+            self.add_bank(bank)
+
+    def add_bank(self, bank):
+        """Registers a bank as a clearing participant.
+
+        Args:
+            bank (Bank): The bank to register.
+
+        Raises:
+            ValueError: If a bank with the same code is already registered.
+        """
+
+        if bank.bank_code in self.bank_index:
+            raise ValueError(f"Bank {bank.bank_code} already registered.")
+
+        self.bank_index[bank.bank_code] = len(self.banks)
+        self.banks.append(bank)
+        self.positions[bank.bank_code] = 0.0
+
+    def pending(self):
+        """Returns the number of transfers waiting for settlement.
+
+        Returns:
+            int: Number of queued transfers.
+        """
+
+        return len(self.amounts)
+
+    def submit(self, account, to_bank_code, to_account_number, amount, pin_code):
+        """Debits the source account and queues a transfer to another bank.
+
+        Args:
+            account (BankAccount): The source account.
+            to_bank_code (str): Code of the recipient's bank.
+            to_account_number (str): The recipient's account number.
+            amount (float): Amount in the source account's currency.
+            pin_code (str): The PIN code used to authorize the transfer.
+
+        Raises:
+            TypeError: If the amount is not a number.
+            ValueError: If a bank is not registered, the target is the source bank,
+                        or the amount is not positive or exceeds the balance.
+
+        Returns:
+            bool: True if the transfer was queued.
+        """
+
+        source_bank = account.bank
+
+        if source_bank.bank_code not in self.bank_index:
+            raise ValueError(f"Bank {source_bank.bank_code} not found.")
+
+        if to_bank_code not in self.bank_index:
+            raise ValueError(f"Bank {to_bank_code} not found.")
+
+        if to_bank_code == source_bank.bank_code:
+            raise ValueError("Transfers within one bank do not need clearing.")
+
+        account._validate_access(pin_code)
+
+        try:
+            amount = float(amount)
+        except ValueError:
+            raise TypeError("Bank account amount must be a number")
+
+        if amount <= 0:
+            raise ValueError("Amount cannot be negative or zero.")
+
+        if amount > account.balance:
+            raise ValueError("Bank account amount cannot be greater than the balance.")
+
+        for check in source_bank.pre_commit_checks:
+            check(account, "interbank_transfer", amount, None)
+
+        account.balance -= amount
+        account.last_transaction_date = datetime.now()
+
+        self.source_banks.append(self.bank_index[source_bank.bank_code])
+        self.target_banks.append(self.bank_index[to_bank_code])
+        self.source_accounts.append(account.account_number)
+        self.target_accounts.append(to_account_number)
+        self.amounts.append(amount * source_bank.currencies[account.currency])
+        self.debits.append(amount)
+        self.debit_currencies.append(account.currency)
+
+        transaction = {
+            "type": "interbank_transfer",
+            "to": to_account_number,
+            "to_bank": to_bank_code,
+            "amount": amount,
+            "date": account.last_transaction_date,
+        }
+
+        return source_bank.add_new_transaction(transaction, account.account_number)
+
+    def settle(self):
+        """Settles every queued transfer in a single pass.
+
+        Recipients are credited in their own currency, transfers to missing or
+        inactive accounts are refunded, and the settled amounts are netted per
+        bank pair and applied to the banks' clearing positions.
+
+        Returns:
+            dict: Settlement report with the cycle number, settled and refunded
+                  counts, net amounts per bank pair (in PLN, positive when the
+                  first bank owes the second) and the banks' positions.
+        """
+
+        banks = self.banks
+        net = {}
+        settled = 0
+        refunded = 0
+        now = datetime.now()
+
+        for position in range(len(self.amounts)):
+            source = self.source_banks[position]
+            target = self.target_banks[position]
+            amount_pln = self.amounts[position]
+            target_bank = banks[target]
+            other_account = target_bank.accounts.get(self.target_accounts[position])
+
+            if other_account is None or other_account.status != AccountStatus.ACTIVE:
+                self._refund(
+                    banks[source],
+                    self.source_accounts[position],
+                    self.debits[position],
+                    self.debit_currencies[position],
+                    now,
+                )
+                refunded += 1
+                continue
+
+            credited = round(
+                amount_pln / target_bank.currencies[other_account.currency], 2
+            )
+            other_account.balance += credited
+            other_account.last_transaction_date = now
+
+            transaction = {
+                "type": "incoming_interbank_transfer",
+                "from": self.source_accounts[position],
+                "from_bank": banks[source].bank_code,
+                "amount": credited,
+                "date": now,
+            }
+            target_bank.add_new_transaction(transaction, other_account.account_number)
+
+            if source < target:
+                pair, signed = (source, target), amount_pln
+            else:
+                pair, signed = (target, source), -amount_pln
+
+            net[pair] = net.get(pair, 0.0) + signed
+            settled += 1
+
+        net_positions = {}
+        for (first, second), amount in net.items():
+            first_code, second_code = banks[first].bank_code, banks[second].bank_code
+            amount = round(amount, 2)
+            self.positions[first_code] = round(self.positions[first_code] - amount, 2)
+            self.positions[second_code] = round(self.positions[second_code] + amount, 2)
+            net_positions[(first_code, second_code)] = amount
+
+        self.cycle += 1
+        self._reset_queue()
+
+        return {
+            "cycle": self.cycle,
+            "settled": settled,
+            "refunded": refunded,
+            "net_positions": net_positions,
+            "positions": dict(self.positions),
+        }
+
+    def _refund(self, bank, account_number, debit, currency, now):
+        """Returns a failed transfer to its source account.
+
+        The refund is exactly the debited amount. Only if the account changed its
+        currency since submission is it converted at the current rates, as the
+        balance was when the currency changed.
+        """
+
+        account = bank.accounts[account_number]
+        amount = debit
+
+        if account.currency != currency:
+            amount = round(
+                debit * bank.currencies[currency] / bank.currencies[account.currency],
+                2,
+            )
+
+        account.balance += amount
+
+        transaction = {
+            "type": "interbank_refund",
+            "amount": amount,
+            "date": now,
+        }
+        bank.add_new_transaction(transaction, account_number)
+
+    def _reset_queue(self):
+        """Starts an empty queue for the next settlement cycle."""
+
+        self.source_banks = array("H")
+        self.target_banks = array("H")
+        self.source_accounts = []
+        self.target_accounts = []
+        self.amounts = array("d")
+        self.debits = array("d")
+        self.debit_currencies = []
@@ -0,0 +1,558 @@
+import functools
+import pickle
+import sys
+import types
+from collections import namedtuple
+from datetime import datetime, timedelta
+from enum import Enum
+
+import src.bank_account
+from src.auth import Auth
+from src.bank import Bank
+from src.bank_account import BankAccount
+from src.user import User
+
+DEFAULT_TARGETS = (User, BankAccount, Bank, Auth)
+
+Ref = namedtuple("Ref", "kind index")
+Ref.__doc__ = "Symbolic reference to the ``index``-th recorded object of a class."
+
+_SCALARS = frozenset((int, float, bool, type(None), datetime))
+
+_recording_targets = set()
+
+
+class SteppingClock:
+    """Deterministic clock advancing by a fixed step on every reading."""
+
+    def __init__(self, start, step=timedelta(microseconds=1)):
+        self.now = start
+        self.step = step
+
+    def __call__(self):
+        now = self.now
+        self.now = now + self.step
+        return now
+
+
+def _clock_datetime(clock):
+    """Returns a datetime class whose ``now()`` reads the given clock."""
+
+    class ClockDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock()
+
+    return ClockDatetime
+
+
+class ObjectRegistry:
+    """Assigns symbolic references to the objects seen during a recording.
+
+    Objects are numbered per class name in the order they are first seen, so
+    the same sequence of operations yields the same references in a replay,
+    even though account numbers and object identities differ.
+    """
+
+    def __init__(self, targets):
+        self.targets = tuple(targets)
+        self.refs = {}
+        self.objects = {}
+        self.numbers = {}
+        self.entries = {}
+
+    def register(self, obj):
+        """Returns the reference of an object, registering it if needed."""
+
+        ref = self.refs.get(id(obj))
+
+        if ref is None:
+            kind = type(obj).__name__
+            instances = self.objects.setdefault(kind, [])
+            ref = self.refs[id(obj)] = Ref(kind, len(instances))
+            instances.append(obj)
+
+            number = getattr(obj, "account_number", None)
+            if number is not None:
+                self.numbers[number] = Ref("account_number", ref.index)
+
+        return ref
+
+    def resolve(self, ref):
+        """Returns the object behind a reference.
+
+        Raises:
+            LookupError: If the object was never registered.
+        """
+
+        try:
+            return self.objects[ref.kind][ref.index]
+        except (KeyError, IndexError):
+            raise LookupError(f"No recorded object {ref.kind}#{ref.index}.")
+
+    def encode(self, value, normalize=False):
+        """Converts a value into its symbolic, comparable form.
+
+        Args:
+            value: The value to encode.
+            normalize (bool, optional): Replace enum members by their qualified
+                names and unknown objects by their type names, as done for
+                outcomes, so alternative implementations can be compared.
+
+        Returns:
+            The encoded value.
+        """
+
+        kind = type(value)
+
+        if kind is str:
+            return self.numbers.get(value, value)
+
+        if kind in _SCALARS:
+            return value
+
+        # Registered objects are kept alive, so their ids are never reused.
+        ref = self.refs.get(id(value))
+        if ref is not None:
+            return ref
+
+        if kind is list:
+            if normalize:
+                return [self._encode_entry(item) for item in value]
+            return [self.encode(item) for item in value]
+
+        if kind is tuple:
+            return tuple([self.encode(item, normalize) for item in value])
+
+        if kind is dict:
+            return {
+                self.encode(key, normalize): self.encode(item, normalize)
+                for key, item in value.items()
+            }
+
+        if isinstance(value, self.targets):
+            return self.register(value)
+
+        if isinstance(value, Enum):
+            return f"{kind.__name__}.{value.name}" if normalize else value
+
+        if isinstance(value, (set, frozenset)):
+            return sorted((self.encode(item, normalize) for item in value), key=repr)
+
+        if normalize:
+            return f"<{kind.__name__}>"
+
+        return value
+
+    def _encode_entry(self, item):
+        """Encodes an item of a returned list, once per ledger entry.
+
+        Dicts in returned lists are ledger entries, which are never modified
+        after they were added, so their encoding is cached by identity. The
+        cache holds the entry itself, so its id cannot be reused.
+        """
+
+        if type(item) is not dict:
+            return self.encode(item, True)
+
+        cached = self.entries.get(id(item))
+
+        if cached is None:
+            cached = self.entries[id(item)] = (item, self.encode(item, True))
+
+        return cached[1]
+
+    def decode(self, value):
+        """Resolves the references in an encoded argument."""
+
+        kind = type(value)
+
+        if kind is Ref:
+            if value.kind == "account_number":
+                return self.objects["BankAccount"][value.index].account_number
+            return self.resolve(value)
+
+        if kind is list:
+            return [self.decode(item) for item in value]
+
+        if kind is tuple:
+            return tuple([self.decode(item) for item in value])
+
+        if kind is dict:
+            return {self.decode(key): self.decode(item) for key, item in value.items()}
+
+        return value
+
+
+class Recording:
+    """Recorded operations with their outcomes, and the final state.
+
+    Every entry is ``(target, method, args, kwargs, outcome)``. The target is a
+    Ref, or a class name for constructor calls. The outcome is
+    ``("ok", result)`` or ``("error", exception type name, message)``.
+    """
+
+    def __init__(self, entries, state, start, capture_results=True):
+        self.entries = entries
+        self.state = state
+        self.start = start
+        self.capture_results = capture_results
+
+    def __len__(self):
+        return len(self.entries)
+
+    def save(self, path):
+        """Writes the recording to a file.
+
+        Args:
+            path (str): Destination file path.
+        """
+
+        with open(path, "wb") as stream:
+            pickle.dump(
+                (self.entries, self.state, self.start, self.capture_results),
+                stream,
+                pickle.HIGHEST_PROTOCOL,
+            )
+
+    @classmethod
+    def load(cls, path):
+        """Reads a recording written by ``save``.
+
+        Args:
+            path (str): Source file path.
+
+        Returns:
+            Recording: The loaded recording.
+        """
+
+        with open(path, "rb") as stream:
+            return cls(*pickle.load(stream))
+
+
+class Recorder:
+    """Records the public operations on users, accounts, banks and sessions.
+
+    Enabling replaces every public method and the constructor of the target
+    classes with a recording wrapper; disabling puts the originals back, like
+    ``Instrumentation``. Only top-level calls are recorded; calls made from
+    inside a recorded call, e.g. ``BankAccount.deposit`` from ``User.deposit``,
+    are part of its outcome. Recording is not thread-safe.
+
+    While enabled, ``datetime.now()`` in ``src.bank_account``, which stamps the
+    ledger, reads a SteppingClock instead of the wall clock, so a replay that
+    performs the same operations produces the same dates.
+    """
+
+    def __init__(self, targets=DEFAULT_TARGETS, capture_results=True, start=None):
+        """Initializes a new Recorder.
+
+        Args:
+            targets (Iterable[type], optional): Classes to record. Defaults to
+                User, BankAccount, Bank and Auth.
+            capture_results (bool, optional): Record return values. When False,
+                only success or the raised exception is recorded, which keeps
+                recording cheap for operations returning whole ledgers.
+                Defaults to True.
+            start (datetime, optional): First reading of the ledger clock.
+                Defaults to the current time.
+        """
+
+        self.targets = tuple(targets)
+        self.capture_results = capture_results
+        self.start = datetime.now() if start is None else start
+        self.clock = SteppingClock(self.start)
+        self.wall_datetime = None
+        self.registry = ObjectRegistry(self.targets)
+        self.entries = []
+        self.originals = []
+        self.enabled = False
+        self.depth = 0
+        self.arguments = True
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disable()
+
+    def enable(self):
+        """Installs the recording wrappers.
+
+        Raises:
+            ValueError: If one of the target classes is already being recorded.
+        """
+
+        if any(target in _recording_targets for target in self.targets):
+            raise ValueError("Recording is already enabled.")
+
+        for target in self.targets:
+            _recording_targets.add(target)
+
+            methods = {}
+            for base in reversed(target.__mro__[:-1]):
+                methods.update(vars(base))
+
+            for name, function in methods.items():
+                if not isinstance(function, types.FunctionType):
+                    continue
+                if name.startswith("_") and name != "__init__":
+                    continue
+
+                self.originals.append((target, name, vars(target).get(name)))
+                setattr(target, name, self._wrap(target, name, function))
+
+        self.wall_datetime = src.bank_account.datetime
+        src.bank_account.datetime = _clock_datetime(self.clock)
+        self.enabled = True
+
+    def disable(self):
+        """Removes the recording wrappers. Recorded entries are kept."""
+
+        if not self.enabled:
+            return
+
+        for target, name, function in reversed(self.originals):
+            if function is None:
+                delattr(target, name)
+            else:
+                setattr(target, name, function)
+
+        for target in self.targets:
+            _recording_targets.discard(target)
+
+        src.bank_account.datetime = self.wall_datetime
+        self.originals = []
+        self.enabled = False
+
+    def nested(self, function, *args):
+        """Calls a function without recording the operations it performs."""
+
+        self.depth += 1
+        try:
+            return function(*args)
+        finally:
+            self.depth -= 1
+
+    def _wrap(self, target, name, function):
+        """Returns a wrapper recording top-level calls of a method."""
+
+        recorder = self
+        registry = self.registry
+        encode = registry.encode
+        entries = self.entries
+        constructor = name == "__init__"
+        class_name = target.__name__
+
+        @functools.wraps(function)
+        def recorded(obj, *args, **kwargs):
+            if recorder.depth:
+                result = function(obj, *args, **kwargs)
+                if constructor:
+                    registry.register(obj)
+                return result
+
+            subject = class_name if constructor else registry.register(obj)
+            if recorder.arguments:
+                entry = (
+                    subject,
+                    name,
+                    encode(args),
+                    encode(kwargs) if kwargs else None,
+                )
+            else:
+                entry = (subject, name, None, None)
+
+            recorder.depth = 1
+            try:
+                result = function(obj, *args, **kwargs)
+            except Exception as error:
+                recorder.depth = 0
+                entries.append(entry + (("error", type(error).__name__, str(error)),))
+                raise
+            recorder.depth = 0
+
+            if constructor:
+                outcome = ("ok", registry.register(obj))
+            elif recorder.capture_results:
+                outcome = ("ok", encode(result, True))
+            else:
+                outcome = ("ok",)
+
+            entries.append(entry + (outcome,))
+            return result
+
+        return recorded
+
+    def state(self):
+        """Returns the comparable state of every recorded account.
+
+        Returns:
+            dict[Ref, tuple]: Balance, status, currency and ledger per account.
+        """
+
+        encode = self.registry.encode
+        state = {}
+
+        for account in self.registry.objects.get("BankAccount", []):
+            ledger = self.nested(account.bank.get_transactions, account.account_number)
+            state[self.registry.register(account)] = (
+                account.balance,
+                encode(account.status, True),
+                account.currency,
+                encode(list(ledger), True),
+            )
+
+        return state
+
+    def recording(self):
+        """Returns the recorded entries together with the current state.
+
+        Returns:
+            Recording: The recording.
+        """
+
+        return Recording(
+            list(self.entries), self.state(), self.start, self.capture_results
+        )
+
+
+def _substitute(targets):
+    """Points the library's references to default classes at their replacements.
+
+    Args:
+        targets (Iterable[type]): Replay targets; those named like one of the
+            DEFAULT_TARGETS but different from it replace it.
+
+    Returns:
+        list[tuple]: ``(module, name, original)`` for every replaced reference.
+    """
+
+    defaults = {target.__name__: target for target in DEFAULT_TARGETS}
+    replaced = []
+
+    for target in targets:
+        default = defaults.get(target.__name__)
+        if default is None or default is target:
+            continue
+
+        for module_name, module in list(sys.modules.items()):
+            if (
+                module_name.startswith("src.")
+                and vars(module).get(target.__name__) is default
+            ):
+                replaced.append((module, target.__name__, default))
+                setattr(module, target.__name__, target)
+
+    return replaced
+
+
+def replay(recording, targets=None, setup=None, max_divergences=100):
+    """Replays a recording and diffs outcomes and the final state.
+
+    Args:
+        recording (Recording): The recording to replay.
+        targets (Iterable[type], optional): Alternative implementations of the
+            recorded classes, matched by class name. While replaying, modules of
+            the package refer to them instead of the classes they replace.
+            Defaults to DEFAULT_TARGETS.
+        setup (callable, optional): Called with every bank created during the
+            replay, e.g. to attach an alternative ledger or locking configuration.
+            Operations it performs are not compared.
+        max_divergences (int, optional): Divergences kept in the report.
+            Defaults to 100.
+
+    Raises:
+        ValueError: If the recording uses a class missing from the targets.
+
+    Returns:
+        dict: ``operations`` replayed, operation ``divergences`` as dicts with
+            ``index``, ``target``, ``method``, ``expected`` and ``actual``
+            outcomes, and ``state_divergences`` as dicts with ``account``,
+            ``expected`` and ``actual`` state.
+    """
+
+    targets = tuple(DEFAULT_TARGETS if targets is None else targets)
+    classes = {target.__name__: target for target in targets}
+    recorder = Recorder(targets, recording.capture_results, recording.start)
+    recorder.arguments = False
+    registry = recorder.registry
+    divergences = []
+    total = 0
+
+    used = {entry[0] for entry in recording.entries if type(entry[0]) is str}
+    missing = used - set(classes)
+    if missing:
+        raise ValueError(f"Missing replay targets: {', '.join(sorted(missing))}.")
+
+    bank_class = classes.get("Bank")
+    substituted = _substitute(targets)
+
+    try:
+        recorder.enable()
+
+        for index, (subject, method, args, kwargs, expected) in enumerate(
+            recording.entries
+        ):
+            count = len(recorder.entries)
+
+            try:
+                call_args = registry.decode(args)
+                call_kwargs = registry.decode(kwargs) if kwargs else {}
+                if type(subject) is str:
+                    call = classes[subject]
+                else:
+                    call = getattr(registry.resolve(subject), method)
+            except (LookupError, AttributeError) as error:
+                actual = ("unresolved", str(error))
+            else:
+                try:
+                    result = call(*call_args, **call_kwargs)
+                except Exception:
+                    pass
+                else:
+                    if setup is not None and type(result) is bank_class:
+                        recorder.nested(setup, result)
+                if len(recorder.entries) > count:
+                    actual = recorder.entries[count][-1]
+                else:
+                    actual = ("unrecorded",)
+
+            del recorder.entries[count:]
+
+            if actual != expected:
+                total += 1
+                if len(divergences) < max_divergences:
+                    divergences.append(
+                        {
+                            "index": index,
+                            "target": subject,
+                            "method": method,
+                            "expected": expected,
+                            "actual": actual,
+                        }
+                    )
+    finally:
+        recorder.disable()
+        for module, name, original in substituted:
+            setattr(module, name, original)
+
+    state = recorder.state()
+    state_divergences = [
+        {"account": ref, "expected": values, "actual": state.get(ref)}
+        for ref, values in recording.state.items()
+        if state.get(ref) != values
+    ]
+    state_divergences += [
+        {"account": ref, "expected": None, "actual": values}
+        for ref, values in state.items()
+        if ref not in recording.state
+    ]
+
+    return {
+        "operations": len(recording.entries),
+        "divergent_operations": total,
+        "divergences": divergences,
+        "state_divergences": state_divergences[:max_divergences],
+    }
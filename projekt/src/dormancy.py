@@ -0,0 +1,136 @@
+import heapq
+from datetime import datetime, timedelta
+
+from src.bank_account import AccountStatus
+
+
+class DormancySweeper:
+    """Marks accounts without recent activity as INACTIVE.
+
+    Every tracked account has exactly one entry in a min-heap keyed by the time
+    of its last activity as of the moment it was pushed. New activity only
+    updates ``last_activity``, so it costs O(1). A sweep pops entries older than
+    the threshold. If the account has been active since the entry was pushed,
+    the entry goes back on the heap with the newer time. Otherwise the account is
+    dormant. A sweep therefore touches only the accounts that are flipped plus
+    those that were active since their entry was pushed.
+
+    Activity is every ledger entry of the account and every reactivation, e.g.
+    through ``unlock_account``. Accounts that have never transacted count from
+    their opening date.
+    """
+
+    def __init__(self, bank, threshold=timedelta(days=365), clock=datetime.now):
+        """Initializes a new DormancySweeper, tracks existing accounts and attaches it.
+
+        Args:
+            bank (Bank): The bank whose accounts are swept.
+            threshold (timedelta, optional): Inactivity after which an account is
+                dormant. Defaults to 365 days.
+            clock (callable, optional): Returns the current datetime.
+                Defaults to datetime.now.
+
+        Raises:
+            TypeError: If the threshold is not a timedelta.
+            ValueError: If the threshold is not positive.
+        """
+
+        if not isinstance(threshold, timedelta):
+            raise TypeError("Dormancy threshold must be a timedelta.")
+
+        if threshold <= timedelta(0):
+            raise ValueError("Dormancy threshold must be positive.")
+
+        self.bank = bank
+        self.threshold = threshold
+        self.clock = clock
+        self.heap = []
+        self.last_activity = {}
+
+        for account in bank.accounts.values():
+            if account.status == AccountStatus.ACTIVE:
+                self.touch(
+                    account.account_number,
+                    account.last_transaction_date or account.created_at,
+                )
+
+        bank.add_transaction_listener(self.record)
+        bank.add_account_observer(self.observe)
+
+    def __len__(self):
+        return len(self.last_activity)
+
+    def touch(self, account_number, when):
+        """Records activity of an account.
+
+        Args:
+            account_number (str): The account number.
+            when (datetime): Time of the activity.
+        """
+
+        last = self.last_activity.get(account_number)
+
+        if last is None:
+            self.last_activity[account_number] = when
+            heapq.heappush(self.heap, (when, account_number))
+        elif when > last:
+            self.last_activity[account_number] = when
+
+    def record(self, transaction, account_number):
+        """Transaction listener counting each ledger entry as activity.
+
+        Entries filed under accounts the bank does not hold, e.g. the source leg
+        of a transfer made through another bank, are ignored.
+        """
+
+        if account_number not in self.bank.accounts:
+            return
+
+        self.touch(account_number, transaction["date"])
+
+    def observe(self, account, field, old_value, new_value):
+        """Account observer tracking opened and reactivated accounts."""
+
+        if field == "account_number":
+            self.touch(new_value, account.created_at)
+        elif field == "status" and new_value == AccountStatus.ACTIVE:
+            self.touch(account.account_number, self.clock())
+
+    def sweep(self, now=None):
+        """Marks every account inactive since before ``now - threshold`` as INACTIVE.
+
+        Accounts that are no longer ACTIVE are dropped from tracking instead, and
+        come back with their next activity.
+
+        Args:
+            now (datetime, optional): Time of the sweep. Defaults to the clock.
+
+        Returns:
+            list[str]: Numbers of the accounts marked INACTIVE.
+        """
+
+        cutoff = (self.clock() if now is None else now) - self.threshold
+        heap = self.heap
+        last_activity = self.last_activity
+        dormant = []
+
+        while heap and heap[0][0] < cutoff:
+            _, account_number = heapq.heappop(heap)
+            last = last_activity[account_number]
+
+            if last >= cutoff:
+                heapq.heappush(heap, (last, account_number))
+            else:
+                del last_activity[account_number]
+                dormant.append(account_number)
+
+        flipped = []
+        accounts = self.bank.accounts
+
+        for account_number in dormant:
+            account = accounts.get(account_number)
+            if account is not None and account.status == AccountStatus.ACTIVE:
+                account.status = AccountStatus.INACTIVE
+                flipped.append(account_number)
+
+        return flipped
@@ -0,0 +1,324 @@
+import time
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+from datetime import datetime
+
+AccountEvent = namedtuple(
+    "AccountEvent", ["sequence", "timestamp", "account_number", "field", "value"]
+)
+AccountEvent.__doc__ = """Immutable record of one change to an account.
+
+For ``opened`` events the value is the full initial state tuple
+``(balance, status, currency, pin, failedWithdrawCount)``.
+"""
+
+STATE_FIELDS = ("balance", "status", "currency", "pin", "failedWithdrawCount")
+FIELDS = ("opened",) + STATE_FIELDS
+_FIELD_CODES = {field: code for code, field in enumerate(FIELDS)}
+
+
+class EventStore:
+    """Append-only log of account events with replay to any point in time.
+
+    Events are kept in parallel columns (timestamps, account numbers, field codes,
+    values) instead of one object per event. Every ``snapshot_interval`` events the
+    current state of all accounts is copied, so a replay starts from the nearest
+    snapshot and applies only the event tail after it. Each account also keeps the
+    positions of its own events, so a single account replays without scanning the
+    rest of the log.
+    """
+
+    def __init__(self, bank=None, snapshot_interval=100000, clock=time.time):
+        """Initializes a new EventStore.
+
+        Args:
+            bank (Bank, optional): Bank to record. Existing accounts are recorded as
+                opened with their current state. Defaults to None.
+            snapshot_interval (int, optional): Number of events between state
+                snapshots. Defaults to 100000.
+            clock (callable, optional): Returns the current time in seconds.
+                Defaults to time.time.
+
+        Raises:
+            ValueError: If the snapshot interval is not positive.
+        """
+
+        if snapshot_interval <= 0:
+            raise ValueError("Snapshot interval must be positive.")
+
+        self.snapshot_interval = snapshot_interval
+        self.clock = clock
+        self.timestamps = array("d")
+        self.account_numbers = []
+        self.fields = array("B")
+        self.values = []
+        self.positions = {}
+        self.current = {}
+        self.snapshot_sequences = [0]
+        self.snapshots = [{}]
+
+        if bank is not None:
+            self.attach(bank)
+
+    def __len__(self):
+        return len(self.values)
+
+    def attach(self, bank):
+        """Starts recording changes of a bank's accounts.
+
+        Args:
+            bank (Bank): The bank to record.
+        """
+
+        for account in bank.accounts.values():
+            self.record_opened(account)
+
+        bank.add_account_observer(self.observe)
+
+    def observe(self, account, field, old_value, new_value):
+        """Account observer turning a bank notification into an event.
+
+        Args:
+            account (BankAccount): The changing account.
+            field (str): Name of the changing attribute.
+            old_value (Any): Current value.
+            new_value (Any): Value about to be set.
+        """
+
+        if field == "account_number":
+            self.record_opened(account)
+        else:
+            self.append(account.account_number, field, new_value)
+
+    def record_opened(self, account):
+        """Records the opening of an account with its current state.
+
+        Args:
+            account (BankAccount): The opened account.
+        """
+
+        self.append(
+            account.account_number,
+            "opened",
+            (
+                account.balance,
+                account.status,
+                account.currency,
+                account.pin,
+                account.failedWithdrawCount,
+            ),
+        )
+
+    def append(self, account_number, field, value, timestamp=None):
+        """Appends an event to the log.
+
+        Args:
+            account_number (str): The account the event belongs to.
+            field (str): ``opened`` or one of the account state fields.
+            value (Any): The new value, or the initial state tuple for ``opened``.
+            timestamp (float, optional): Event time in seconds. Defaults to the
+                store's clock.
+
+        Raises:
+            ValueError: If the field is unknown or the account was not opened.
+
+        Returns:
+            int: Sequence number of the event.
+        """
+
+        code = _FIELD_CODES.get(field)
+        if code is None:
+            raise ValueError("Unknown account field.")
+
+        state = self.current.get(account_number)
+        if code == 0:
+            state = self.current[account_number] = list(value)
+        elif state is None:
+            raise ValueError("Account not found.")
+        else:
+            state[code - 1] = value
+
+        sequence = len(self.values)
+        positions = self.positions.get(account_number)
+        if positions is None:
+            positions = self.positions[account_number] = array("q")
+        positions.append(sequence)
+
+        self.timestamps.append(self.clock() if timestamp is None else timestamp)
+        self.account_numbers.append(account_number)
+        self.fields.append(code)
+        self.values.append(value)
+
+        if (sequence + 1) % self.snapshot_interval == 0:
+            self.snapshot_sequences.append(sequence + 1)
+            self.snapshots.append(
+                {number: tuple(state) for number, state in self.current.items()}
+            )
+
+        return sequence
+
+    def events(self, start=0, stop=None):
+        """Iterates over recorded events.
+
+        Args:
+            start (int, optional): First sequence number. Defaults to 0.
+            stop (int, optional): Sequence number to stop before. Defaults to the
+                end of the log.
+
+        Yields:
+            AccountEvent: The events in order.
+        """
+
+        stop = len(self.values) if stop is None else min(stop, len(self.values))
+
+        for sequence in range(start, stop):
+            yield AccountEvent(
+                sequence,
+                self.timestamps[sequence],
+                self.account_numbers[sequence],
+                FIELDS[self.fields[sequence]],
+                self.values[sequence],
+            )
+
+    def account_events(self, account_number):
+        """Returns all events of one account.
+
+        Args:
+            account_number (str): The account number.
+
+        Returns:
+            list[AccountEvent]: The account's events in order.
+        """
+
+        return [
+            next(self.events(sequence, sequence + 1))
+            for sequence in self.positions.get(account_number, ())
+        ]
+
+    def replay_account(self, account_number, until=None):
+        """Rebuilds the state of one account.
+
+        Args:
+            account_number (str): The account number.
+            until (int | datetime, optional): Number of events to apply, or the
+                moment to rebuild (events at that moment included). Defaults to
+                the end of the log.
+
+        Returns:
+            dict | None: The account's state, or None if it was not open yet.
+        """
+
+        stop = self._stop(until)
+        positions = self.positions.get(account_number, ())
+        end = bisect_right(positions, stop - 1)
+        fields = self.fields
+        values = self.values
+        state = None
+
+        # Only the last opening matters, so replay from there.
+        for index in range(end - 1, -1, -1):
+            if fields[positions[index]] == 0:
+                state = list(values[positions[index]])
+                for sequence in positions[index + 1 : end]:
+                    state[fields[sequence] - 1] = values[sequence]
+                break
+
+        return None if state is None else dict(zip(STATE_FIELDS, state))
+
+    def replay_bank(self, until=None):
+        """Rebuilds the state of every account from the nearest snapshot.
+
+        Args:
+            until (int | datetime, optional): Number of events to apply, or the
+                moment to rebuild (events at that moment included). Defaults to
+                the end of the log.
+
+        Returns:
+            dict[str, dict]: State of each account opened by then, by account number.
+        """
+
+        stop = self._stop(until)
+        index = bisect_right(self.snapshot_sequences, stop) - 1
+        states = {
+            number: list(state) for number, state in self.snapshots[index].items()
+        }
+
+        account_numbers = self.account_numbers
+        fields = self.fields
+        values = self.values
+
+        for sequence in range(self.snapshot_sequences[index], stop):
+            code = fields[sequence]
+            if code:
+                states[account_numbers[sequence]][code - 1] = values[sequence]
+            else:
+                states[account_numbers[sequence]] = list(values[sequence])
+
+        return {
+            number: dict(zip(STATE_FIELDS, state)) for number, state in states.items()
+        }
+
+    def restore(self, bank, until=None):
+        """Resets the bank's accounts to a replayed state without emitting events.
+
+        Accounts opened after the chosen point are left untouched.
+
+        Args:
+            bank (Bank): The bank to restore.
+            until (int | datetime, optional): Point to restore to. Defaults to the
+                end of the log.
+
+        Returns:
+            int: Number of restored accounts.
+        """
+
+        restored = 0
+
+        for number, state in self.replay_bank(until).items():
+            account = bank.accounts.get(number)
+            if account is None:
+                continue
+
+            bank.index_account(
+                number,
+                state["status"],
+                state["currency"],
+                previous=(account.status, account.currency),
+            )
+            account._balance = state["balance"]
+            account._status = state["status"]
+            account._currency = state["currency"]
+            account._pin = state["pin"]
+            account._failed_withdraw_count = state["failedWithdrawCount"]
+            restored += 1
+
+        return restored
+
+    def _stop(self, until):
+        """Converts a replay target into the number of events to apply.
+
+        Args:
+            until (int | datetime | None): The replay target.
+
+        Raises:
+            TypeError: If the target is neither an int nor a datetime.
+            ValueError: If the sequence number is negative.
+
+        Returns:
+            int: Number of events to apply.
+        """
+
+        if until is None:
+            return len(self.values)
+
+        if isinstance(until, datetime):
+            return bisect_right(self.timestamps, until.timestamp())
+
+        if not isinstance(until, int):
+            raise TypeError("Replay target must be an int or a datetime.")
+
+        if until < 0:
+            raise ValueError("Sequence number must be non-negative.")
+
+        return min(until, len(self.values))
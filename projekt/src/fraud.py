@@ -0,0 +1,370 @@
+import math
+import time
+
+from src.velocity import SlidingWindowCounter
+
+FEATURES = ("amount_zscore", "new_counterparty", "currency_mismatch", "velocity")
+
+DEFAULT_WEIGHTS = {
+    "amount_zscore": 0.4,
+    "new_counterparty": 0.2,
+    "currency_mismatch": 0.1,
+    "velocity": 0.3,
+}
+
+OUTGOING_OPERATIONS = frozenset(("withdraw", "transfer", "interbank_transfer"))
+
+
+class AccountFeatures:
+    """Running statistics of the outgoing operations of one account."""
+
+    __slots__ = ("count", "mean", "m2", "counterparties", "velocity")
+
+    def __init__(self, window, buckets):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.counterparties = set()
+        self.velocity = SlidingWindowCounter(window, buckets)
+
+    def add(self, amount):
+        """Adds an amount to the running mean and variance (Welford's method)."""
+
+        self.count += 1
+        delta = amount - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (amount - self.mean)
+
+    def std(self):
+        """Returns the sample standard deviation of the recorded amounts."""
+
+        if self.count < 2:
+            return 0.0
+
+        return math.sqrt(self.m2 / (self.count - 1))
+
+
+class FeatureStore:
+    """Incrementally maintained per-account features for transaction scoring.
+
+    Every committed outgoing operation updates the account's running mean and
+    variance of amounts in PLN, its set of counterparties and a sliding-window
+    count of operations, so scoring never reads the raw ledger. Transfers to
+    another bank are filed in that bank's ledger, so the store also listens to
+    every bank its accounts send transfers to.
+    """
+
+    def __init__(self, bank, window=3600, buckets=60, clock=time.time):
+        """Initializes a new FeatureStore, backfills it from the ledger and attaches it.
+
+        Args:
+            bank (Bank): The bank whose transactions are tracked.
+            window (float, optional): Velocity window in seconds. Defaults to one hour.
+            buckets (int, optional): Ring buckets of the velocity window. Defaults to 60.
+            clock (callable, optional): Returns the current time in seconds.
+                Defaults to time.time.
+        """
+
+        self.bank = bank
+        self.window = window
+        self.buckets = buckets
+        self.clock = clock
+        self.accounts = {}
+        self.banks = {id(bank)}
+
+        for account_number, ledger in bank.transactions.items():
+            for transaction in ledger:
+                self._add(transaction, account_number)
+
+        bank.add_pre_commit_check(self.watch)
+        bank.add_transaction_listener(self.record)
+
+    def watch(self, account, operation, amount, to_account=None):
+        """Pre-commit check subscribing to the bank of a transfer's recipient.
+
+        Args:
+            account (BankAccount): The account the operation is performed on.
+            operation (str): Operation type, e.g. 'transfer'.
+            amount (float): Amount in the account's currency.
+            to_account (BankAccount, optional): Recipient account of a transfer.
+        """
+
+        if to_account is not None and id(to_account.bank) not in self.banks:
+            self.banks.add(id(to_account.bank))
+            to_account.bank.add_transaction_listener(self.record)
+
+    def get(self, account_number):
+        """Returns the features of an account, creating empty ones if needed.
+
+        Args:
+            account_number (str): The account number.
+
+        Returns:
+            AccountFeatures: The account's features.
+        """
+
+        features = self.accounts.get(account_number)
+
+        if features is None:
+            features = AccountFeatures(self.window, self.buckets)
+            self.accounts[account_number] = features
+
+        return features
+
+    def record(self, transaction, account_number):
+        """Transaction listener updating the features of outgoing operations."""
+
+        features = self._add(transaction, account_number)
+
+        if features is not None:
+            features.velocity.add(self.clock())
+
+    def _add(self, transaction, account_number):
+        """Adds a ledger entry to the running statistics of its account."""
+
+        if transaction["type"] not in OUTGOING_OPERATIONS:
+            return None
+
+        account = self.bank.accounts.get(account_number)
+        if account is None:
+            return None
+
+        features = self.get(account_number)
+        features.add(transaction["amount"] * self.bank.currencies[account.currency])
+
+        counterparty = transaction.get("to")
+        if counterparty is not None:
+            to_bank = transaction.get("to_bank")
+            features.counterparties.add(
+                counterparty if to_bank is None else f"{to_bank}/{counterparty}"
+            )
+
+        return features
+
+
+class FraudScorer:
+    """Pre-commit check scoring transfers against the account's features.
+
+    The score is a weighted sum of features scaled to [0, 1]: the absolute
+    z-score of the amount against the account's history (capped at
+    ``zscore_cap``), whether the recipient is a new counterparty, whether the
+    currencies differ, and the number of outgoing operations in the velocity
+    window (capped at ``velocity_cap``). Transfers scoring at or above the
+    threshold are rejected.
+    """
+
+    def __init__(
+        self,
+        bank,
+        store=None,
+        weights=None,
+        threshold=0.7,
+        zscore_cap=4.0,
+        velocity_cap=10,
+        min_history=5,
+        operations=("transfer",),
+    ):
+        """Initializes a new FraudScorer and attaches it to the bank.
+
+        Args:
+            bank (Bank): The bank whose transfers are scored.
+            store (FeatureStore, optional): Feature store to read; a new one is
+                created when omitted.
+            weights (dict[str, float], optional): Weight of each feature in
+                FEATURES. Defaults to DEFAULT_WEIGHTS.
+            threshold (float, optional): Score at which transfers are rejected.
+                Defaults to 0.7.
+            zscore_cap (float, optional): Z-score counted as fully suspicious.
+                Defaults to 4.
+            velocity_cap (int, optional): Operations in the window counted as
+                fully suspicious. Defaults to 10.
+            min_history (int, optional): Operations needed before amounts are
+                compared with the history. Defaults to 5.
+            operations (tuple[str], optional): Operation types that are scored.
+
+        Raises:
+            ValueError: If a weight names an unknown feature or a cap is not positive.
+        """
+
+        weights = DEFAULT_WEIGHTS if weights is None else weights
+
+        unknown = set(weights) - set(FEATURES)
+        if unknown:
+            raise ValueError(f"Unknown fraud features: {', '.join(sorted(unknown))}.")
+
+        if zscore_cap <= 0 or velocity_cap <= 0:
+            raise ValueError("Feature caps must be positive.")
+
+        self.bank = bank
+        self.store = FeatureStore(bank) if store is None else store
+        self.weights = [weights.get(feature, 0.0) for feature in FEATURES]
+        self.threshold = threshold
+        self.zscore_cap = zscore_cap
+        self.velocity_cap = velocity_cap
+        self.min_history = min_history
+        self.operations = frozenset(operations)
+
+        bank.add_pre_commit_check(self.check)
+
+    def check(self, account, operation, amount, to_account=None):
+        """Rejects the operation if its score reaches the threshold.
+
+        Args:
+            account (BankAccount): The account the operation is performed on.
+            operation (str): Operation type, e.g. 'transfer'.
+            amount (float): Amount in the account's currency.
+            to_account (BankAccount, optional): Recipient account of a transfer.
+
+        Raises:
+            PermissionError: If the transfer is scored as fraudulent.
+        """
+
+        if operation not in self.operations:
+            return
+
+        if self.score(account, amount, to_account) >= self.threshold:
+            raise PermissionError("Transfer rejected by fraud scoring.")
+
+    def features(self, account, amount, to_account=None):
+        """Computes the scaled features of a pending operation.
+
+        Args:
+            account (BankAccount): The source account.
+            amount (float): Amount in the account's currency.
+            to_account (BankAccount, optional): Recipient account.
+
+        Returns:
+            tuple[float, ...]: Feature values in [0, 1], in the order of FEATURES.
+        """
+
+        features = self.store.get(account.account_number)
+        amount = amount * self.bank.currencies[account.currency]
+        now = self.store.clock()
+
+        if to_account is None:
+            new_counterparty = mismatch = 0.0
+        else:
+            new_counterparty = float(
+                to_account.account_number not in features.counterparties
+            )
+            mismatch = float(to_account.currency != account.currency)
+
+        return (
+            self._scale_zscore(features.count, features.mean, features.std(), amount),
+            new_counterparty,
+            mismatch,
+            min(features.velocity.totals(now)[0] / self.velocity_cap, 1.0),
+        )
+
+    def score(self, account, amount, to_account=None):
+        """Scores a pending operation.
+
+        Args:
+            account (BankAccount): The source account.
+            amount (float): Amount in the account's currency.
+            to_account (BankAccount, optional): Recipient account.
+
+        Returns:
+            float: The score; higher is more suspicious.
+        """
+
+        return sum(
+            weight * value
+            for weight, value in zip(
+                self.weights, self.features(account, amount, to_account)
+            )
+        )
+
+    def score_batch(self, pending):
+        """Scores many pending transfers at once, one feature column at a time.
+
+        Every transfer is scored against the features committed before the
+        batch; transfers in the batch do not affect each other's scores.
+
+        Args:
+            pending (Iterable[tuple[str, str, float]]): Tuples of source account
+                number, recipient account number and amount in the source
+                account's currency.
+
+        Raises:
+            ValueError: If an account in the batch does not exist.
+
+        Returns:
+            list[float]: The score of every pending transfer.
+        """
+
+        accounts = self.bank.accounts
+        currencies = self.bank.currencies
+        now = self.store.clock()
+        velocity_cache = {}
+
+        sources, targets, amounts = [], [], []
+        for account_number, to_account_number, amount in pending:
+            source = accounts.get(account_number)
+            target = accounts.get(to_account_number)
+            if source is None or target is None:
+                missing = account_number if source is None else to_account_number
+                raise ValueError(f"Account {missing} not found.")
+
+            sources.append(source)
+            targets.append(target)
+            amounts.append(float(amount) * currencies[source.currency])
+
+        stats = [self.store.get(source.account_number) for source in sources]
+
+        for features in stats:
+            if id(features) not in velocity_cache:
+                velocity_cache[id(features)] = features.velocity.totals(now)[0]
+
+        scale = self._scale_zscore
+        columns = (
+            [
+                scale(features.count, features.mean, features.std(), amount)
+                for features, amount in zip(stats, amounts)
+            ],
+            [
+                float(target.account_number not in features.counterparties)
+                for features, target in zip(stats, targets)
+            ],
+            [
+                float(target.currency != source.currency)
+                for source, target in zip(sources, targets)
+            ],
+            [
+                min(velocity_cache[id(features)] / self.velocity_cap, 1.0)
+                for features in stats
+            ],
+        )
+
+        scores = [0.0] * len(amounts)
+        for weight, column in zip(self.weights, columns):
+            if weight:
+                scores = [
+                    score + weight * value for score, value in zip(scores, column)
+                ]
+
+        return scores
+
+    def evaluate_batch(self, pending):
+        """Decides many pending transfers at once without applying them.
+
+        Args:
+            pending (Iterable[tuple[str, str, float]]): Tuples of source account
+                number, recipient account number and amount.
+
+        Returns:
+            list[bool]: For every pending transfer, whether it would be allowed.
+        """
+
+        return [score < self.threshold for score in self.score_batch(pending)]
+
+    def _scale_zscore(self, count, mean, std, amount):
+        """Returns the absolute z-score of an amount scaled to [0, 1]."""
+
+        if count < self.min_history:
+            return 0.0
+
+        if std == 0.0:
+            return 0.0 if amount == mean else 1.0
+
+        return min(abs(amount - mean) / std / self.zscore_cap, 1.0)
@@ -0,0 +1,427 @@
+import functools
+import os
+import threading
+import time
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.auth import Auth
+from src.bank import Bank
+from src.bank_account import BankAccount
+from src.user import User
+
+DEFAULT_TARGETS = (User, BankAccount, Bank, Auth)
+
+# Upper bounds, in seconds, of the exported Prometheus histogram buckets.
+PROMETHEUS_BUCKETS = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    2.5e-3,
+    5e-3,
+    1e-2,
+    2.5e-2,
+    5e-2,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_enabled_targets = set()
+
+
+class LatencyHistogram:
+    """HDR-style log-linear latency histogram in nanoseconds.
+
+    Every power of two is split into ``2 ** precision`` equal sub-buckets, so each
+    recorded value is kept with a relative error below ``2 ** -precision``,
+    whatever its magnitude. Buckets are stored sparsely.
+    """
+
+    def __init__(self, precision=7):
+        """Initializes a new LatencyHistogram.
+
+        Args:
+            precision (int, optional): Sub-bucket bits per power of two.
+                Defaults to 7 (under 1% error).
+
+        Raises:
+            ValueError: If precision is not between 1 and 16.
+        """
+
+        if not 1 <= precision <= 16:
+            raise ValueError("Precision must be between 1 and 16 bits.")
+
+        self.precision = precision
+        self.counts = {}
+        self.reset()
+
+    def reset(self):
+        """Clears all recorded values."""
+
+        self.counts.clear()
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value):
+        """Records one latency.
+
+        Args:
+            value (int): Latency in nanoseconds.
+        """
+
+        if value < 0:
+            value = 0
+
+        shift = value.bit_length() - self.precision - 1
+        index = value if shift <= 0 else ((shift << self.precision) + (value >> shift))
+
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def lowest_value(self, index):
+        """Returns the smallest value falling into a bucket."""
+
+        sub_buckets = 1 << self.precision
+        if index < 2 * sub_buckets:
+            return index
+
+        shift = (index >> self.precision) - 1
+        return (index - (shift << self.precision)) << shift
+
+    def percentile(self, fraction):
+        """Returns the latency below which the given fraction of records falls.
+
+        Args:
+            fraction (float): Fraction between 0 and 1.
+
+        Raises:
+            ValueError: If the fraction is out of range.
+
+        Returns:
+            int: Latency in nanoseconds, or 0 when nothing was recorded.
+        """
+
+        if not 0 <= fraction <= 1:
+            raise ValueError("Percentile must be between 0 and 1.")
+
+        if not self.count:
+            return 0
+
+        target = max(1, fraction * self.count)
+        seen = 0
+
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                if seen == self.count:
+                    return self.max
+                return self.lowest_value(index)
+
+        return self.max
+
+    def cumulative(self, bounds):
+        """Returns how many records fall at or below each bound.
+
+        Args:
+            bounds (Iterable[int]): Increasing bounds in nanoseconds.
+
+        Returns:
+            list[int]: Cumulative counts, one per bound.
+        """
+
+        buckets = sorted(
+            (self.lowest_value(index), count) for index, count in self.counts.items()
+        )
+        result = []
+        seen = 0
+        position = 0
+
+        for bound in bounds:
+            while position < len(buckets) and buckets[position][0] <= bound:
+                seen += buckets[position][1]
+                position += 1
+            result.append(seen)
+
+        return result
+
+
+class OperationStats:
+    """Call count, errors by exception type and latency histogram of one operation."""
+
+    def __init__(self, precision):
+        self.calls = 0
+        self.errors = {}
+        self.histogram = LatencyHistogram(precision)
+
+    def reset(self):
+        """Clears the recorded data in place."""
+
+        self.calls = 0
+        self.errors.clear()
+        self.histogram.reset()
+
+
+class Instrumentation:
+    """Opt-in latency and error instrumentation of the public banking operations.
+
+    Enabling replaces every public method of the target classes with a timing
+    wrapper; disabling puts the original functions back, so a disabled layer costs
+    nothing. Nested calls are measured separately, so ``User.deposit`` includes
+    the time of the ``BankAccount.deposit`` and ``Bank.add_new_transaction`` calls
+    it makes.
+    """
+
+    def __init__(
+        self, targets=DEFAULT_TARGETS, precision=7, clock=time.perf_counter_ns
+    ):
+        """Initializes a new Instrumentation instance.
+
+        Args:
+            targets (Iterable[type], optional): Classes to instrument. Defaults to
+                User, BankAccount, Bank and Auth.
+            precision (int, optional): Histogram sub-bucket bits. Defaults to 7.
+            clock (callable, optional): Returns the time in nanoseconds.
+                Defaults to time.perf_counter_ns.
+        """
+
+        self.targets = tuple(targets)
+        self.precision = precision
+        self.clock = clock
+        self.stats = {}
+        self.originals = []
+        self.enabled = False
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disable()
+
+    def enable(self):
+        """Installs the timing wrappers.
+
+        Raises:
+            ValueError: If one of the target classes is already instrumented.
+        """
+
+        if any(target in _enabled_targets for target in self.targets):
+            raise ValueError("Instrumentation is already enabled.")
+
+        for target in self.targets:
+            _enabled_targets.add(target)
+
+            for name, function in list(vars(target).items()):
+                if name.startswith("_") or not isinstance(function, types.FunctionType):
+                    continue
+
+                self.originals.append((target, name, function))
+                setattr(target, name, self._wrap(f"{target.__name__}.{name}", function))
+
+        self.enabled = True
+
+    def disable(self):
+        """Removes the timing wrappers. Recorded data is kept."""
+
+        if not self.enabled:
+            return
+
+        for target, name, function in reversed(self.originals):
+            setattr(target, name, function)
+
+        for target in self.targets:
+            _enabled_targets.discard(target)
+
+        self.originals = []
+        self.enabled = False
+
+    def reset(self):
+        """Discards all recorded data."""
+
+        with self.lock:
+            for stats in self.stats.values():
+                stats.reset()
+
+    def _wrap(self, operation, function):
+        """Returns a wrapper recording calls, errors and latency of a function."""
+
+        clock = self.clock
+        lock = self.lock
+        stats = self.stats.get(operation)
+        if stats is None:
+            stats = self.stats[operation] = OperationStats(self.precision)
+        record = stats.histogram.record
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                result = function(*args, **kwargs)
+            except Exception as error:
+                elapsed = clock() - start
+                name = type(error).__name__
+                with lock:
+                    stats.calls += 1
+                    record(elapsed)
+                    stats.errors[name] = stats.errors.get(name, 0) + 1
+                raise
+            elapsed = clock() - start
+            with lock:
+                stats.calls += 1
+                record(elapsed)
+            return result
+
+        return timed
+
+    def _active_stats(self):
+        """Returns the statistics of operations that were called, by name."""
+
+        return sorted(
+            (operation, stats) for operation, stats in self.stats.items() if stats.calls
+        )
+
+    def snapshot(self):
+        """Returns a copy of the recorded statistics.
+
+        Returns:
+            dict[str, dict]: Per operation (``Class.method``): ``calls``, ``errors``
+                by exception type, and ``p50``, ``p90``, ``p99``, ``max`` and
+                ``total`` latency in seconds.
+        """
+
+        with self.lock:
+            return {
+                operation: {
+                    "calls": stats.calls,
+                    "errors": dict(stats.errors),
+                    "p50": stats.histogram.percentile(0.5) / 1e9,
+                    "p90": stats.histogram.percentile(0.9) / 1e9,
+                    "p99": stats.histogram.percentile(0.99) / 1e9,
+                    "max": stats.histogram.max / 1e9,
+                    "total": stats.histogram.total / 1e9,
+                }
+                for operation, stats in self._active_stats()
+            }
+
+    def export_prometheus(self):
+        """Renders the statistics in the Prometheus text exposition format.
+
+        Returns:
+            str: Call and error counters and a latency histogram per operation.
+        """
+
+        bounds = [round(bound * 1e9) for bound in PROMETHEUS_BUCKETS]
+        lines = [
+            "# HELP bank_operation_calls_total Calls of a banking operation.",
+            "# TYPE bank_operation_calls_total counter",
+        ]
+
+        with self.lock:
+            stats = self._active_stats()
+
+            for operation, item in stats:
+                lines.append(
+                    f'bank_operation_calls_total{{operation="{operation}"}} {item.calls}'
+                )
+
+            lines += [
+                "# HELP bank_operation_errors_total Failed calls by exception type.",
+                "# TYPE bank_operation_errors_total counter",
+            ]
+            for operation, item in stats:
+                for error, count in sorted(item.errors.items()):
+                    lines.append(
+                        f'bank_operation_errors_total{{operation="{operation}",'
+                        f'exception="{error}"}} {count}'
+                    )
+
+            lines += [
+                "# HELP bank_operation_latency_seconds Latency of a banking operation.",
+                "# TYPE bank_operation_latency_seconds histogram",
+            ]
+            for operation, item in stats:
+                histogram = item.histogram
+                label = f'operation="{operation}"'
+                for bound, count in zip(
+                    PROMETHEUS_BUCKETS, histogram.cumulative(bounds)
+                ):
+                    lines.append(
+                        f'bank_operation_latency_seconds_bucket{{{label},le="{bound:g}"}}'
+                        f" {count}"
+                    )
+                lines += [
+                    f'bank_operation_latency_seconds_bucket{{{label},le="+Inf"}}'
+                    f" {histogram.count}",
+                    f"bank_operation_latency_seconds_sum{{{label}}}"
+                    f" {histogram.total / 1e9:.9f}",
+                    f"bank_operation_latency_seconds_count{{{label}}} {histogram.count}",
+                ]
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """Writes the Prometheus text to a file, replacing it atomically.
+
+        Suitable for the node exporter's textfile collector.
+
+        Args:
+            path (str): Destination file path.
+        """
+
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as stream:
+            stream.write(self.export_prometheus())
+        os.replace(temporary, path)
+
+    def serve(self, port=0, host="127.0.0.1"):
+        """Serves the Prometheus text on ``/metrics`` from a background thread.
+
+        Args:
+            port (int, optional): Port to listen on; 0 picks a free one.
+                Defaults to 0.
+            host (str, optional): Address to bind. Defaults to 127.0.0.1.
+
+        Returns:
+            ThreadingHTTPServer: The running server; call ``shutdown()`` to stop
+                it. The bound port is ``server.server_address[1]``.
+        """
+
+        instrumentation = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+
+                body = instrumentation.export_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        return server
@@ -0,0 +1,312 @@
+import os
+import pickle
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Sequence
+from itertools import pairwise
+from operator import itemgetter
+
+_date = itemgetter("date")
+
+
+class Segment:
+    """Metadata of one compressed block of cold ledger entries."""
+
+    __slots__ = ("key", "start", "count", "first_date", "last_date", "size")
+
+    def __init__(self, key, start, count, first_date, last_date, size):
+        self.key = key
+        self.start = start
+        self.count = count
+        self.first_date = first_date
+        self.last_date = last_date
+        self.size = size
+
+
+class TieredLedger(Sequence):
+    """Append-only ledger of one account with a hot list and cold segments.
+
+    The newest ``hot_size`` entries stay as dicts in a list. Once the hot list
+    holds a full segment more than that, its oldest ``segment_size`` entries are
+    compacted into a compressed segment. Reads of cold entries go through the
+    shared segment cache of the owning ``TieredTransactions``. ``ordered`` tells
+    whether the entries are in date order, so queries never scan cold segments
+    to find out.
+    """
+
+    def __init__(self, store, account_number):
+        self.store = store
+        self.account_number = account_number
+        self.segments = []
+        self.starts = []
+        self.last_dates = []
+        self.cold_count = 0
+        self.hot = []
+        self.ordered = True
+
+    def __len__(self):
+        return self.cold_count + len(self.hot)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[position] for position in range(start, stop, step)]
+            return list(self._entries(start, stop))
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("ledger index out of range")
+
+        if index >= self.cold_count:
+            return self.hot[index - self.cold_count]
+
+        segment = self.segments[bisect_right(self.starts, index) - 1]
+
+        return self.store.load(segment)[index - segment.start]
+
+    def __iter__(self):
+        return self._entries(0, len(self))
+
+    def __bool__(self):
+        return bool(self.hot) or self.cold_count > 0
+
+    def append(self, transaction):
+        """Adds an entry, compacting the oldest hot entries when due.
+
+        Args:
+            transaction (dict): The ledger entry.
+        """
+
+        if self.hot and transaction["date"] < self.hot[-1]["date"]:
+            self.ordered = False
+
+        self.hot.append(transaction)
+
+        if len(self.hot) >= self.store.hot_size + self.store.segment_size:
+            self.compact()
+
+    def compact(self):
+        """Moves full segments of the oldest hot entries to the cold tier."""
+
+        store = self.store
+
+        while len(self.hot) >= store.hot_size + store.segment_size:
+            entries = self.hot[: store.segment_size]
+            del self.hot[: store.segment_size]
+
+            segment = store.save(self.account_number, len(self.segments), entries)
+            segment.start = self.cold_count
+
+            self.segments.append(segment)
+            self.starts.append(segment.start)
+            self.last_dates.append(segment.last_date)
+            self.cold_count += segment.count
+
+    def between(self, date_from, date_to):
+        """Returns the entries dated within a range of a date-ordered ledger.
+
+        Only cold segments overlapping the range are paged in.
+
+        Args:
+            date_from (datetime): Start of the range.
+            date_to (datetime): End of the range.
+
+        Returns:
+            list[dict]: The matching entries in ledger order.
+        """
+
+        result = []
+        position = bisect_left(self.last_dates, date_from)
+
+        for segment in self.segments[position:]:
+            if segment.first_date > date_to:
+                return result
+
+            entries = self.store.load(segment)
+            start = bisect_left(entries, date_from, key=_date)
+            stop = bisect_right(entries, date_to, start, key=_date)
+            result.extend(entries[start:stop])
+
+        start = bisect_left(self.hot, date_from, key=_date)
+        stop = bisect_right(self.hot, date_to, start, key=_date)
+        result.extend(self.hot[start:stop])
+
+        return result
+
+    def _entries(self, start, stop):
+        """Yields the entries between two positions, paging in cold segments."""
+
+        position = start
+
+        if position < self.cold_count:
+            first = bisect_right(self.starts, position) - 1
+            for segment in self.segments[first:]:
+                if position >= stop:
+                    return
+                entries = self.store.load(segment)
+                end = min(stop, segment.start + segment.count)
+                yield from entries[position - segment.start : end - segment.start]
+                position = end
+
+        if stop > self.cold_count:
+            yield from self.hot[position - self.cold_count : stop - self.cold_count]
+
+
+class TieredTransactions(dict):
+    """Replacement for ``Bank.transactions`` keeping old entries compressed.
+
+    Each account's ledger is a ``TieredLedger``. Cold segments are pickled,
+    zlib-compressed and kept in memory, or written to files in ``directory``.
+    Banks referenced by entries are stored by bank code and restored on load.
+    Decoded segments are shared through a bounded LRU cache, so reading history
+    repeatedly does not decompress it every time.
+
+    Segments are decoded with ``pickle``, which can run arbitrary code, so
+    ``directory`` must only be writable by the process that owns the bank.
+    """
+
+    def __init__(
+        self,
+        bank,
+        hot_size=1000,
+        segment_size=1000,
+        cache_segments=64,
+        directory=None,
+        compression_level=6,
+    ):
+        """Initializes a new TieredTransactions, compacts existing ledgers and attaches it.
+
+        Args:
+            bank (Bank): The bank whose ledgers are tiered.
+            hot_size (int, optional): Newest entries per account kept as objects.
+                Defaults to 1000.
+            segment_size (int, optional): Entries per cold segment. Defaults to 1000.
+            cache_segments (int, optional): Decoded segments kept in the LRU cache.
+                Defaults to 64.
+            directory (str, optional): Directory for segment files; segments stay
+                in memory when omitted. Its files are unpickled, so it must be
+                trusted.
+            compression_level (int, optional): zlib level. Defaults to 6.
+
+        Raises:
+            ValueError: If a size is not positive, or the bank uses a storage backend.
+        """
+
+        if hot_size <= 0 or segment_size <= 0 or cache_segments <= 0:
+            raise ValueError("Ledger tier sizes must be positive.")
+
+        if bank.storage is not None:
+            raise ValueError("Banks with a storage backend keep their ledger on disk.")
+
+        super().__init__()
+        self.bank = bank
+        self.hot_size = hot_size
+        self.segment_size = segment_size
+        self.cache_segments = cache_segments
+        self.directory = directory
+        self.compression_level = compression_level
+        self.blobs = {}
+        self.cache = OrderedDict()
+        self.banks = {bank.bank_code: bank}
+        self.loads = 0
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+        for account_number, entries in bank.transactions.items():
+            ledger = self[account_number]
+            ledger.hot.extend(entries)
+            ledger.ordered = all(
+                first["date"] <= second["date"] for first, second in pairwise(entries)
+            )
+            ledger.compact()
+
+        bank.transactions = self
+
+    def __missing__(self, account_number):
+        ledger = self[account_number] = TieredLedger(self, account_number)
+        return ledger
+
+    def save(self, account_number, index, entries):
+        """Compresses and stores a block of entries.
+
+        Args:
+            account_number (str): The account the entries belong to.
+            index (int): Position of the segment in the account's ledger.
+            entries (list[dict]): The entries, oldest first.
+
+        Returns:
+            Segment: Metadata of the stored segment.
+        """
+
+        banks = self.banks
+        packed = []
+
+        for entry in entries:
+            bank = entry.get("bank")
+            if bank is not None:
+                banks.setdefault(bank.bank_code, bank)
+                entry = dict(entry, bank=bank.bank_code)
+            packed.append(entry)
+
+        blob = zlib.compress(
+            pickle.dumps(packed, pickle.HIGHEST_PROTOCOL), self.compression_level
+        )
+        key = f"{account_number}-{index}"
+
+        if self.directory is None:
+            self.blobs[key] = blob
+        else:
+            with open(os.path.join(self.directory, f"{key}.seg"), "wb") as stream:
+                stream.write(blob)
+
+        dates = [entry["date"] for entry in entries]
+
+        return Segment(key, 0, len(entries), min(dates), max(dates), len(blob))
+
+    def load(self, segment):
+        """Returns the decoded entries of a segment, through the LRU cache.
+
+        Args:
+            segment (Segment): The segment to read.
+
+        Returns:
+            list[dict]: The segment's entries.
+        """
+
+        entries = self.cache.get(segment.key)
+
+        if entries is not None:
+            self.cache.move_to_end(segment.key)
+            return entries
+
+        if self.directory is None:
+            blob = self.blobs[segment.key]
+        else:
+            with open(
+                os.path.join(self.directory, f"{segment.key}.seg"), "rb"
+            ) as stream:
+                blob = stream.read()
+
+        entries = pickle.loads(zlib.decompress(blob))
+        for entry in entries:
+            if "bank" in entry:
+                entry["bank"] = self.banks[entry["bank"]]
+        self.loads += 1
+
+        self.cache[segment.key] = entries
+        if len(self.cache) > self.cache_segments:
+            self.cache.popitem(last=False)
+
+        return entries
+
+    def cold_bytes(self):
+        """Returns the compressed size of all cold segments in bytes."""
+
+        return sum(
+            segment.size for ledger in self.values() for segment in ledger.segments
+        )
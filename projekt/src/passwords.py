@@ -0,0 +1,216 @@
+import hashlib
+import hmac
+import os
+
+ALGORITHMS = ("scrypt", "pbkdf2_sha256")
+
+# Default log2 work factors: scrypt N = 2**14 (16 MiB per hash) and
+# 2**19 PBKDF2-HMAC-SHA256 iterations, both roughly 50-200 ms on a desktop core.
+DEFAULT_COSTS = {"scrypt": 14, "pbkdf2_sha256": 19}
+
+SCRYPT_R = 8
+SCRYPT_P = 1
+DIGEST_SIZE = 32
+
+
+def _derive(algorithm, cost, password, salt):
+    """Derives the key of a password with the given algorithm and cost."""
+
+    if algorithm == "scrypt":
+        n = 1 << cost
+        return hashlib.scrypt(
+            password.encode(),
+            salt=salt,
+            n=n,
+            r=SCRYPT_R,
+            p=SCRYPT_P,
+            maxmem=256 * SCRYPT_R * n + (1 << 20),
+            dklen=DIGEST_SIZE,
+        )
+
+    return hashlib.pbkdf2_hmac(
+        "sha256", password.encode(), salt, 1 << cost, dklen=DIGEST_SIZE
+    )
+
+
+def verify_password(password, encoded):
+    """Checks a password against an encoded hash in constant time.
+
+    The algorithm, cost and salt are read from the encoded hash, so hashes made
+    with an older cost keep verifying after the default changes.
+
+    Args:
+        password (str): The password to check.
+        encoded (str): Hash produced by ``PasswordHasher.hash``.
+
+    Raises:
+        ValueError: If the encoded hash is malformed or uses an unknown algorithm.
+
+    Returns:
+        bool: True if the password matches.
+    """
+
+    try:
+        algorithm, cost, salt, digest = encoded.split("$")
+        cost = int(cost)
+        salt = bytes.fromhex(salt)
+        digest = bytes.fromhex(digest)
+    except ValueError:
+        raise ValueError("Malformed password hash.")
+
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unsupported password hash algorithm: {algorithm}.")
+
+    return hmac.compare_digest(_derive(algorithm, cost, password, salt), digest)
+
+
+class PasswordHasher:
+    """Salted key-derivation hashing of passwords with a tunable cost.
+
+    Hashes are encoded as ``algorithm$cost$salt$digest`` with hexadecimal salt
+    and digest, where the cost is the log2 of scrypt's N parameter or of the
+    PBKDF2 iteration count.
+    """
+
+    def __init__(self, algorithm="scrypt", cost=None, salt_size=16):
+        """Initializes a new PasswordHasher.
+
+        Args:
+            algorithm (str, optional): ``scrypt`` or ``pbkdf2_sha256``.
+                Defaults to scrypt.
+            cost (int, optional): Log2 work factor. Defaults to the algorithm's
+                entry in DEFAULT_COSTS.
+            salt_size (int, optional): Salt length in bytes. Defaults to 16.
+
+        Raises:
+            ValueError: If the algorithm is unknown, the cost is not between 1 and
+                30 or the salt is shorter than 8 bytes.
+        """
+
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unsupported password hash algorithm: {algorithm}.")
+
+        cost = DEFAULT_COSTS[algorithm] if cost is None else cost
+
+        if not 1 <= cost <= 30:
+            raise ValueError("Password hash cost must be between 1 and 30.")
+
+        if salt_size < 8:
+            raise ValueError("Password salt must be at least 8 bytes.")
+
+        self.algorithm = algorithm
+        self.cost = cost
+        self.salt_size = salt_size
+
+    def hash(self, password):
+        """Hashes a password with a fresh random salt.
+
+        Args:
+            password (str): The password to hash.
+
+        Returns:
+            str: The encoded hash.
+        """
+
+        salt = os.urandom(self.salt_size)
+        digest = _derive(self.algorithm, self.cost, password, salt)
+
+        return f"{self.algorithm}${self.cost}${salt.hex()}${digest.hex()}"
+
+
+default_hasher = PasswordHasher()
+
+
+def set_default_hasher(hasher):
+    """Replaces the hasher used for new user passwords.
+
+    Args:
+        hasher (PasswordHasher): The new default hasher.
+
+    Returns:
+        PasswordHasher: The previous default hasher.
+    """
+
+    global default_hasher
+
+    previous, default_hasher = default_hasher, hasher
+
+    return previous
+
+
+def hash_password(password):
+    """Hashes a password with the default hasher.
+
+    Args:
+        password (str): The password to hash.
+
+    Returns:
+        str: The encoded hash.
+    """
+
+    return default_hasher.hash(password)
+
+
+class VerificationPool:
+    """Worker processes that verify passwords away from the request thread.
+
+    Key derivation is CPU-bound, so logins are spread over separate processes,
+    each with its own interpreter and GIL. While the calling thread waits for
+    the result, other threads of the server keep running.
+    """
+
+    def __init__(self, workers=None):
+        """Initializes a new VerificationPool.
+
+        Args:
+            workers (int, optional): Number of worker processes. Defaults to the
+                number of CPUs.
+
+        Raises:
+            ValueError: If the number of workers is not positive.
+        """
+
+        if workers is not None and workers <= 0:
+            raise ValueError("Number of workers must be positive.")
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(self.workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def submit(self, password, encoded):
+        """Schedules a verification.
+
+        Args:
+            password (str): The password to check.
+            encoded (str): The stored hash.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the result of verify_password.
+        """
+
+        return self.executor.submit(verify_password, password, encoded)
+
+    def verify(self, password, encoded):
+        """Verifies a password in a worker process and waits for the result.
+
+        Args:
+            password (str): The password to check.
+            encoded (str): The stored hash.
+
+        Returns:
+            bool: True if the password matches.
+        """
+
+        return self.submit(password, encoded).result()
+
+    def close(self):
+        """Shuts the worker processes down."""
+
+        self.executor.shutdown()
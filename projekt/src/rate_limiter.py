@@ -0,0 +1,200 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import islice
+
+
+class TokenBucketTable:
+    """Compact expiring table of token buckets keyed by client or account."""
+
+    def __init__(self, capacity, refill_rate, max_entries=100000):
+        """Initializes a new TokenBucketTable instance.
+
+        Buckets that have refilled completely carry no information and are dropped,
+        so the table only holds keys with recent activity. A full table is trimmed
+        to three quarters of ``max_entries`` at once, so a spray of new keys
+        rescans the table only once per quarter of its size.
+
+        Args:
+            capacity (float): Number of tokens a full bucket holds.
+            refill_rate (float): Tokens regained per second.
+            max_entries (int, optional): Upper bound on stored buckets. Defaults to 100000.
+
+        Raises:
+            ValueError: If capacity, refill rate or max entries is not positive.
+        """
+
+        if capacity <= 0 or refill_rate <= 0:
+            raise ValueError("Capacity and refill rate must be positive")
+
+        if max_entries <= 0:
+            raise ValueError("Max entries must be positive")
+
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self.max_entries = max_entries
+        self.low_water = max_entries - max(1, max_entries // 4)
+        self.entries = {}
+
+    def tokens(self, key, now):
+        """Returns the number of tokens currently available for a key.
+
+        Args:
+            key (Hashable): Bucket key.
+            now (float): Current time in seconds.
+
+        Returns:
+            float: Available tokens.
+        """
+
+        entry = self.entries.get(key)
+        if entry is None:
+            return self.capacity
+
+        tokens, updated_at = entry
+        return min(self.capacity, tokens + (now - updated_at) * self.refill_rate)
+
+    def consume(self, key, now, amount=1.0):
+        """Takes tokens from a key's bucket.
+
+        Args:
+            key (Hashable): Bucket key.
+            now (float): Current time in seconds.
+            amount (float, optional): Tokens to take. Defaults to 1.
+
+        Returns:
+            bool: True if enough tokens were available.
+        """
+
+        tokens = self.tokens(key, now)
+
+        if key not in self.entries and len(self.entries) >= self.max_entries:
+            self.purge(now)
+
+        if tokens < amount:
+            self.entries[key] = (tokens, now)
+            return False
+
+        self.entries[key] = (tokens - amount, now)
+        return True
+
+    def purge(self, now):
+        """Drops expired buckets and, if the table is still full, the oldest ones.
+
+        A full table is trimmed down to its low-water mark, oldest buckets first.
+
+        Args:
+            now (float): Current time in seconds.
+
+        Returns:
+            int: Number of removed buckets.
+        """
+
+        before = len(self.entries)
+        self.entries = {
+            key: (tokens, updated_at)
+            for key, (tokens, updated_at) in self.entries.items()
+            if tokens + (now - updated_at) * self.refill_rate < self.capacity
+        }
+
+        if len(self.entries) >= self.max_entries:
+            excess = len(self.entries) - self.low_water
+            for key in list(islice(self.entries, excess)):
+                del self.entries[key]
+
+        return before - len(self.entries)
+
+
+class PinAttemptLimiter:
+    """Throttles failed PIN attempts per client and per account across a bank."""
+
+    def __init__(
+        self,
+        bank,
+        client_capacity=10,
+        client_refill_rate=1 / 60,
+        account_capacity=5,
+        account_refill_rate=1 / 300,
+        max_entries=100000,
+        clock=time.monotonic,
+    ):
+        """Initializes a new PinAttemptLimiter and attaches it to the bank.
+
+        Every failed PIN comparison takes a token from the client's and the account's
+        bucket. Once either bucket is empty, further attempts are rejected before the
+        PIN is compared at all.
+
+        Args:
+            bank (Bank): The bank whose accounts are protected.
+            client_capacity (float, optional): Failed attempts a client may burst. Defaults to 10.
+            client_refill_rate (float, optional): Client attempts regained per second.
+            account_capacity (float, optional): Failed attempts an account may absorb. Defaults to 5.
+            account_refill_rate (float, optional): Account attempts regained per second.
+            max_entries (int, optional): Upper bound on tracked keys per table.
+            clock (callable, optional): Returns the current time in seconds.
+        """
+
+        self.clients = TokenBucketTable(
+            client_capacity, client_refill_rate, max_entries
+        )
+        self.accounts = TokenBucketTable(
+            account_capacity, account_refill_rate, max_entries
+        )
+        self.clock = clock
+        self.current_client = ContextVar("pin_attempt_client", default=None)
+
+        bank.pin_attempt_limiter = self
+
+    @contextmanager
+    def client(self, client_id):
+        """Attributes PIN attempts made inside the block to the given client.
+
+        Args:
+            client_id (Hashable): Identifier of the client, e.g. an IP address.
+        """
+
+        token = self.current_client.set(client_id)
+        try:
+            yield
+        finally:
+            self.current_client.reset(token)
+
+    def check(self, account_number):
+        """Rejects the attempt if the client or the account ran out of attempts.
+
+        Args:
+            account_number (str): The account being accessed.
+
+        Raises:
+            PermissionError: If too many failed PIN attempts were made recently.
+        """
+
+        accounts = self.accounts.entries
+        client_id = self.current_client.get()
+
+        if account_number not in accounts and (
+            client_id is None or client_id not in self.clients.entries
+        ):
+            return
+
+        now = self.clock()
+
+        if self.accounts.tokens(account_number, now) < 1:
+            raise PermissionError("Too many failed PIN attempts. Try again later.")
+
+        if client_id is not None and self.clients.tokens(client_id, now) < 1:
+            raise PermissionError("Too many failed PIN attempts. Try again later.")
+
+    def record_failure(self, account_number):
+        """Takes a token from the account's and the current client's bucket.
+
+        Args:
+            account_number (str): The account that received a wrong PIN.
+        """
+
+        now = self.clock()
+        self.accounts.consume(account_number, now)
+
+        client_id = self.current_client.get()
+        if client_id is not None:
+            self.clients.consume(client_id, now)
@@ -0,0 +1,196 @@
+from datetime import date, datetime
+
+INCOMING_TYPES = (
+    "deposit",
+    "incoming_transfer",
+    "incoming_interbank_transfer",
+    "interbank_refund",
+)
+OUTGOING_TYPES = ("withdraw", "transfer", "interbank_transfer")
+
+
+class DailyRollups:
+    """Per-account, per-day activity totals maintained on every ledger append.
+
+    Each bucket holds the number of transactions, money in, money out and a count
+    and sum per transaction type. Amounts are summed in the currency the account
+    had when the transaction was recorded. Monthly and range totals are derived
+    from the daily buckets, so their cost depends on the number of active days,
+    not on the number of transactions.
+    """
+
+    def __init__(self, bank):
+        """Initializes a new DailyRollups, backfills existing ledgers and attaches it.
+
+        Args:
+            bank (Bank): The bank whose ledgers are rolled up.
+        """
+
+        self.bank = bank
+        self.accounts = {}
+
+        for account_number, ledger in bank.transactions.items():
+            for transaction in ledger:
+                self.record(transaction, account_number)
+
+        bank.add_transaction_listener(self.record)
+
+    def record(self, transaction, account_number):
+        """Adds a transaction to its account's daily bucket.
+
+        Args:
+            transaction (dict): The transaction added to the ledger.
+            account_number (str): The account the transaction belongs to.
+        """
+
+        days = self.accounts.get(account_number)
+        if days is None:
+            days = self.accounts[account_number] = {}
+
+        day = transaction["date"].date()
+        bucket = days.get(day)
+        if bucket is None:
+            bucket = days[day] = [0, 0.0, 0.0, {}]
+
+        transaction_type = transaction["type"]
+        amount = transaction.get("amount", 0)
+
+        bucket[0] += 1
+        if transaction_type in INCOMING_TYPES:
+            bucket[1] += amount
+        elif transaction_type in OUTGOING_TYPES:
+            bucket[2] += amount
+
+        by_type = bucket[3].get(transaction_type)
+        if by_type is None:
+            bucket[3][transaction_type] = [1, amount]
+        else:
+            by_type[0] += 1
+            by_type[1] += amount
+
+    def daily(self, account_number, date_from, date_to):
+        """Returns the daily buckets of an account within a date range.
+
+        Args:
+            account_number (str): The account number.
+            date_from (date): First day of the range.
+            date_to (date): Last day of the range.
+
+        Raises:
+            TypeError: If the range bounds are not dates.
+            ValueError: If the start date is after the end date.
+
+        Returns:
+            list[tuple[date, dict]]: Day and totals for every active day, in order.
+        """
+
+        date_from, date_to = self._validate_range(date_from, date_to)
+
+        return [
+            (day, self._totals([bucket]))
+            for day, bucket in sorted(self.accounts.get(account_number, {}).items())
+            if date_from <= day <= date_to
+        ]
+
+    def summary(self, account_number, date_from, date_to):
+        """Returns the totals of an account over a date range.
+
+        Args:
+            account_number (str): The account number.
+            date_from (date): First day of the range.
+            date_to (date): Last day of the range.
+
+        Raises:
+            TypeError: If the range bounds are not dates.
+            ValueError: If the start date is after the end date.
+
+        Returns:
+            dict: ``count``, ``sum_in``, ``sum_out`` and ``by_type``, which maps each
+                transaction type to its ``count`` and ``amount``.
+        """
+
+        date_from, date_to = self._validate_range(date_from, date_to)
+
+        return self._totals(
+            bucket
+            for day, bucket in self.accounts.get(account_number, {}).items()
+            if date_from <= day <= date_to
+        )
+
+    def monthly(self, account_number, year, month):
+        """Returns the totals of an account for one calendar month.
+
+        Args:
+            account_number (str): The account number.
+            year (int): The year.
+            month (int): The month, 1 to 12.
+
+        Raises:
+            ValueError: If the month is out of range.
+
+        Returns:
+            dict: Totals in the format returned by ``summary``.
+        """
+
+        if not 1 <= month <= 12:
+            raise ValueError("Month must be between 1 and 12.")
+
+        next_month = date(year + month // 12, month % 12 + 1, 1)
+        last_day = date.fromordinal(next_month.toordinal() - 1)
+
+        return self.summary(account_number, date(year, month, 1), last_day)
+
+    def _totals(self, buckets):
+        """Sums daily buckets into a totals dictionary."""
+
+        count, sum_in, sum_out, by_type = 0, 0.0, 0.0, {}
+
+        for bucket in buckets:
+            count += bucket[0]
+            sum_in += bucket[1]
+            sum_out += bucket[2]
+
+            for transaction_type, (type_count, amount) in bucket[3].items():
+                totals = by_type.setdefault(
+                    transaction_type, {"count": 0, "amount": 0.0}
+                )
+                totals["count"] += type_count
+                totals["amount"] += amount
+
+        return {
+            "count": count,
+            "sum_in": round(sum_in, 2),
+            "sum_out": round(sum_out, 2),
+            "by_type": {
+                transaction_type: {
+                    "count": totals["count"],
+                    "amount": round(totals["amount"], 2),
+                }
+                for transaction_type, totals in by_type.items()
+            },
+        }
+
+    def _validate_range(self, date_from, date_to):
+        """Validates a date range and converts datetimes to dates.
+
+        Raises:
+            TypeError: If the range bounds are not dates.
+            ValueError: If the start date is after the end date.
+
+        Returns:
+            tuple[date, date]: The validated range.
+        """
+
+        if not isinstance(date_from, date) or not isinstance(date_to, date):
+            raise TypeError("Dates must be date objects.")
+
+        if isinstance(date_from, datetime):
+            date_from = date_from.date()
+
+        if isinstance(date_to, datetime):
+            date_to = date_to.date()
+
+        if date_from > date_to:
+            raise ValueError("Start date must be before end date.")
+
+        return date_from, date_to
@@ -0,0 +1,338 @@
+import heapq
+import time
+from itertools import count
+
+from src.bank import BULK_OPERATIONS
+
+DAY = 86400.0
+
+
+def _validate_operation(operation):
+    """Checks that an operation can be passed to ``Bank.execute_bulk``.
+
+    ``execute_bulk`` rejects a whole batch with one unsupported operation, so
+    operations are checked before they join a batch.
+
+    Raises:
+        ValueError: If the operation is malformed or names an unsupported method.
+    """
+
+    if not isinstance(operation, tuple) or len(operation) < 2:
+        raise ValueError("Operation must be a tuple of account number and method.")
+
+    if operation[1] not in BULK_OPERATIONS:
+        raise ValueError(f"Unsupported account operation: {operation[1]}")
+
+
+class SimulatedClock:
+    """Manually advanced clock for fast-forwarding a scheduler."""
+
+    def __init__(self, start=0.0):
+        """Initializes a new SimulatedClock.
+
+        Args:
+            start (float, optional): Initial time in seconds. Defaults to 0.
+        """
+
+        self.now = float(start)
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        """Moves the clock forward.
+
+        Args:
+            seconds (float): Number of seconds to move forward.
+
+        Raises:
+            ValueError: If seconds is negative.
+        """
+
+        if seconds < 0:
+            raise ValueError("Clock cannot move backwards.")
+
+        self.now += seconds
+
+    def set(self, now):
+        """Moves the clock forward to a point in time.
+
+        Args:
+            now (float): The new time in seconds.
+
+        Raises:
+            ValueError: If the time is before the current one.
+        """
+
+        self.advance(now - self.now)
+
+
+class Job:
+    """A scheduled account operation, run once or repeatedly."""
+
+    def __init__(self, job_id, operation, next_run, interval=None, remaining=None):
+        """Initializes a new Job.
+
+        Args:
+            job_id (int): Identifier assigned by the scheduler.
+            operation (tuple | callable): Tuple of account number, BankAccount method
+                name and arguments, or a callable returning such a tuple (or None to
+                skip the run) when the job fires.
+            next_run (float): Time of the next run in seconds.
+            interval (float, optional): Seconds between runs; None runs once.
+            remaining (int, optional): Number of runs left; None repeats forever.
+        """
+
+        self.job_id = job_id
+        self.operation = operation
+        self.next_run = next_run
+        self.interval = interval
+        self.remaining = remaining
+        self.runs = 0
+        self.failures = 0
+
+
+class Scheduler:
+    """Time-ordered job queue fired in batches through ``Bank.execute_bulk``.
+
+    The heap holds each distinct due time once, and jobs due at that time wait in
+    a bucket next to it. Recurring payments mostly share due times, so firing a
+    run costs a list append instead of a heap push and pop. Due runs are sent to
+    the bank in bulk calls of up to ``batch_size`` operations. Cancelled jobs
+    stay in their bucket and are skipped when it comes up.
+    """
+
+    def __init__(self, bank, clock=time.time, batch_size=10000):
+        """Initializes a new Scheduler.
+
+        Args:
+            bank (Bank): Bank whose ``execute_bulk`` runs the operations.
+            clock (callable, optional): Returns the current time in seconds. Pass a
+                SimulatedClock to fast-forward. Defaults to time.time.
+            batch_size (int, optional): Maximum operations per bulk call.
+                Defaults to 10000.
+
+        Raises:
+            ValueError: If the batch size is not positive.
+        """
+
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive.")
+
+        self.bank = bank
+        self.clock = clock
+        self.batch_size = batch_size
+        self.jobs = {}
+        self.heap = []
+        self.buckets = {}
+        self.ids = count(1)
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def schedule(self, operation, at=None, interval=None, times=None):
+        """Schedules an account operation.
+
+        Args:
+            operation (tuple | callable): Tuple of account number, BankAccount method
+                name and arguments, or a callable returning such a tuple (or None).
+            at (float, optional): Time of the first run. Defaults to now.
+            interval (float, optional): Seconds between runs; None runs once.
+            times (int, optional): Total number of runs of a recurring job;
+                None repeats until cancelled.
+
+        Raises:
+            ValueError: If the interval or the number of runs is not positive, or
+                the operation names an unsupported method.
+
+        Returns:
+            int: The job identifier.
+        """
+
+        if not callable(operation):
+            _validate_operation(operation)
+
+        if interval is not None and interval <= 0:
+            raise ValueError("Interval must be positive.")
+
+        if times is not None and times <= 0:
+            raise ValueError("Number of runs must be positive.")
+
+        if interval is None:
+            times = 1
+
+        job = Job(
+            next(self.ids),
+            operation,
+            self.clock() if at is None else at,
+            interval,
+            times,
+        )
+        self.jobs[job.job_id] = job
+        self._push(job.next_run, job.job_id)
+
+        return job.job_id
+
+    def cancel(self, job_id):
+        """Cancels a job.
+
+        Args:
+            job_id (int): The job identifier.
+
+        Raises:
+            ValueError: If the job does not exist.
+        """
+
+        if self.jobs.pop(job_id, None) is None:
+            raise ValueError("Job not found.")
+
+    def next_run(self):
+        """Returns the time of the earliest pending run, or None."""
+
+        self._drop_cancelled()
+
+        return self.heap[0] if self.heap else None
+
+    def run_pending(self, now=None):
+        """Fires every run due at or before ``now``, in time order.
+
+        Recurring jobs that fell several intervals behind run once per missed
+        interval. A callable operation that raises or returns an unsupported
+        operation counts as a failed run, like an operation the bank rejects.
+
+        Args:
+            now (float, optional): Cut-off time. Defaults to the clock.
+
+        Returns:
+            tuple[int, list[tuple[int, Exception]]]: Number of runs and the job
+            identifiers and errors of failed runs.
+        """
+
+        now = self.clock() if now is None else now
+        executed = 0
+        failures = []
+
+        while True:
+            batch, jobs, errors = self._collect(now)
+            if not batch and not errors:
+                return executed, failures
+
+            executed += len(batch) + len(errors)
+            for job, error in errors:
+                job.failures += 1
+                failures.append((job.job_id, error))
+
+            for job, (success, result) in zip(jobs, self.bank.execute_bulk(batch)):
+                if not success:
+                    job.failures += 1
+                    failures.append((job.job_id, result))
+
+    def run_until(self, end):
+        """Fast-forwards a simulated clock, firing each due moment in turn.
+
+        Args:
+            end (float): Time to stop at.
+
+        Raises:
+            TypeError: If the scheduler does not use a SimulatedClock.
+
+        Returns:
+            tuple[int, list[tuple[int, Exception]]]: Same as ``run_pending``.
+        """
+
+        if not isinstance(self.clock, SimulatedClock):
+            raise TypeError("Fast-forwarding requires a SimulatedClock.")
+
+        executed = 0
+        failures = []
+
+        while True:
+            due = self.next_run()
+            if due is None or due > end:
+                break
+
+            self.clock.set(max(due, self.clock.now))
+            runs, failed = self.run_pending(due)
+            executed += runs
+            failures.extend(failed)
+
+        self.clock.set(max(end, self.clock.now))
+
+        return executed, failures
+
+    def _push(self, due, job_id):
+        """Adds a run to the bucket of its due time."""
+
+        bucket = self.buckets.get(due)
+        if bucket is None:
+            self.buckets[due] = [job_id]
+            heapq.heappush(self.heap, due)
+        else:
+            bucket.append(job_id)
+
+    def _collect(self, now):
+        """Takes up to one batch of due runs and reschedules recurring jobs.
+
+        Returns:
+            tuple[list[tuple], list[Job], list[tuple[Job, Exception]]]: Operations,
+            the jobs they belong to, and jobs whose callable raised with the error.
+        """
+
+        batch = []
+        jobs = []
+        errors = []
+        heap = self.heap
+        active = self.jobs
+
+        while heap and heap[0] <= now and len(batch) < self.batch_size:
+            due = heap[0]
+            bucket = self.buckets[due]
+            taken = bucket[: self.batch_size - len(batch)]
+            del bucket[: len(taken)]
+
+            if not bucket:
+                heapq.heappop(heap)
+                del self.buckets[due]
+
+            for job_id in taken:
+                job = active.get(job_id)
+                if job is None:
+                    continue
+
+                job.runs += 1
+                if job.remaining is not None:
+                    job.remaining -= 1
+
+                if job.remaining == 0:
+                    del active[job_id]
+                else:
+                    job.next_run += job.interval
+                    self._push(job.next_run, job_id)
+
+                operation = job.operation
+                try:
+                    if callable(operation):
+                        operation = operation()
+                        if operation is None:
+                            continue
+                    _validate_operation(operation)
+                except Exception as error:
+                    errors.append((job, error))
+                    continue
+
+                batch.append(operation)
+                jobs.append(job)
+
+        return batch, jobs, errors
+
+    def _drop_cancelled(self):
+        """Removes due times whose jobs were all cancelled from the top of the heap."""
+
+        while self.heap:
+            due = self.heap[0]
+            bucket = self.buckets[due]
+            bucket[:] = [job_id for job_id in bucket if job_id in self.jobs]
+            if bucket:
+                return
+            heapq.heappop(self.heap)
+            del self.buckets[due]
@@ -0,0 +1,469 @@
+import copy
+import multiprocessing
+import os
+import random
+import zlib
+from datetime import datetime
+
+from src.bank import Bank
+from src.bank_account import BankAccount, AccountStatus
+
+ACCOUNT_OPERATIONS = frozenset(
+    {
+        "close",
+        "withdraw",
+        "deposit",
+        "unlock_account",
+        "change_currency",
+        "change_pin",
+        "calculate_intrest",
+    }
+)
+
+
+def shard_of(account_number, shards):
+    """Returns the index of the shard owning an account number.
+
+    Uses CRC32 instead of ``hash`` so every process agrees on the placement.
+
+    Args:
+        account_number (str): The account number.
+        shards (int): Number of shards.
+
+    Returns:
+        int: Shard index.
+    """
+
+    return zlib.crc32(account_number.encode()) % shards
+
+
+class _ShardWorker:
+    """Server side of a shard, owning one Bank inside a worker process."""
+
+    def __init__(self, name, bank_code, currencies):
+        self.bank = Bank(name=name, bank_code=bank_code, currencies=currencies)
+        self.prepared = {}
+
+    def handle(self, operation, args):
+        return getattr(self, "op_" + operation)(*args)
+
+    def op_open_account(self, owner, pin_code, balance, currency, account_number):
+        try:
+            owner = self.bank.get_user(owner.id)
+        except ValueError:
+            self.bank.add_user(owner)
+
+        account = BankAccount(
+            owner=owner,
+            bank=self.bank,
+            pin_code=pin_code,
+            balance=balance,
+            currency=currency,
+            account_number=account_number,
+        )
+        owner.bank_accounts[account.account_number] = account
+
+        return account.account_number
+
+    def op_call(self, account_number, method, args):
+        return getattr(self._account(account_number), method)(*args)
+
+    def op_transfer(self, amount, from_account_number, to_account_number, pin_code):
+        return self._account(from_account_number).transfer(
+            amount, to_account_number, pin_code, self.bank
+        )
+
+    def op_get_balance(self, account_number):
+        account = self._account(account_number)
+        return account.balance, account.currency
+
+    def op_get_transactions(self, account_number):
+        self._account(account_number)
+        return [
+            _portable(transaction)
+            for transaction in self.bank.get_transactions(account_number)
+        ]
+
+    def op_batch(self, operations):
+        results = []
+        for operation, args in operations:
+            try:
+                results.append((True, self.handle(operation, args)))
+            except Exception as error:
+                results.append((False, error))
+        return results
+
+    def op_prepare_debit(self, transaction_id, account_number, amount, pin_code):
+        account = self._account(account_number)
+        account._validate_access(pin_code)
+
+        try:
+            amount = float(amount)
+        except ValueError:
+            raise TypeError("Bank account amount must be a number")
+
+        if amount <= 0:
+            raise ValueError("Amount cannot be negative or zero.")
+
+        if amount > account.balance:
+            raise ValueError("Bank account amount cannot be greater than the balance.")
+
+        # The recipient lives on another shard, so checks see no target account.
+        for check in self.bank.pre_commit_checks:
+            check(account, "transfer", amount, None)
+
+        self.prepared[transaction_id] = (account, amount)
+
+        return amount, account.currency
+
+    def op_prepare_credit(self, transaction_id, account_number, amount, currency):
+        account = self.bank.accounts.get(account_number)
+
+        if not account:
+            raise ValueError("Account not found.")
+
+        if account.status != AccountStatus.ACTIVE:
+            raise ValueError("Other account is not active.")
+
+        if account.currency != currency:
+            rates = self.bank.currencies
+            amount = round(amount * rates[currency] / rates[account.currency], 2)
+        else:
+            amount = round(amount, 2)
+
+        self.prepared[transaction_id] = (account, amount)
+
+        return account.currency
+
+    def op_commit_debit(self, transaction_id, to_account_number, now, same_currency):
+        account, amount = self.prepared.pop(transaction_id)
+        account.balance -= round(amount, 2) if same_currency else amount
+        account.last_transaction_date = now
+
+        transaction = {
+            "type": "transfer",
+            "to": to_account_number,
+            "bank": self.bank,
+            "amount": amount,
+            "date": now,
+        }
+
+        return self.bank.add_new_transaction(transaction, account.account_number)
+
+    def op_commit_credit(self, transaction_id, from_account_number, now):
+        account, amount = self.prepared.pop(transaction_id)
+        account.balance += amount
+        account.last_transaction_date = now
+
+        transaction = {
+            "type": "incoming_transfer",
+            "from": from_account_number,
+            "amount": amount,
+            "date": now,
+        }
+
+        return self.bank.add_new_transaction(transaction, account.account_number)
+
+    def op_abort(self, transaction_id):
+        self.prepared.pop(transaction_id, None)
+        return True
+
+    def _account(self, account_number):
+        account = self.bank.accounts.get(account_number)
+        if not account:
+            raise ValueError("Account not found.")
+        return account
+
+
+def _portable(transaction):
+    """Returns a copy of a transaction that can be sent between processes."""
+
+    if "bank" in transaction:
+        transaction = dict(transaction, bank=transaction["bank"].bank_code)
+    return transaction
+
+
+def _serve_shard(connection, name, bank_code, currencies):
+    """Main loop of a shard worker process."""
+
+    worker = _ShardWorker(name, bank_code, currencies)
+
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+
+        operation, args = message
+        try:
+            connection.send((True, worker.handle(operation, args)))
+        except Exception as error:
+            connection.send((False, error))
+
+    connection.close()
+
+
+class ShardedBank:
+    """Router exposing bank account operations over a pool of shard worker processes."""
+
+    def __init__(self, name, bank_code, currencies, shards=None, context=None):
+        """Initializes a new ShardedBank and starts one worker process per shard.
+
+        Args:
+            name (str): name of the bank
+            bank_code (str): bank code
+            currencies (dict[str, float]): exchange rates shared by all shards
+            shards (int, optional): number of worker processes. Defaults to the CPU count.
+            context (multiprocessing.context.BaseContext, optional): multiprocessing context.
+        """
+
+        if shards is None:
+            shards = os.cpu_count() or 1
+
+        if not isinstance(shards, int) or shards <= 0:
+            raise ValueError("Number of shards must be a positive integer")
+
+        context = context or multiprocessing.get_context()
+
+        self.name = name
+        self.bank_code = bank_code
+        self.currencies = dict(currencies)
+        self.shards = shards
+        self.connections = []
+        self.processes = []
+        self._transaction_ids = 0
+
+        for _ in range(shards):
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_serve_shard,
+                args=(child, name, bank_code, self.currencies),
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self.connections.append(parent)
+            self.processes.append(process)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Stops all shard worker processes."""
+
+        for connection in self.connections:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+
+        for process in self.processes:
+            process.join()
+
+        self.connections = []
+        self.processes = []
+
+    def open_account(self, owner, pin_code, balance=0, currency="PLN"):
+        """Opens an account on the shard owning its freshly generated number.
+
+        Args:
+            owner (User): Owner of the account.
+            pin_code (str): The PIN code for the new account.
+            balance (float, optional): Initial balance. Defaults to 0.
+            currency (str, optional): Currency of the account. Defaults to 'PLN'.
+
+        Returns:
+            str: The new account number.
+        """
+
+        account_number = self.bank_code + "".join(
+            str(random.randint(0, 9)) for _ in range(22)
+        )
+
+        owner = copy.copy(owner)
+        owner.bank_accounts = {}
+        owner._banks = ()
+
+        return self._request(
+            shard_of(account_number, self.shards),
+            "open_account",
+            (owner, pin_code, balance, currency, account_number),
+        )
+
+    def deposit(self, amount, account_number, pin_code):
+        """Deposits money into an account. See BankAccount.deposit."""
+
+        return self.call(account_number, "deposit", amount, pin_code)
+
+    def withdraw(self, amount, account_number, pin_code):
+        """Withdraws money from an account. See BankAccount.withdraw."""
+
+        return self.call(account_number, "withdraw", amount, pin_code)
+
+    def get_balance(self, account_number):
+        """Returns the balance and currency of an account.
+
+        Args:
+            account_number (str): The account number.
+
+        Returns:
+            tuple[float, str]: Balance and currency code.
+        """
+
+        return self._request(
+            shard_of(account_number, self.shards), "get_balance", (account_number,)
+        )
+
+    def get_transactions(self, account_number):
+        """Returns the transactions of an account, with banks replaced by their codes.
+
+        Args:
+            account_number (str): The account number.
+
+        Returns:
+            list[dict]: The account's transactions.
+        """
+
+        return self._request(
+            shard_of(account_number, self.shards),
+            "get_transactions",
+            (account_number,),
+        )
+
+    def call(self, account_number, method, *args):
+        """Runs a BankAccount operation on the shard owning the account.
+
+        Args:
+            account_number (str): The account number.
+            method (str): Name of the BankAccount method, e.g. 'deposit'.
+            *args: Positional arguments of the method.
+
+        Raises:
+            ValueError: If the method is not a routable account operation.
+
+        Returns:
+            Any: The method's result.
+        """
+
+        if method not in ACCOUNT_OPERATIONS:
+            raise ValueError(f"Unsupported account operation: {method}")
+
+        return self._request(
+            shard_of(account_number, self.shards),
+            "call",
+            (account_number, method, args),
+        )
+
+    def transfer(self, amount, from_account_number, to_account_number, pin_code):
+        """Transfers money between two accounts, using two-phase commit across shards.
+
+        The source shard first validates the debit, including the bank's pre-commit
+        checks, and the target shard validates the recipient. Only when both are
+        prepared are the two sides committed, with the same rounding as
+        ``BankAccount.transfer``; otherwise the prepared debit is dropped. The
+        router sends requests one at a time, so nothing else runs on the source
+        shard between prepare and commit.
+
+        Args:
+            amount (float): Amount in the source account's currency.
+            from_account_number (str): Source account number.
+            to_account_number (str): Recipient account number.
+            pin_code (str): The PIN code of the source account.
+
+        Returns:
+            bool: True if the transfer was recorded.
+        """
+
+        source = shard_of(from_account_number, self.shards)
+        target = shard_of(to_account_number, self.shards)
+
+        if source == target:
+            return self._request(
+                source,
+                "transfer",
+                (amount, from_account_number, to_account_number, pin_code),
+            )
+
+        self._transaction_ids += 1
+        transaction_id = self._transaction_ids
+
+        amount, currency = self._request(
+            source,
+            "prepare_debit",
+            (transaction_id, from_account_number, amount, pin_code),
+        )
+
+        try:
+            target_currency = self._request(
+                target,
+                "prepare_credit",
+                (transaction_id, to_account_number, amount, currency),
+            )
+        except Exception:
+            self._request(source, "abort", (transaction_id,))
+            raise
+
+        now = datetime.now()
+        self._send(target, "commit_credit", (transaction_id, from_account_number, now))
+        self._send(
+            source,
+            "commit_debit",
+            (transaction_id, to_account_number, now, target_currency == currency),
+        )
+
+        # Read both replies before raising, so no reply is left in a pipe.
+        replies = [self.connections[shard].recv() for shard in (target, source)]
+        for success, result in replies:
+            if not success:
+                raise result
+
+        return replies[1][1]
+
+    def execute_batch(self, operations):
+        """Runs many single-account operations, each shard processing its part in parallel.
+
+        Args:
+            operations (Iterable[tuple]): Tuples of account number, BankAccount method
+                name and its positional arguments.
+
+        Returns:
+            list[tuple[bool, Any]]: For every operation, a success flag and either the
+            result or the raised exception, in input order.
+        """
+
+        per_shard = [[] for _ in range(self.shards)]
+        positions = [[] for _ in range(self.shards)]
+
+        for position, (account_number, method, *args) in enumerate(operations):
+            if method not in ACCOUNT_OPERATIONS:
+                raise ValueError(f"Unsupported account operation: {method}")
+            shard = shard_of(account_number, self.shards)
+            per_shard[shard].append(("call", (account_number, method, tuple(args))))
+            positions[shard].append(position)
+
+        busy = [shard for shard in range(self.shards) if per_shard[shard]]
+        for shard in busy:
+            self._send(shard, "batch", (per_shard[shard],))
+
+        results = [None] * sum(len(shard) for shard in positions)
+        for shard in busy:
+            for position, result in zip(positions[shard], self._receive(shard)):
+                results[position] = result
+
+        return results
+
+    def _request(self, shard, operation, args):
+        self._send(shard, operation, args)
+        return self._receive(shard)
+
+    def _send(self, shard, operation, args):
+        self.connections[shard].send((operation, args))
+
+    def _receive(self, shard):
+        success, result = self.connections[shard].recv()
+        if not success:
+            raise result
+        return result
@@ -0,0 +1,173 @@
+import weakref
+from datetime import datetime
+
+
+class BankSnapshot:
+    """Consistent, read-only view of a bank's accounts and ledgers at one moment.
+
+    Nothing is copied up front except the list of account numbers. Ledgers are
+    append-only, so the view shares them with the bank and only remembers each
+    account's ledger length. Balances, statuses and currencies are copied on write:
+    the bank hands an account's state to open snapshots right before changing it.
+    """
+
+    def __init__(self, bank):
+        """Initializes a new BankSnapshot and registers it with the bank.
+
+        Args:
+            bank (Bank): The bank to take the view of.
+        """
+
+        self.bank = bank
+        self.created_at = datetime.now()
+        self.preserved = {}
+        self.closed = False
+        key = id(self)
+        bank.snapshots[key] = weakref.ref(self, lambda _: bank.snapshots.pop(key, None))
+        self.accounts = dict.fromkeys(bank.accounts)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Stops tracking changes. The view must not be read afterwards."""
+
+        self.bank.snapshots.pop(id(self), None)
+        self.closed = True
+
+    def preserve(self, account_number):
+        """Copies the state of an account the first time it changes after the snapshot.
+
+        Args:
+            account_number (str): The account about to change.
+        """
+
+        if account_number in self.preserved:
+            return
+
+        account = self.bank.accounts.get(account_number)
+        ledger = self.bank.transactions.get(account_number)
+
+        state = None
+        if account is not None:
+            state = (account.balance, account.status, account.currency)
+
+        self.preserved[account_number] = (
+            state,
+            len(ledger) if ledger is not None else 0,
+        )
+
+    def account_numbers(self):
+        """Returns the numbers of all accounts that existed when the view was taken.
+
+        Returns:
+            list[str]: Account numbers in opening order.
+        """
+
+        return list(self.accounts)
+
+    def get_account(self, account_number):
+        """Returns the state of an account as seen by the view.
+
+        Args:
+            account_number (str): The account number.
+
+        Raises:
+            ValueError: If the account did not exist when the view was taken.
+
+        Returns:
+            dict: The account's balance, status and currency.
+        """
+
+        self._check_open()
+
+        if account_number not in self.accounts:
+            raise ValueError("Account not found.")
+
+        account = self.bank.accounts[account_number]
+        state = (account.balance, account.status, account.currency)
+
+        preserved = self.preserved.get(account_number)
+        if preserved is not None:
+            state = preserved[0]
+
+        balance, status, currency = state
+
+        return {"balance": balance, "status": status, "currency": currency}
+
+    def total_balances(self):
+        """Returns the summed balances of all accounts in the view, grouped by currency.
+
+        Returns:
+            dict[str, float]: Total balance per currency code.
+        """
+
+        balances = {}
+
+        for account_number in self.accounts:
+            account = self.get_account(account_number)
+            currency = account["currency"]
+            balances[currency] = balances.get(currency, 0) + account["balance"]
+
+        return {currency: round(balance, 2) for currency, balance in balances.items()}
+
+    def get_transactions(self, account_number):
+        """Returns an account's transactions as seen by the view.
+
+        Args:
+            account_number (str): The account number.
+
+        Returns:
+            list[dict]: The transactions recorded before the view was taken.
+        """
+
+        self._check_open()
+
+        ledger = self.bank.transactions.get(account_number)
+        if ledger is None:
+            return []
+
+        length = len(ledger)
+
+        preserved = self.preserved.get(account_number)
+        if preserved is not None:
+            length = preserved[1]
+
+        return list(ledger[:length])
+
+    def get_transactions_by_date(self, date_from, date_to, account_number):
+        """Returns an account's transactions within a date range as seen by the view.
+
+        Args:
+            date_from (datetime): Start date of the range.
+            date_to (datetime): End date of the range.
+            account_number (str): The account number.
+
+        Raises:
+            TypeError: If the date arguments are not datetime objects.
+            ValueError: If the start date is after the end date.
+
+        Returns:
+            list[dict]: The matching transactions.
+        """
+
+        if not isinstance(date_from, datetime) or not isinstance(date_to, datetime):
+            raise TypeError("Dates must be datetime objects.")
+
+        if date_from > date_to:
+            raise ValueError("Start date must be before end date.")
+
+        return [
+            transaction
+            for transaction in self.get_transactions(account_number)
+            if date_from <= transaction["date"] <= date_to
+        ]
+
+    def _check_open(self):
+        """Raises if the view was closed."""
+
+        if self.closed:
+            raise ValueError("Snapshot is closed.")
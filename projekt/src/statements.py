@@ -0,0 +1,298 @@
+import csv
+import multiprocessing
+import os
+from datetime import datetime, time
+
+from src.rollups import INCOMING_TYPES, OUTGOING_TYPES
+from src.sharding import shard_of
+
+FORMATS = ("text", "csv")
+CSV_HEADER = ("account_number", "date", "type", "amount", "counterparty")
+
+# Set in the parent right before forking so workers inherit the bank instead of
+# receiving a pickled copy of it.
+_job = None
+
+
+def build_statement(bank, account_number, date_from, date_to, rollups=None):
+    """Collects an account's statement for a billing period.
+
+    Args:
+        bank (Bank): The bank holding the account.
+        account_number (str): The account number.
+        date_from (datetime): Start of the period.
+        date_to (datetime): End of the period.
+        rollups (DailyRollups, optional): Rollups used for the totals of periods
+            covering whole days. Otherwise totals are summed from the period's
+            transactions.
+
+    Raises:
+        ValueError: If the account does not exist.
+
+    Returns:
+        dict: Account details, period, transactions and totals.
+    """
+
+    account = bank.accounts.get(account_number)
+    if account is None:
+        raise ValueError("Account not found.")
+
+    transactions = bank.get_transactions_by_date(date_from, date_to, account_number)
+
+    if rollups is not None and _whole_days(date_from, date_to):
+        totals = rollups.summary(account_number, date_from, date_to)
+    else:
+        totals = {"count": len(transactions), "sum_in": 0.0, "sum_out": 0.0}
+        for transaction in transactions:
+            if transaction["type"] in INCOMING_TYPES:
+                totals["sum_in"] += transaction["amount"]
+            elif transaction["type"] in OUTGOING_TYPES:
+                totals["sum_out"] += transaction["amount"]
+        totals["sum_in"] = round(totals["sum_in"], 2)
+        totals["sum_out"] = round(totals["sum_out"], 2)
+
+    return {
+        "account_number": account_number,
+        "owner": f"{account.owner.name} {account.owner.last_name}",
+        "currency": account.currency,
+        "balance": account.balance,
+        "date_from": date_from,
+        "date_to": date_to,
+        "transactions": transactions,
+        "totals": totals,
+    }
+
+
+def _whole_days(date_from, date_to):
+    """Returns whether a period starts at midnight and ends at the end of a day."""
+
+    return date_from.time() == time.min and date_to.time() == time.max
+
+
+def _counterparty(transaction):
+    """Returns the other side of a transaction, if any."""
+
+    return transaction.get("to") or transaction.get("from") or ""
+
+
+def render_text(statement, stream):
+    """Writes a statement as plain text.
+
+    Args:
+        statement (dict): Statement returned by ``build_statement``.
+        stream (TextIO): Stream to write to.
+    """
+
+    currency = statement["currency"]
+    totals = statement["totals"]
+    lines = [
+        f"Statement for account {statement['account_number']}",
+        f"Owner: {statement['owner']}",
+        f"Period: {statement['date_from']:%Y-%m-%d} - {statement['date_to']:%Y-%m-%d}",
+        "",
+    ]
+
+    for transaction in statement["transactions"]:
+        amount = transaction.get("amount", "")
+        lines.append(
+            f"{transaction['date']:%Y-%m-%d %H:%M:%S}  {transaction['type']:<28}"
+            f"{amount:>14}  {_counterparty(transaction)}"
+        )
+
+    lines.extend(
+        [
+            "",
+            f"Transactions: {totals['count']}",
+            f"Money in: {totals['sum_in']} {currency}",
+            f"Money out: {totals['sum_out']} {currency}",
+            f"Balance: {statement['balance']} {currency}",
+            "",
+            "",
+        ]
+    )
+    stream.write("\n".join(lines))
+
+
+def render_csv(statement, writer):
+    """Writes a statement's transactions as CSV rows.
+
+    Args:
+        statement (dict): Statement returned by ``build_statement``.
+        writer (csv.writer): Writer to add the rows to.
+    """
+
+    account_number = statement["account_number"]
+    writer.writerows(
+        (
+            account_number,
+            transaction["date"].isoformat(),
+            transaction["type"],
+            transaction.get("amount", ""),
+            _counterparty(transaction),
+        )
+        for transaction in statement["transactions"]
+    )
+
+
+class StatementGenerator:
+    """Renders billing-period statements for many accounts into per-shard files.
+
+    Accounts are split into shards by account number. Each shard is rendered
+    into one file through a large write buffer. With more than one worker, the
+    shards are rendered by forked processes, which inherit the bank from the
+    parent instead of receiving a copy. Banks with a storage backend are
+    rendered serially, since a forked process cannot share the database
+    connection.
+    """
+
+    def __init__(
+        self,
+        bank,
+        output_dir,
+        rollups=None,
+        workers=None,
+        shards=None,
+        format="text",
+        buffer_size=1 << 20,
+    ):
+        """Initializes a new StatementGenerator instance.
+
+        Args:
+            bank (Bank): The bank to render statements for.
+            output_dir (str): Directory the statement files are written to.
+            rollups (DailyRollups, optional): Rollups used for statement totals.
+            workers (int, optional): Number of worker processes. Defaults to the
+                number of CPUs.
+            shards (int, optional): Number of output files. Defaults to the number
+                of workers.
+            format (str, optional): ``text`` or ``csv``. Defaults to ``text``.
+            buffer_size (int, optional): Write buffer size in bytes. Defaults to
+                1 MiB.
+
+        Raises:
+            ValueError: If the format is unknown or a count is not positive.
+        """
+
+        if format not in FORMATS:
+            raise ValueError("Statement format must be 'text' or 'csv'.")
+
+        workers = workers or os.cpu_count() or 1
+        shards = shards or workers
+
+        if workers <= 0 or shards <= 0:
+            raise ValueError("Number of workers and shards must be positive.")
+
+        self.bank = bank
+        self.output_dir = output_dir
+        self.rollups = rollups
+        self.workers = workers
+        self.shards = shards
+        self.format = format
+        self.buffer_size = buffer_size
+
+    def generate(self, date_from, date_to, account_numbers=None):
+        """Renders statements for a billing period.
+
+        Args:
+            date_from (datetime): Start of the period.
+            date_to (datetime): End of the period.
+            account_numbers (Iterable[str], optional): Accounts to render.
+                Defaults to every account of the bank.
+
+        Raises:
+            TypeError: If the dates are not datetime objects.
+            ValueError: If the start date is after the end date.
+
+        Returns:
+            tuple[list[str], int]: Paths of the written files and the number of
+                statements rendered.
+        """
+
+        global _job
+
+        if not isinstance(date_from, datetime) or not isinstance(date_to, datetime):
+            raise TypeError("Dates must be datetime objects.")
+
+        if date_from > date_to:
+            raise ValueError("Start date must be before end date.")
+
+        if account_numbers is None:
+            account_numbers = self.bank.accounts
+
+        partitions = [[] for _ in range(self.shards)]
+        for account_number in account_numbers:
+            partitions[shard_of(account_number, self.shards)].append(account_number)
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        jobs = [
+            (shard, self._path(date_from, date_to, shard))
+            for shard in range(self.shards)
+        ]
+
+        _job = (self, date_from, date_to, partitions)
+        try:
+            if (
+                self.workers == 1
+                or self.bank.storage is not None
+                or "fork" not in multiprocessing.get_all_start_methods()
+            ):
+                counts = [_render_shard(job) for job in jobs]
+            else:
+                context = multiprocessing.get_context("fork")
+                with context.Pool(min(self.workers, self.shards)) as pool:
+                    counts = pool.map(_render_shard, jobs)
+        finally:
+            _job = None
+
+        return [path for _, path in jobs], sum(counts)
+
+    def _path(self, date_from, date_to, shard):
+        """Returns the file path of one shard's statements."""
+
+        extension = "txt" if self.format == "text" else "csv"
+        name = (
+            f"statements_{self.bank.bank_code}_{date_from:%Y%m%d}_{date_to:%Y%m%d}"
+            f"_{shard:03d}.{extension}"
+        )
+        return os.path.join(self.output_dir, name)
+
+    def render_shard(self, path, account_numbers, date_from, date_to):
+        """Renders the statements of one shard into a file.
+
+        Args:
+            path (str): Output file path.
+            account_numbers (list[str]): Accounts of the shard.
+            date_from (datetime): Start of the period.
+            date_to (datetime): End of the period.
+
+        Returns:
+            int: Number of statements written.
+        """
+
+        with open(
+            path, "w", newline="", encoding="utf-8", buffering=self.buffer_size
+        ) as stream:
+            writer = None
+            if self.format == "csv":
+                writer = csv.writer(stream)
+                writer.writerow(CSV_HEADER)
+
+            for account_number in account_numbers:
+                statement = build_statement(
+                    self.bank, account_number, date_from, date_to, self.rollups
+                )
+                if writer is None:
+                    render_text(statement, stream)
+                else:
+                    render_csv(statement, writer)
+
+        return len(account_numbers)
+
+
+def _render_shard(job):
+    """Worker entry point rendering one shard of the current generation."""
+
+    shard, path = job
+    generator, date_from, date_to, partitions = _job
+
+    return generator.render_shard(path, partitions[shard], date_from, date_to)
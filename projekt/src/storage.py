@@ -0,0 +1,537 @@
+import json
+import sqlite3
+import sys
+import weakref
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
+from datetime import datetime
+
+from src.bank_account import BankAccount, AccountStatus
+from src.user import User, UserRole
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    bank_code TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    password TEXT NOT NULL,
+    phone TEXT NOT NULL,
+    role TEXT NOT NULL,
+    PRIMARY KEY (bank_code, id)
+);
+CREATE TABLE IF NOT EXISTS accounts (
+    account_number TEXT PRIMARY KEY,
+    bank_code TEXT NOT NULL,
+    owner_id INTEGER NOT NULL,
+    balance REAL NOT NULL,
+    currency TEXT NOT NULL,
+    status TEXT NOT NULL,
+    pin TEXT NOT NULL,
+    failed_count INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    last_transaction_date TEXT
+);
+CREATE INDEX IF NOT EXISTS accounts_bank ON accounts (bank_code);
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    bank_code TEXT NOT NULL,
+    account_number TEXT NOT NULL,
+    date TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_account_date
+    ON transactions (bank_code, account_number, date);
+"""
+
+UPSERT_USER = "INSERT OR REPLACE INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+UPSERT_ACCOUNT = "INSERT OR REPLACE INTO accounts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+INSERT_TRANSACTION = (
+    "INSERT INTO transactions (bank_code, account_number, date, payload) "
+    "VALUES (?, ?, ?, ?)"
+)
+STATE_FIELDS = frozenset(("status", "currency", "pin", "failedWithdrawCount"))
+
+SELECT_ACCOUNT = "SELECT * FROM accounts WHERE account_number = ? AND bank_code = ?"
+SELECT_TRANSACTIONS = (
+    "SELECT date, payload FROM transactions "
+    "WHERE bank_code = ? AND account_number = ? ORDER BY id"
+)
+SELECT_TRANSACTIONS_BY_DATE = (
+    "SELECT date, payload FROM transactions "
+    "WHERE bank_code = ? AND account_number = ? AND date BETWEEN ? AND ? ORDER BY id"
+)
+
+
+class SQLiteStorage:
+    """SQLite storage backend for banks, their accounts and ledgers.
+
+    Writes are queued and applied in batched transactions. Accounts are kept in a
+    bounded LRU cache. Their balance is queued with every ledger entry, and
+    changes of status, currency, PIN and failed PIN attempts are queued as
+    they happen, so every queued change reaches the database with the next
+    batch or flush.
+    """
+
+    def __init__(self, path, cache_size=10000, batch_size=1000):
+        """Initializes a new SQLiteStorage instance.
+
+        Args:
+            path (str): Path of the database file, or ':memory:'.
+            cache_size (int, optional): Maximum number of accounts kept in memory. Defaults to 10000.
+            batch_size (int, optional): Number of queued writes that triggers a flush. Defaults to 1000.
+
+        Raises:
+            ValueError: If cache size or batch size is not positive.
+        """
+
+        if cache_size <= 0 or batch_size <= 0:
+            raise ValueError("Cache size and batch size must be positive")
+
+        self.cache_size = cache_size
+        self.batch_size = batch_size
+        # AsyncBank moves storage calls to a worker thread; it runs them one at a
+        # time, so the connection only needs to be usable from another thread.
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.pending_accounts = {}
+        self.changed_accounts = {}
+        self.pending_transactions = []
+        self.stores = []
+
+    def attach(self, bank):
+        """Replaces the bank's in-memory dicts with storage-backed ones.
+
+        Users stored for the bank are loaded back into ``bank.users``, with their
+        stored accounts in ``bank_accounts``, and stored accounts are filed in the
+        bank's status and currency indexes.
+
+        Args:
+            bank (Bank): The bank to attach.
+        """
+
+        bank.users = self._load_users(bank.bank_code)
+        bank.accounts = AccountStore(self, bank)
+        bank.transactions = TransactionStore(self, bank)
+        self.stores.append(bank.accounts)
+        bank.add_account_observer(self.account_changing)
+
+        for user in bank.users.values():
+            user.bank_accounts = OwnedAccounts(bank.accounts)
+
+        rows = self.connection.execute(
+            "SELECT account_number, owner_id, status, currency FROM accounts "
+            "WHERE bank_code = ? ORDER BY rowid",
+            (bank.bank_code,),
+        )
+        for account_number, owner_id, status, currency in rows:
+            bank.index_account(account_number, AccountStatus(status), currency)
+            owner = bank.users.get(owner_id)
+            if owner is not None:
+                owner.bank_accounts.numbers[account_number] = None
+
+    def save_user(self, bank, user):
+        """Stores a user of the bank.
+
+        Args:
+            bank (Bank): The bank the user belongs to.
+            user (User): The user to store.
+        """
+
+        with self.connection:
+            self.connection.execute(
+                UPSERT_USER,
+                (
+                    bank.bank_code,
+                    user.id,
+                    user.name,
+                    user.last_name,
+                    user.email,
+                    user.password_hash,
+                    user.phone,
+                    user.role.value,
+                ),
+            )
+
+    def save_account(self, account):
+        """Queues the current state of an account for writing.
+
+        Args:
+            account (BankAccount): The account to store.
+        """
+
+        self.pending_accounts[account.account_number] = _account_row(account)
+        self._maybe_flush()
+
+    def account_changing(self, account, field, old_value, new_value):
+        """Account observer queueing changes that are not ledger entries.
+
+        The observer runs before the new value is set, so the account is only
+        marked here and its row is built when the queue is written.
+        """
+
+        if field in STATE_FIELDS:
+            self.changed_accounts[account.account_number] = account
+
+    def add_transaction(self, bank, transaction, account_number):
+        """Queues a ledger entry, together with its account's current state, for writing.
+
+        Args:
+            bank (Bank): The bank owning the ledger.
+            transaction (dict): The transaction data.
+            account_number (str): The account the transaction belongs to.
+        """
+
+        payload = dict(transaction)
+        date = payload.pop("date")
+
+        if "bank" in payload:
+            payload["bank"] = payload["bank"].bank_code
+
+        self.pending_transactions.append(
+            (bank.bank_code, account_number, _format_date(date), json.dumps(payload))
+        )
+
+        account = bank.accounts.identity.get(account_number)
+        if account is not None:
+            self.pending_accounts[account_number] = _account_row(account)
+
+        self._maybe_flush()
+
+    def get_transactions(self, bank, account_number):
+        """Returns all ledger entries of an account in insertion order.
+
+        Args:
+            bank (Bank): The bank owning the ledger.
+            account_number (str): The account number.
+
+        Returns:
+            list[dict]: The account's transactions.
+        """
+
+        self._write_pending()
+        rows = self.connection.execute(
+            SELECT_TRANSACTIONS, (bank.bank_code, account_number)
+        )
+
+        return [_decode_transaction(bank, date, payload) for date, payload in rows]
+
+    def get_transactions_by_date(self, bank, account_number, date_from, date_to):
+        """Returns ledger entries of an account within a date range using the date index.
+
+        Args:
+            bank (Bank): The bank owning the ledger.
+            account_number (str): The account number.
+            date_from (datetime): Start date of the range.
+            date_to (datetime): End date of the range.
+
+        Returns:
+            list[dict]: The matching transactions.
+        """
+
+        self._write_pending()
+        rows = self.connection.execute(
+            SELECT_TRANSACTIONS_BY_DATE,
+            (
+                bank.bank_code,
+                account_number,
+                _format_date(date_from),
+                _format_date(date_to),
+            ),
+        )
+
+        return [_decode_transaction(bank, date, payload) for date, payload in rows]
+
+    def flush(self):
+        """Writes queued changes and the state of every account held in memory."""
+
+        for store in self.stores:
+            for account in store.live_accounts():
+                self.pending_accounts[account.account_number] = _account_row(account)
+
+        self._write_pending()
+
+    def close(self):
+        """Flushes pending writes and closes the database."""
+
+        self.flush()
+        self.connection.close()
+
+    def load_account(self, bank, account_number):
+        """Builds an account object from its stored row.
+
+        Args:
+            bank (Bank): The bank owning the account.
+            account_number (str): The account number.
+
+        Returns:
+            BankAccount | None: The account, or None if it is not stored.
+        """
+
+        row = self.pending_accounts.get(account_number)
+
+        if row is None:
+            row = self.connection.execute(
+                SELECT_ACCOUNT, (account_number, bank.bank_code)
+            ).fetchone()
+
+        if row is None or row[1] != bank.bank_code:
+            return None
+
+        account = BankAccount.__new__(BankAccount)
+        account.account_number = row[0]
+        account.bank = bank
+        account.owner = bank.users[row[2]]
+        account._balance = row[3]
+        account._currency = sys.intern(row[4])
+        account._status = AccountStatus(row[5])
+        account._pin = row[6]
+        account._failed_withdraw_count = row[7]
+        account.created_at = _parse_date(row[8])
+        account.last_transaction_date = _parse_date(row[9])
+
+        return account
+
+    def _load_users(self, bank_code):
+        """Rebuilds the stored users of a bank."""
+
+        users = {}
+        rows = self.connection.execute(
+            "SELECT id, name, last_name, email, password, phone, role "
+            "FROM users WHERE bank_code = ?",
+            (bank_code,),
+        )
+
+        for user_id, name, last_name, email, password, phone, role in rows:
+            user = User.__new__(User)
+            user.id = user_id
+            user.name = name
+            user.last_name = last_name
+            user.email = email
+            user.password_hash = password
+            user.phone = phone
+            user._banks = ()
+            user._role = UserRole(role)
+            user.bank_accounts = {}
+            users[user_id] = user
+
+        return users
+
+    def _write_pending(self):
+        """Applies all queued writes in a single transaction."""
+
+        for account_number, account in self.changed_accounts.items():
+            self.pending_accounts[account_number] = _account_row(account)
+        self.changed_accounts = {}
+
+        if not self.pending_accounts and not self.pending_transactions:
+            return
+
+        with self.connection:
+            self.connection.executemany(UPSERT_ACCOUNT, self.pending_accounts.values())
+            self.connection.executemany(INSERT_TRANSACTION, self.pending_transactions)
+
+        self.pending_accounts = {}
+        self.pending_transactions = []
+
+    def _maybe_flush(self):
+        """Writes the queue once it reaches the batch size."""
+
+        if (
+            len(self.pending_accounts)
+            + len(self.changed_accounts)
+            + len(self.pending_transactions)
+            >= self.batch_size
+        ):
+            self._write_pending()
+
+
+class AccountStore(MutableMapping):
+    """Storage-backed replacement for ``Bank.accounts`` with a bounded LRU cache.
+
+    Owners of stored accounts are registered as bank users so that accounts can be
+    rebuilt from their rows.
+    """
+
+    def __init__(self, storage, bank):
+        self.storage = storage
+        self.bank = bank
+        self.cache = OrderedDict()
+        self.identity = weakref.WeakValueDictionary()
+
+    def __getitem__(self, account_number):
+        account = self.cache.get(account_number)
+
+        if account is not None:
+            self.cache.move_to_end(account_number)
+            return account
+
+        account = self.identity.get(account_number)
+        if account is None:
+            account = self.storage.load_account(self.bank, account_number)
+            if account is None:
+                raise KeyError(account_number)
+            self.identity[account_number] = account
+
+        self._cache(account)
+
+        return account
+
+    def __setitem__(self, account_number, account):
+        if account.owner.id not in self.bank.users:
+            self.bank.add_user(account.owner)
+
+        self.identity[account_number] = account
+        self._cache(account)
+        self.storage.save_account(account)
+
+    def __delitem__(self, account_number):
+        raise TypeError("Bank accounts cannot be deleted")
+
+    def __contains__(self, account_number):
+        if account_number in self.cache or account_number in self.identity:
+            return True
+
+        if account_number in self.storage.pending_accounts:
+            return True
+
+        row = self.storage.connection.execute(
+            "SELECT 1 FROM accounts WHERE account_number = ? AND bank_code = ?",
+            (account_number, self.bank.bank_code),
+        ).fetchone()
+
+        return row is not None
+
+    def __iter__(self):
+        self.storage._write_pending()
+        rows = self.storage.connection.execute(
+            "SELECT account_number FROM accounts WHERE bank_code = ? ORDER BY rowid",
+            (self.bank.bank_code,),
+        ).fetchall()
+
+        return (account_number for (account_number,) in rows)
+
+    def __len__(self):
+        self.storage._write_pending()
+
+        return self.storage.connection.execute(
+            "SELECT COUNT(*) FROM accounts WHERE bank_code = ?",
+            (self.bank.bank_code,),
+        ).fetchone()[0]
+
+    def live_accounts(self):
+        """Returns every account object currently held in memory."""
+
+        return list(self.identity.values())
+
+    def _cache(self, account):
+        """Puts an account at the hot end of the LRU cache, evicting the coldest."""
+
+        self.cache[account.account_number] = account
+        self.cache.move_to_end(account.account_number)
+
+        if len(self.cache) > self.storage.cache_size:
+            _, evicted = self.cache.popitem(last=False)
+            self.storage.save_account(evicted)
+
+
+class OwnedAccounts(MutableMapping):
+    """Replacement for ``User.bank_accounts`` of users loaded from storage.
+
+    Only the account numbers are held; accounts are resolved through the bank's
+    ``AccountStore``, so owners do not pin their accounts in memory.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.numbers = {}
+
+    def __getitem__(self, account_number):
+        if account_number not in self.numbers:
+            raise KeyError(account_number)
+
+        return self.store[account_number]
+
+    def __setitem__(self, account_number, account):
+        self.numbers[account_number] = None
+
+    def __delitem__(self, account_number):
+        del self.numbers[account_number]
+
+    def __iter__(self):
+        return iter(list(self.numbers))
+
+    def __len__(self):
+        return len(self.numbers)
+
+
+class TransactionStore(Mapping):
+    """Read-only storage-backed view replacing ``Bank.transactions``."""
+
+    def __init__(self, storage, bank):
+        self.storage = storage
+        self.bank = bank
+
+    def __getitem__(self, account_number):
+        return self.storage.get_transactions(self.bank, account_number)
+
+    def __iter__(self):
+        self.storage._write_pending()
+        rows = self.storage.connection.execute(
+            "SELECT DISTINCT account_number FROM transactions WHERE bank_code = ?",
+            (self.bank.bank_code,),
+        ).fetchall()
+
+        return (account_number for (account_number,) in rows)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, account_number):
+        self.storage._write_pending()
+        row = self.storage.connection.execute(
+            "SELECT 1 FROM transactions WHERE bank_code = ? AND account_number = ?",
+            (self.bank.bank_code, account_number),
+        ).fetchone()
+
+        return row is not None
+
+
+def _account_row(account):
+    return (
+        account.account_number,
+        account.bank.bank_code,
+        account.owner.id,
+        account.balance,
+        account.currency,
+        account.status.value,
+        account.pin,
+        account.failedWithdrawCount,
+        _format_date(account.created_at),
+        _format_date(account.last_transaction_date),
+    )
+
+
+def _decode_transaction(bank, date, payload):
+    transaction = json.loads(payload)
+    transaction["date"] = _parse_date(date)
+
+    if transaction.get("bank") == bank.bank_code:
+        transaction["bank"] = bank
+
+    return transaction
+
+
+def _format_date(date):
+    if date is None:
+        return None
+    return date.isoformat(timespec="microseconds")
+
+
+def _parse_date(value):
+    if value is None:
+        return None
+    return datetime.fromisoformat(value)
@@ -0,0 +1,322 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+
+from src.bank_account import EPOCH, MICROSECOND
+
+TRANSFER_OPERATIONS = frozenset(("transfer", "interbank_transfer"))
+
+
+class TimeWindow:
+    """Edges of one time window, with a lazily built CSR index.
+
+    New edges go into append-only column buffers. The CSR index is compressed
+    on both axes: ``nodes`` holds the sorted ids of the nodes that sent money in
+    the window, and the edges of ``nodes[i]`` are positions
+    ``offsets[i]:offsets[i + 1]`` of the indexed columns, ordered by time. Its
+    size therefore depends on the window's edges only, not on the whole graph.
+    The index is rebuilt on the first query after the window received new edges.
+    """
+
+    __slots__ = ("sources", "targets", "amounts", "times", "csr")
+
+    def __init__(self):
+        self.sources = array("q")
+        self.targets = array("q")
+        self.amounts = array("d")
+        self.times = array("q")
+        self.csr = None
+
+    def __len__(self):
+        return len(self.sources)
+
+    def add(self, source, target, amount, time):
+        """Appends an edge and invalidates the CSR index."""
+
+        self.sources.append(source)
+        self.targets.append(target)
+        self.amounts.append(amount)
+        self.times.append(time)
+        self.csr = None
+
+    def index(self):
+        """Returns the CSR index, building it if needed.
+
+        Returns:
+            tuple[array, ...]: The sending nodes, their offsets, and the
+                targets, amounts and times of the edges in CSR order.
+        """
+
+        if self.csr is not None:
+            return self.csr
+
+        sources = self.sources
+        times = self.times
+        order = range(len(sources))
+
+        if any(times[i] > times[i + 1] for i in range(len(times) - 1)):
+            order = sorted(order, key=times.__getitem__)
+        order = sorted(order, key=sources.__getitem__)
+
+        nodes = array("q")
+        offsets = array("q")
+        previous = None
+        for position, edge in enumerate(order):
+            source = sources[edge]
+            if source != previous:
+                nodes.append(source)
+                offsets.append(position)
+                previous = source
+        offsets.append(len(order))
+
+        self.csr = (
+            nodes,
+            offsets,
+            array("q", [self.targets[edge] for edge in order]),
+            array("d", [self.amounts[edge] for edge in order]),
+            array("q", [times[edge] for edge in order]),
+        )
+
+        return self.csr
+
+
+class TransferGraph:
+    """Adjacency-indexed graph of transfers maintained from the ledger.
+
+    Nodes are accounts; accounts of other banks are named ``bank_code/number``.
+    Every outgoing transfer is an edge carrying its amount in PLN and its time.
+    Edges are bucketed into fixed time windows, each indexed as a CSR array, so
+    a trace reads only the edges of the visited accounts inside its time range.
+    """
+
+    def __init__(self, bank, window=timedelta(hours=1)):
+        """Initializes a new TransferGraph, backfills it from the ledger and attaches it.
+
+        Args:
+            bank (Bank): The bank whose transfers are indexed.
+            window (timedelta, optional): Width of a time window. Defaults to one hour.
+
+        Raises:
+            TypeError: If the window is not a timedelta.
+            ValueError: If the window is not positive.
+        """
+
+        if not isinstance(window, timedelta):
+            raise TypeError("Graph window must be a timedelta.")
+
+        if window <= timedelta(0):
+            raise ValueError("Graph window must be positive.")
+
+        self.bank = bank
+        self.window = window // MICROSECOND
+        self.nodes = {}
+        self.names = []
+        self.windows = {}
+        self.window_keys = []
+        self.edges = 0
+
+        for account_number, ledger in bank.transactions.items():
+            for transaction in ledger:
+                self.record(transaction, account_number)
+
+        bank.add_transaction_listener(self.record)
+
+    def __len__(self):
+        return self.edges
+
+    def node(self, name):
+        """Returns the id of a node, adding it if needed.
+
+        Args:
+            name (str): Account number, or ``bank_code/number`` for other banks.
+
+        Returns:
+            int: The node id.
+        """
+
+        node = self.nodes.get(name)
+
+        if node is None:
+            node = self.nodes[name] = len(self.names)
+            self.names.append(name)
+
+        return node
+
+    def add_edge(self, source, target, amount, date):
+        """Adds a transfer between two nodes.
+
+        Args:
+            source (str): Name of the sending node.
+            target (str): Name of the receiving node.
+            amount (float): Amount in PLN.
+            date (datetime): Time of the transfer.
+        """
+
+        time = (date - EPOCH) // MICROSECOND
+        key = time // self.window
+
+        window = self.windows.get(key)
+        if window is None:
+            window = self.windows[key] = TimeWindow()
+            position = bisect_left(self.window_keys, key)
+            self.window_keys.insert(position, key)
+
+        window.add(self.node(source), self.node(target), amount, time)
+        self.edges += 1
+
+    def record(self, transaction, account_number):
+        """Transaction listener adding outgoing transfers as edges.
+
+        Entries filed under accounts the bank does not hold, e.g. the source leg
+        of a transfer made through this bank from another one, are skipped, since
+        their amount cannot be converted to PLN.
+        """
+
+        if transaction["type"] not in TRANSFER_OPERATIONS:
+            return
+
+        account = self.bank.accounts.get(account_number)
+        if account is None:
+            return
+
+        rate = self.bank.currencies[account.currency]
+
+        bank = transaction.get("bank")
+        to_bank = transaction.get("to_bank") or (
+            bank.bank_code if bank is not None else self.bank.bank_code
+        )
+        target = transaction["to"]
+        if to_bank != self.bank.bank_code:
+            target = f"{to_bank}/{target}"
+
+        self.add_edge(
+            account_number, target, transaction["amount"] * rate, transaction["date"]
+        )
+
+    def trace(self, account_number, start, within, max_hops=3, min_amount=0.0):
+        """Traces where money sent from an account after ``start`` went.
+
+        Money that reached an account can only move on through transfers made
+        after it arrived, so every hop follows the edges leaving an account
+        between its earliest arrival and ``start + within``.
+
+        Args:
+            account_number (str): The account the money left.
+            start (datetime): Start of the traced period.
+            within (timedelta): Length of the traced period.
+            max_hops (int, optional): Maximum number of transfers in a chain.
+                Defaults to 3.
+            min_amount (float, optional): Transfers below this amount in PLN are
+                not followed. Defaults to 0.
+
+        Raises:
+            TypeError: If start is not a datetime or within is not a timedelta.
+            ValueError: If max_hops is not positive.
+
+        Returns:
+            list[dict]: The followed transfers with ``from``, ``to``, ``amount``,
+                ``date`` and ``hop`` (1 for transfers made by the account itself),
+                ordered by hop and time.
+        """
+
+        if not isinstance(start, datetime) or not isinstance(within, timedelta):
+            raise TypeError("Trace period must be a datetime and a timedelta.")
+
+        if max_hops <= 0:
+            raise ValueError("Number of hops must be positive.")
+
+        origin = self.nodes.get(account_number)
+        if origin is None:
+            return []
+
+        begin = (start - EPOCH) // MICROSECOND
+        end = begin + within // MICROSECOND
+        keys = self.window_keys[
+            bisect_left(self.window_keys, begin // self.window) : bisect_right(
+                self.window_keys, end // self.window
+            )
+        ]
+        indexes = [(key, self.windows[key].index()) for key in keys]
+
+        arrival = {origin: begin}
+        frontier = [origin]
+        followed = set()
+        result = []
+
+        for hop in range(1, max_hops + 1):
+            improved = {}
+
+            for node in frontier:
+                since = arrival[node]
+                first = since // self.window
+
+                for key, (senders, offsets, targets, amounts, times) in indexes:
+                    if key < first:
+                        continue
+
+                    row = bisect_left(senders, node)
+                    if row == len(senders) or senders[row] != node:
+                        continue
+
+                    lo = bisect_left(times, since, offsets[row], offsets[row + 1])
+                    hi = bisect_right(times, end, lo, offsets[row + 1])
+
+                    for edge in range(lo, hi):
+                        amount = amounts[edge]
+                        if amount < min_amount:
+                            continue
+
+                        target = targets[edge]
+                        time = times[edge]
+
+                        if (key, edge) not in followed:
+                            followed.add((key, edge))
+                            result.append((hop, time, node, target, amount))
+
+                        best = improved.get(target, arrival.get(target))
+                        if best is None or time < best:
+                            improved[target] = time
+
+            arrival.update(improved)
+            frontier = list(improved)
+
+            if not frontier:
+                break
+
+        result.sort()
+
+        return [
+            {
+                "from": self.names[source],
+                "to": self.names[target],
+                "amount": amount,
+                "date": EPOCH + timedelta(microseconds=time),
+                "hop": hop,
+            }
+            for hop, time, source, target, amount in result
+        ]
+
+    def reachable(self, account_number, start, within, max_hops=3, min_amount=0.0):
+        """Returns the accounts money from an account reached, with the fewest hops.
+
+        Args:
+            account_number (str): The account the money left.
+            start (datetime): Start of the traced period.
+            within (timedelta): Length of the traced period.
+            max_hops (int, optional): Maximum number of transfers in a chain.
+                Defaults to 3.
+            min_amount (float, optional): Transfers below this amount in PLN are
+                not followed. Defaults to 0.
+
+        Returns:
+            dict[str, int]: Hops needed to reach each account.
+        """
+
+        hops = {}
+
+        for edge in self.trace(account_number, start, within, max_hops, min_amount):
+            hops.setdefault(edge["to"], edge["hop"])
+
+        hops.pop(account_number, None)
+
+        return hops
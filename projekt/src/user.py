@@ -2,6 +2,7 @@ import re
 from enum import Enum
 
 from src.bank_account import BankAccount, AccountStatus
+from src.passwords import hash_password, verify_password
 
 
 class UserRole(Enum):
@@ -14,6 +15,19 @@ class UserRole(Enum):
 class User:
     """Class representing a user in Banking System."""
 
+    __slots__ = (
+        "id",
+        "name",
+        "last_name",
+        "email",
+        "password_hash",
+        "phone",
+        "_role",
+        "_banks",
+        "bank_accounts",
+        "__weakref__",
+    )
+
     def __init__(self, id, name, last_name, email, password, phone, role=UserRole.USER):
         """Initializes a new UserAccount instance.
 
@@ -22,7 +36,7 @@ class User:
             name (str): name of the user
             last_name (str): last name of the user
             email (str): email of the user
-            password (str): password of the user
+            password (str): password of the user, stored only as a salted hash
             phone (str): phone number of the user
             role (UserRole): role of the user  | default = UserRole.USER
 
@@ -41,11 +55,38 @@ class User:
         self.name = self._validate_name(name)
         self.last_name = self._validate_lastname(last_name)
         self.email = self._validate_email(email)
-        self.password = self._validate_password(password)
+        self.password_hash = hash_password(self._validate_password(password))
         self.phone = self._validate_phone(phone)
-        self.role = role
+        self._banks = ()
+        self._role = role
         self.bank_accounts = {}
 
+    @property
+    def role(self):
+        """UserRole: Role of the user."""
+
+        return self._role
+
+    @role.setter
+    def role(self, value):
+        previous = self._role
+        self._role = value
+
+        for bank in self._banks:
+            bank.user_role_changed(self, previous)
+
+    def check_password(self, password):
+        """Verifies a password against the stored hash in constant time.
+
+        Args:
+            password (str): The password to check.
+
+        Returns:
+            bool: True if the password matches.
+        """
+
+        return verify_password(password, self.password_hash)
+
     # Methods available for basic user
     def open_bank_account(self, bank, pin_code, currency="PLN", balance=0):
         """
@@ -435,6 +476,100 @@ class User:
 
         return bank.get_users()
 
+    def list_users(self, bank, auth, role=None, offset=0, limit=100):
+        """
+        Retrieves one page of users, optionally filtered by role. Only available to admins.
+
+        Args:
+            bank (Bank): The bank instance from which to fetch users.
+            auth (AuthSystem): The authentication system used to verify if the user is logged in and is an admin.
+            role (UserRole, optional): Only list users with this role.
+            offset (int, optional): Number of matching users to skip. Defaults to 0.
+            limit (int, optional): Maximum page size. Defaults to 100.
+
+        Raises:
+            PermissionError: If the user is not logged in.
+            PermissionError: If the user does not have admin privileges.
+            TypeError: If role is not a UserRole.
+            ValueError: If the offset is negative or the limit is not positive.
+
+        Returns:
+            tuple[list[User], int]: The page and the total number of matching users.
+        """
+
+        if not auth.is_logged_in(self):
+            raise PermissionError("User not logged in")
+        if not auth.is_admin(self):
+            raise PermissionError("U have not permission to perform this action")
+        if role is not None and not isinstance(role, UserRole):
+            raise TypeError("role must be an instance of UserRole enum")
+
+        return bank.list_users(role=role, offset=offset, limit=limit)
+
+    def list_accounts(
+        self, bank, auth, status=None, currency=None, offset=0, limit=100
+    ):
+        """
+        Retrieves one page of bank accounts, optionally filtered by status and currency. Only available to admins.
+
+        Args:
+            bank (Bank): The bank instance from which to fetch accounts.
+            auth (AuthSystem): The authentication system used to verify if the user is logged in and is an admin.
+            status (AccountStatus, optional): Only list accounts with this status.
+            currency (str, optional): Only list accounts in this currency.
+            offset (int, optional): Number of matching accounts to skip. Defaults to 0.
+            limit (int, optional): Maximum page size. Defaults to 100.
+
+        Raises:
+            PermissionError: If the user is not logged in.
+            PermissionError: If the user does not have admin privileges.
+            TypeError: If status is not an AccountStatus or currency is not a string.
+            ValueError: If the offset is negative or the limit is not positive.
+
+        Returns:
+            tuple[list[BankAccount], int]: The page and the total number of matching accounts.
+        """
+
+        if not auth.is_logged_in(self):
+            raise PermissionError("User not logged in")
+        if not auth.is_admin(self):
+            raise PermissionError("U have not permission to perform this action")
+        if status is not None and not isinstance(status, AccountStatus):
+            raise TypeError("status must be an instance of AccountStatus enum")
+        if currency is not None and not isinstance(currency, str):
+            raise TypeError("Bank account currency must be a string")
+
+        return bank.list_accounts(
+            status=status, currency=currency, offset=offset, limit=limit
+        )
+
+    def get_accounts_by_status(self, bank, status, auth):
+        """
+        Retrieves every bank account with the given status. Only available to admins.
+
+        Args:
+            bank (Bank): The bank instance from which to fetch accounts.
+            status (AccountStatus): The account status to look for.
+            auth (AuthSystem): The authentication system used to verify if the user is logged in and is an admin.
+
+        Raises:
+            PermissionError: If the user is not logged in.
+            PermissionError: If the user does not have admin privileges.
+            TypeError: If status is not an AccountStatus.
+
+        Returns:
+            list[BankAccount]: The matching accounts.
+        """
+
+        if not auth.is_logged_in(self):
+            raise PermissionError("User not logged in")
+        if not auth.is_admin(self):
+            raise PermissionError("U have not permission to perform this action")
+        if not isinstance(status, AccountStatus):
+            raise TypeError("status must be an instance of AccountStatus enum")
+
+        return [bank.accounts[number] for number in bank.accounts_by_status[status]]
+
     def update_currencies(self, bank, auth):
         """
         Updates currency exchange rates in the bank system. Only available to admins.
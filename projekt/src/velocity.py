@@ -0,0 +1,318 @@
+import time
+
+
+class SlidingWindowCounter:
+    """Fixed-memory sliding-window counter built on a ring of time buckets."""
+
+    def __init__(self, window, buckets=60):
+        """Initializes a new SlidingWindowCounter instance.
+
+        Args:
+            window (float): Length of the rolling window in seconds.
+            buckets (int, optional): Number of ring buckets the window is split into. Defaults to 60.
+
+        Raises:
+            ValueError: If the window or the number of buckets is not positive.
+        """
+
+        if window <= 0:
+            raise ValueError("Window must be a positive number of seconds")
+
+        if buckets <= 0:
+            raise ValueError("Number of buckets must be positive")
+
+        self.window = float(window)
+        self.buckets = buckets
+        self.bucket_width = self.window / buckets
+        self.counts = [0] * buckets
+        self.sums = [0.0] * buckets
+        self.head = None
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, now, amount=0.0):
+        """Records a single event in the bucket covering the given time.
+
+        Args:
+            now (float): Timestamp of the event in seconds.
+            amount (float, optional): Amount carried by the event. Defaults to 0.
+        """
+
+        self._advance(now)
+
+        slot = self.head % self.buckets
+        self.counts[slot] += 1
+        self.sums[slot] += amount
+        self.count += 1
+        self.total += amount
+
+    def totals(self, now):
+        """Returns the number of events and their summed amount inside the window.
+
+        Args:
+            now (float): Current timestamp in seconds.
+
+        Returns:
+            tuple[int, float]: Event count and amount sum for the rolling window.
+        """
+
+        self._advance(now)
+
+        return self.count, self.total
+
+    def _advance(self, now):
+        """Moves the ring head to the bucket covering ``now``, expiring old buckets.
+
+        The cost is bounded by the number of buckets, independent of traffic.
+
+        Args:
+            now (float): Current timestamp in seconds.
+        """
+
+        index = int(now // self.bucket_width)
+
+        if self.head is None:
+            self.head = index
+            return
+
+        steps = index - self.head
+
+        if steps <= 0:
+            return
+
+        if steps >= self.buckets:
+            self.counts = [0] * self.buckets
+            self.sums = [0.0] * self.buckets
+            self.count = 0
+            self.total = 0.0
+        else:
+            for position in range(self.head + 1, index + 1):
+                slot = position % self.buckets
+                self.count -= self.counts[slot]
+                self.total -= self.sums[slot]
+                self.counts[slot] = 0
+                self.sums[slot] = 0.0
+
+            if self.count == 0:
+                self.total = 0.0
+
+        self.head = index
+
+
+class VelocityLimit:
+    """Class describing a rolling velocity limit such as "5 withdrawals / 1000 PLN per hour"."""
+
+    def __init__(
+        self,
+        max_count=None,
+        max_amount=None,
+        window=3600,
+        buckets=60,
+        operations=("withdraw", "transfer", "interbank_transfer"),
+    ):
+        """Initializes a new VelocityLimit instance.
+
+        Args:
+            max_count (int, optional): Maximum number of operations inside the window.
+            max_amount (float, optional): Maximum summed amount in PLN inside the window.
+            window (float, optional): Length of the rolling window in seconds. Defaults to one hour.
+            buckets (int, optional): Number of ring buckets per counter. Defaults to 60.
+            operations (tuple[str], optional): Operation types the limit applies to.
+
+        Raises:
+            ValueError: If neither a count nor an amount limit is given.
+        """
+
+        if max_count is None and max_amount is None:
+            raise ValueError("Velocity limit needs a maximum count or amount")
+
+        self.max_count = max_count
+        self.max_amount = max_amount
+        self.window = window
+        self.buckets = buckets
+        self.operations = frozenset(operations)
+
+    def allows(self, count, total, amount):
+        """Checks whether one more operation of the given amount fits into the limit.
+
+        Args:
+            count (int): Number of operations already inside the window.
+            total (float): Amount already used inside the window.
+            amount (float): Amount of the new operation.
+
+        Returns:
+            bool: True if the operation stays within the limit.
+        """
+
+        if self.max_count is not None and count + 1 > self.max_count:
+            return False
+
+        if self.max_amount is not None and total + amount > self.max_amount:
+            return False
+
+        return True
+
+
+class VelocityLimiter:
+    """Per-account and per-user velocity limits consulted before withdrawals and transfers.
+
+    A transfer made through another bank is filed in that bank's ledger, so the
+    limiter also listens to every bank its accounts transfer through.
+    """
+
+    def __init__(self, bank, account_limits=(), user_limits=(), clock=time.time):
+        """Initializes a new VelocityLimiter and attaches it to the bank.
+
+        Args:
+            bank (Bank): The bank whose withdrawals and transfers are limited.
+            account_limits (Iterable[VelocityLimit], optional): Limits applied per account.
+            user_limits (Iterable[VelocityLimit], optional): Limits applied per account owner.
+            clock (callable, optional): Returns the current time in seconds. Defaults to time.time.
+        """
+
+        self.bank = bank
+        self.clock = clock
+        self.limits = [("account", limit) for limit in account_limits] + [
+            ("user", limit) for limit in user_limits
+        ]
+        self.counters = {}
+        self.banks = {id(bank)}
+
+        bank.add_pre_commit_check(self.check)
+        bank.add_transaction_listener(self.record)
+
+    def check(self, account, operation, amount, to_account=None):
+        """Rejects the operation if it would exceed any applicable velocity limit.
+
+        Args:
+            account (BankAccount): The account the operation is performed on.
+            operation (str): Operation type, e.g. 'withdraw' or 'transfer'.
+            amount (float): Amount in the account's currency.
+            to_account (BankAccount, optional): Recipient account of a transfer.
+
+        Raises:
+            PermissionError: If the operation exceeds a velocity limit.
+        """
+
+        if to_account is not None and id(to_account.bank) not in self.banks:
+            self.banks.add(id(to_account.bank))
+            to_account.bank.add_transaction_listener(self.record)
+
+        now = self.clock()
+        amount = self._to_pln(account, amount)
+
+        for index, (scope, limit) in enumerate(self.limits):
+            if operation not in limit.operations:
+                continue
+
+            counter = self.counters.get((index, self._scope_key(scope, account)))
+            if counter is None:
+                count, total = 0, 0.0
+            else:
+                count, total = counter.totals(now)
+
+            if not limit.allows(count, total, amount):
+                raise PermissionError("Velocity limit exceeded.")
+
+    def record(self, transaction, account_number):
+        """Counts a committed outgoing operation in the matching windows.
+
+        Entries are counted for accounts of the limiter's bank, whichever bank's
+        ledger they were filed in.
+
+        Args:
+            transaction (dict): The transaction added to the ledger.
+            account_number (str): The account the transaction belongs to.
+        """
+
+        operation = transaction["type"]
+        account = self.bank.accounts.get(account_number)
+
+        if account is None:
+            return
+
+        now = self.clock()
+        amount = None
+
+        for index, (scope, limit) in enumerate(self.limits):
+            if operation not in limit.operations:
+                continue
+
+            if amount is None:
+                amount = self._to_pln(account, transaction["amount"])
+
+            key = (index, self._scope_key(scope, account))
+            counter = self.counters.get(key)
+            if counter is None:
+                counter = SlidingWindowCounter(limit.window, limit.buckets)
+                self.counters[key] = counter
+
+            counter.add(now, amount)
+
+    def evaluate_batch(self, pending):
+        """Scores a batch of pending operations against the limits without applying them.
+
+        Operations are evaluated in order and every allowed one counts against the
+        limits of the operations that follow it.
+
+        Args:
+            pending (Iterable[tuple[str, str, float]]): Tuples of account number,
+                operation type and amount.
+
+        Raises:
+            ValueError: If an account in the batch does not exist.
+
+        Returns:
+            list[bool]: For every pending operation, whether it would be allowed.
+        """
+
+        now = self.clock()
+        usage = {}
+        results = []
+
+        for account_number, operation, amount in pending:
+            account = self.bank.accounts.get(account_number)
+            if account is None:
+                raise ValueError(f"Account {account_number} not found.")
+
+            amount = self._to_pln(account, float(amount))
+            keys = []
+            allowed = True
+
+            for index, (scope, limit) in enumerate(self.limits):
+                if operation not in limit.operations:
+                    continue
+
+                key = (index, self._scope_key(scope, account))
+                if key not in usage:
+                    counter = self.counters.get(key)
+                    usage[key] = list(counter.totals(now)) if counter else [0, 0.0]
+
+                count, total = usage[key]
+                if not limit.allows(count, total, amount):
+                    allowed = False
+                    break
+
+                keys.append(key)
+
+            if allowed:
+                for key in keys:
+                    usage[key][0] += 1
+                    usage[key][1] += amount
+
+            results.append(allowed)
+
+        return results
+
+    def _scope_key(self, scope, account):
+        """Returns the counter key of an account for the given limit scope."""
+
+        if scope == "user":
+            return account.owner.id
+
+        return account.account_number
+
+    def _to_pln(self, account, amount):
+        """Converts an amount in the account's currency to PLN."""
+
+        return amount * self.bank.currencies.get(account.currency, 1.0)
@@ -0,0 +1,244 @@
+import random
+import time
+from datetime import datetime, timedelta
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+from src.auth import Auth
+from src.bank import Bank
+from src.user import User
+
+LOCAL_RATES = {
+    "PLN": 1.0,
+    "USD": 3.7642,
+    "EUR": 4.2757,
+    "GBP": 5.0205,
+    "CHF": 4.5595,
+}
+
+DEFAULT_MIX = {
+    "deposit": 30,
+    "withdraw": 25,
+    "transfer": 25,
+    "change_currency": 5,
+    "get_transactions": 10,
+    "get_transactions_by_date": 5,
+}
+
+FIRST_NAMES = ("Anna", "Jan", "Piotr", "Maria", "Katarzyna", "Tomasz", "Ewa", "Adam")
+LAST_NAMES = ("Nowak", "Kowalski", "Wisniewska", "Wojcik", "Kaminski", "Lewandowska")
+
+
+class WorkloadGenerator:
+    """Deterministic, seedable generator of users, accounts and operations.
+
+    The same seed always produces the same users and the same operation sequence.
+    Exchange rates come from a local table, so nothing touches the network.
+    """
+
+    def __init__(self, users=1000, mix=None, currencies=None, seed=0):
+        """Initializes a new WorkloadGenerator instance.
+
+        Args:
+            users (int, optional): Number of users, each with one account.
+                Defaults to 1000.
+            mix (dict[str, int], optional): Relative weight of each operation.
+                Defaults to DEFAULT_MIX.
+            currencies (dict[str, float], optional): Local exchange rates.
+                Defaults to LOCAL_RATES.
+            seed (int, optional): Random seed. Defaults to 0.
+
+        Raises:
+            ValueError: If fewer than two users are requested, or the mix is empty
+                or names an unknown operation.
+        """
+
+        mix = DEFAULT_MIX if mix is None else mix
+
+        if users < 2:
+            raise ValueError("Workload needs at least two users.")
+
+        if not mix or any(operation not in DEFAULT_MIX for operation in mix):
+            raise ValueError("Unknown operation in workload mix.")
+
+        self.users = users
+        self.mix = dict(mix)
+        self.currencies = dict(LOCAL_RATES if currencies is None else currencies)
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.bank = None
+        self.auth = None
+        self.accounts = []
+
+    def build(self):
+        """Creates the bank, logs in the users and opens their accounts.
+
+        Returns:
+            Bank: The populated bank.
+        """
+
+        rng = self.random
+        self.bank = Bank("Load Test Bank", "9999", currencies=dict(self.currencies))
+        self.auth = Auth()
+        self.accounts = []
+        codes = sorted(self.currencies)
+
+        for user_id in range(self.users):
+            name = rng.choice(FIRST_NAMES)
+            last_name = rng.choice(LAST_NAMES)
+            password = f"Load{rng.randrange(10**6):06d}!a"
+            user = User(
+                id=user_id,
+                name=name,
+                last_name=last_name,
+                email=f"{name}.{last_name}{user_id}@example.com".lower(),
+                password=password,
+                phone=f"{rng.choice('45678')}{rng.randrange(10**8):08d}",
+            )
+            self.auth.login(user, user.email, password)
+
+            pin_code = f"{rng.randrange(10**6):06d}"
+            user.open_bank_account(
+                self.bank,
+                pin_code,
+                currency=rng.choice(codes),
+                balance=rng.randint(1000, 100000),
+            )
+            self.accounts.append((user, next(iter(user.bank_accounts)), pin_code))
+
+        return self.bank
+
+    def operations(self, count):
+        """Yields a deterministic stream of operations on the built bank.
+
+        Args:
+            count (int): Number of operations.
+
+        Raises:
+            ValueError: If the bank was not built yet.
+
+        Yields:
+            tuple[str, callable, tuple]: Operation name, bound User method and its
+                arguments.
+        """
+
+        if self.bank is None:
+            raise ValueError("Workload bank must be built first.")
+
+        rng = self.random
+        names = list(self.mix)
+        weights = list(self.mix.values())
+        codes = sorted(self.currencies)
+        auth = self.auth
+
+        for name in rng.choices(names, weights, k=count):
+            user, account_number, pin_code = rng.choice(self.accounts)
+
+            if name in ("deposit", "withdraw"):
+                args = (rng.randint(1, 500), account_number, pin_code, auth)
+            elif name == "transfer":
+                _, target, _ = rng.choice(self.accounts)
+                args = (
+                    rng.randint(1, 500),
+                    account_number,
+                    target,
+                    pin_code,
+                    self.bank,
+                    auth,
+                )
+            elif name == "change_currency":
+                args = (account_number, rng.choice(codes), auth, pin_code)
+            elif name == "get_transactions":
+                args = (account_number, auth)
+            else:
+                date_to = datetime.now()
+                date_from = date_to - timedelta(minutes=rng.randint(1, 60))
+                args = (account_number, date_from, date_to, auth)
+
+            yield name, getattr(user, name), args
+
+
+def _peak_rss_kb():
+    """Returns the peak resident set size of the process in KiB, if known."""
+
+    if resource is None:
+        return None
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _percentile(values, fraction):
+    """Returns the value below which the given fraction of sorted values falls."""
+
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def run_workload(operations, clock=time.perf_counter):
+    """Executes operations and measures them per operation type.
+
+    Failed operations (for example a withdrawal above the balance) are counted as
+    errors and still contribute their latency. Growth of the process's peak RSS
+    is attributed to the operation during which it happened.
+
+    Args:
+        operations (Iterable[tuple[str, callable, tuple]]): Operations, as yielded
+            by ``WorkloadGenerator.operations``.
+        clock (callable, optional): High-resolution timer. Defaults to
+            time.perf_counter.
+
+    Returns:
+        dict: ``elapsed``, ``operations``, ``throughput``, ``peak_rss_kb`` and
+            ``by_operation``, which maps each operation to its ``count``,
+            ``errors``, ``throughput`` (calls per second spent in it),
+            ``p50``/``p90``/``p99``/``max`` latency in seconds and
+            ``rss_growth_kb``.
+    """
+
+    latencies = {}
+    errors = {}
+    rss_growth = {}
+    peak = _peak_rss_kb()
+    start = clock()
+
+    for name, method, args in operations:
+        begin = clock()
+        try:
+            method(*args)
+        except (ValueError, TypeError, PermissionError):
+            errors[name] = errors.get(name, 0) + 1
+        latencies.setdefault(name, []).append(clock() - begin)
+
+        if peak is not None:
+            current = _peak_rss_kb()
+            if current > peak:
+                rss_growth[name] = rss_growth.get(name, 0) + current - peak
+                peak = current
+
+    elapsed = clock() - start
+    total = sum(len(values) for values in latencies.values())
+    by_operation = {}
+
+    for name, values in sorted(latencies.items()):
+        spent = sum(values)
+        values.sort()
+        by_operation[name] = {
+            "count": len(values),
+            "errors": errors.get(name, 0),
+            "throughput": len(values) / spent if spent else 0.0,
+            "p50": _percentile(values, 0.5),
+            "p90": _percentile(values, 0.9),
+            "p99": _percentile(values, 0.99),
+            "max": values[-1],
+            "rss_growth_kb": rss_growth.get(name, 0),
+        }
+
+    return {
+        "elapsed": elapsed,
+        "operations": total,
+        "throughput": total / elapsed if elapsed else 0.0,
+        "peak_rss_kb": peak,
+        "by_operation": by_operation,
+    }
@@ -0,0 +1,5 @@
+from src.passwords import PasswordHasher, set_default_hasher
+
+# Production-strength key derivation would dominate the run time of a suite that
+# creates hundreds of users; test_passwords exercises the real defaults.
+set_default_hasher(PasswordHasher(cost=4))
@@ -0,0 +1,204 @@
+import random
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from src.analytics import (
+    CountMinSketch,
+    HeavyHitters,
+    KLLSketch,
+    TopN,
+    TransactionAnalytics,
+)
+from src.bank import Bank
+from src.bank_account import BankAccount
+from src.clearing_house import ClearingHouse
+from src.user import User
+
+
+class TestSketches(unittest.TestCase):
+    """Test cases for the streaming aggregators."""
+
+    def test_top_n(self):
+        """Test that only the largest items are kept."""
+        top = TopN(3)
+        for value in [5, 1, 9, 3, 7, 2]:
+            top.add(value, str(value))
+
+        self.assertEqual(top.items(), [(9, "9"), (7, "7"), (5, "5")])
+
+        with self.assertRaises(ValueError):
+            TopN(0)
+
+    def test_kll_quantiles(self):
+        """Test quantile accuracy and bounded memory."""
+        sketch = KLLSketch(k=200, seed=1)
+        rng = random.Random(0)
+        for _ in range(100000):
+            sketch.add(rng.random())
+
+        self.assertEqual(len(sketch), 100000)
+        self.assertAlmostEqual(sketch.quantile(0.5), 0.5, delta=0.02)
+        self.assertAlmostEqual(sketch.quantile(0.99), 0.99, delta=0.02)
+        self.assertLess(sketch.size, 1000)
+
+    def test_kll_invalid(self):
+        """Test invalid sketch parameters and queries."""
+        with self.assertRaises(ValueError):
+            KLLSketch(k=2)
+
+        with self.assertRaises(ValueError):
+            KLLSketch().quantile(0.5)
+
+        sketch = KLLSketch()
+        sketch.add(1)
+        with self.assertRaises(ValueError):
+            sketch.quantile(1.5)
+
+    def test_count_min_never_undercounts(self):
+        """Test that estimates are at least the true totals."""
+        sketch = CountMinSketch(width=16, depth=3)
+        for index in range(200):
+            sketch.add(f"key{index % 40}", 2)
+
+        for index in range(40):
+            self.assertGreaterEqual(sketch.estimate(f"key{index}"), 10)
+
+        with self.assertRaises(ValueError):
+            CountMinSketch(width=0)
+
+    def test_heavy_hitters(self):
+        """Test that dominant keys are found among many light ones."""
+        hitters = HeavyHitters(k=3)
+        for index in range(5000):
+            hitters.add(f"light{index % 500}")
+            if index % 10 == 0:
+                hitters.add("heavy", 20)
+            if index % 20 == 0:
+                hitters.add("medium", 20)
+
+        top = [key for key, _ in hitters.top()]
+
+        self.assertEqual(top[:2], ["heavy", "medium"])
+        self.assertEqual(len(hitters.candidates), 3)
+
+
+class TestTransactionAnalytics(unittest.TestCase):
+    """Test cases for the TransactionAnalytics class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.bank = Bank(
+            name="PKO BP", bank_code="1120", currencies={"PLN": 1.0, "EUR": 4.0}
+        )
+        self.analytics = TransactionAnalytics(self.bank, top_n=2, seed=1)
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+
+        self.pln = BankAccount(self.user, self.bank, "123456", balance=10000)
+        self.eur = BankAccount(
+            self.user, self.bank, "123456", balance=10000, currency="EUR"
+        )
+
+    def test_largest_transfers_per_day(self):
+        """Test ranking transfers of each day by their PLN value."""
+        with patch("src.bank_account.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2024, 5, 1, 12)
+            self.pln.transfer(300, self.eur.account_number, "123456", self.bank)
+            self.eur.transfer(100, self.pln.account_number, "123456", self.bank)
+            self.pln.transfer(50, self.eur.account_number, "123456", self.bank)
+
+            mock_datetime.now.return_value = datetime(2024, 5, 2, 12)
+            self.pln.transfer(10, self.eur.account_number, "123456", self.bank)
+
+        largest = self.analytics.largest_transfers(datetime(2024, 5, 1).date())
+
+        self.assertEqual(
+            [(amount, number) for amount, number, _ in largest],
+            [(400.0, self.eur.account_number), (300.0, self.pln.account_number)],
+        )
+        self.assertEqual(
+            len(self.analytics.largest_transfers(datetime(2024, 5, 2).date())), 1
+        )
+        self.assertEqual(
+            self.analytics.largest_transfers(datetime(2024, 5, 3).date()), []
+        )
+
+    def test_old_days_are_dropped(self):
+        """Test that only the configured number of days is retained."""
+        self.analytics.days = 2
+        for day in (1, 2, 3):
+            self.bank.add_new_transaction(
+                {"type": "transfer", "amount": 1, "date": datetime(2024, 5, day)},
+                self.pln.account_number,
+            )
+
+        self.assertEqual(sorted(day.day for day in self.analytics.transfers), [2, 3])
+
+    def test_quantiles_per_currency(self):
+        """Test that amounts are sketched separately for each currency."""
+        for amount in range(1, 101):
+            self.pln.deposit(amount, "123456")
+        self.eur.deposit(5, "123456")
+
+        self.assertAlmostEqual(self.analytics.quantile("PLN", 0.5), 50, delta=2)
+        self.assertEqual(self.analytics.quantile("EUR", 0.99), 5)
+
+        with self.assertRaises(ValueError):
+            self.analytics.quantile("USD", 0.5)
+
+    def test_heaviest_accounts_skip_incoming_legs(self):
+        """Test volume ranking counts each movement once, in PLN."""
+        self.pln.deposit(100, "123456")
+        self.eur.deposit(100, "123456")
+        self.pln.transfer(50, self.eur.account_number, "123456", self.bank)
+        self.eur.change_currency("PLN", "123456")
+
+        heaviest = self.analytics.heaviest_accounts()
+
+        self.assertEqual(heaviest[0], (self.eur.account_number, 400.0))
+        self.assertEqual(heaviest[1], (self.pln.account_number, 150.0))
+
+    def test_refunds_are_not_outflows(self):
+        """Test that a refunded interbank transfer is counted once."""
+        other = Bank(name="mBank", bank_code="1140", currencies={"PLN": 1.0})
+        clearing_house = ClearingHouse([self.bank, other])
+
+        clearing_house.submit(self.pln, "1140", "000", 200, "123456")
+        clearing_house.settle()
+
+        self.assertEqual(
+            self.bank.transactions[self.pln.account_number][-1]["type"],
+            "interbank_refund",
+        )
+        self.assertEqual(len(self.analytics.sketches["PLN"]), 1)
+        self.assertEqual(
+            self.analytics.heaviest_accounts()[0], (self.pln.account_number, 200.0)
+        )
+
+    def test_accounts_of_other_banks_are_skipped(self):
+        """Test that ledger entries of accounts the bank does not hold are ignored."""
+        other = Bank(name="mBank", bank_code="1140", currencies={"PLN": 1.0})
+        foreign = BankAccount(self.user, other, "123456", balance=1000)
+
+        foreign.transfer(300, self.eur.account_number, "123456", self.bank)
+
+        self.assertNotIn("PLN", self.analytics.sketches)
+        self.assertEqual(self.analytics.heaviest_accounts(), [])
+        self.assertEqual(self.analytics.largest_transfers(datetime.now().date()), [])
+
+    def test_invalid_days(self):
+        """Test creating analytics with a non-positive retention."""
+        with self.assertRaises(ValueError):
+            TransactionAnalytics(self.bank, days=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+import asyncio
+import csv
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.async_bank import AsyncBank, AsyncUser
+from src.auth import Auth
+from src.bank import Bank
+from src.storage import SQLiteStorage
+from src.user import User, UserRole
+
+
+class TestAsyncBank(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the AsyncBank and AsyncUser classes."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.bank = Bank(
+            name="PKO BP", bank_code="1120", currencies={"PLN": 1.0, "EUR": 4.0}
+        )
+        self.async_bank = AsyncBank(self.bank)
+        self.auth = Auth()
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+        self.admin = User(
+            id=2,
+            name="Admin",
+            last_name="User",
+            email="admin@example.com",
+            password="Admin123!",
+            phone="789456123",
+            role=UserRole.ADMIN,
+        )
+        self.auth.login(self.user, "john.doe@example.com", "Password123!")
+        self.auth.login(self.admin, "admin@example.com", "Admin123!")
+
+        self.async_user = AsyncUser(self.user, self.auth)
+        self.async_admin = AsyncUser(self.admin, self.auth)
+
+    async def test_inline_operations(self):
+        """Test that account operations work through the async facade."""
+        await self.async_user.open_bank_account(self.bank, "123456", balance=100)
+        account_number = next(iter(self.user.bank_accounts))
+
+        await self.async_user.deposit(50, account_number, "123456")
+        await self.async_user.withdraw(30, account_number, "123456")
+        balance = await self.async_user.get_balance(account_number)
+        transactions = await self.async_bank.get_transactions(account_number)
+
+        self.assertEqual(balance, "120.0 PLN")
+        self.assertEqual(len(transactions), 2)
+
+    async def test_inline_operation_requires_login(self):
+        """Test that the wrapped operations still check authentication."""
+        self.auth.logout(self.user)
+
+        with self.assertRaises(PermissionError):
+            await self.async_user.get_total_balance()
+
+    async def test_update_currencies_runs_in_executor(self):
+        """Test that rate fetching runs off the event loop thread."""
+        threads = []
+
+        def fetch():
+            threads.append(threading.current_thread())
+            return {"PLN": 1.0, "EUR": 4.5}
+
+        with patch.object(self.bank, "_fetch_currencies", side_effect=fetch):
+            result = await self.async_admin.update_currencies(self.async_bank)
+
+        self.assertTrue(result)
+        self.assertEqual(self.bank.currencies["EUR"], 4.5)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    async def test_concurrent_refreshes_share_one_request(self):
+        """Test that concurrent refreshes are coalesced into one fetch."""
+        calls = []
+        release = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {"PLN": 1.0, "EUR": 4.5}
+
+        with patch.object(self.bank, "_fetch_currencies", side_effect=fetch):
+            refreshes = [
+                asyncio.create_task(self.async_bank.update_currencies())
+                for _ in range(10)
+            ]
+            await asyncio.sleep(0.05)
+            release.set()
+            results = await asyncio.gather(*refreshes)
+
+        self.assertEqual(results, [True] * 10)
+        self.assertEqual(len(calls), 1)
+
+    async def test_update_currencies_requires_admin(self):
+        """Test that only admins can refresh exchange rates."""
+        with self.assertRaises(PermissionError):
+            await self.async_user.update_currencies(self.async_bank)
+
+    async def test_export_transactions(self):
+        """Test exporting an account's transactions to CSV."""
+        await self.async_user.open_bank_account(self.bank, "123456", balance=100)
+        account_number = next(iter(self.user.bank_accounts))
+        await self.async_user.deposit(50, account_number, "123456")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "export.csv")
+            count = await self.async_bank.export_transactions(account_number, path)
+
+            with open(path, newline="", encoding="utf-8") as file:
+                rows = list(csv.DictReader(file))
+
+        self.assertEqual(count, 1)
+        self.assertEqual(rows[0]["type"], "deposit")
+        self.assertEqual(rows[0]["amount"], "50.0")
+
+    async def test_storage_calls_leave_the_event_loop(self):
+        """Test that calls on a storage-backed bank run on the storage's worker."""
+        storage = SQLiteStorage(":memory:")
+        bank = Bank(
+            name="mBank", bank_code="1140", currencies={"PLN": 1.0}, storage=storage
+        )
+        async_bank = AsyncBank(bank)
+        async_user = AsyncUser(self.user, self.auth, storage=storage)
+        threads = []
+
+        def on_thread(function):
+            def call(*args):
+                threads.append(threading.current_thread())
+                return function(*args)
+
+            return call
+
+        with patch.object(
+            storage, "add_transaction", on_thread(storage.add_transaction)
+        ), patch.object(
+            storage, "get_transactions", on_thread(storage.get_transactions)
+        ):
+            await async_user.open_bank_account(bank, "123456", balance=100)
+            account_number = next(iter(self.user.bank_accounts))
+            await async_user.deposit(50, account_number, "123456")
+            transactions = await async_bank.get_transactions(account_number)
+            balance = await async_user.get_balance(account_number)
+
+        self.assertEqual([tx["amount"] for tx in transactions], [50.0])
+        self.assertEqual(balance, "150.0 PLN")
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.current_thread(), threads)
+        self.assertIs(async_user.storage_executor, async_bank.storage_executor)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,8 @@ from unittest.mock import patch, Mock
 from datetime import datetime
 
 from src.bank import Bank
-from src.user import User
+from src.bank_account import AccountStatus, BankAccount
+from src.user import User, UserRole
 
 
 # noinspection PyTypeChecker
@@ -73,6 +74,18 @@ class TestBank(unittest.TestCase):
         self.assertAlmostEqual(gbp_rate, 5.0205)
         self.assertAlmostEqual(chf_rate, 4.5595)
 
+    @patch("src.bank.Bank._fetch_currencies")
+    def test_bank_initialization_with_currencies(self, mock_fetch):
+        """Test bank initialization with a preloaded rate table."""
+
+        currencies = {"PLN": 1.0, "USD": 3.7642}
+
+        bank = Bank(name="PKO BP", bank_code="1120", currencies=currencies)
+
+        self.assertEqual(bank.currencies, currencies)
+        self.assertIsNot(bank.currencies, currencies)
+        mock_fetch.assert_not_called()
+
     @patch("src.bank.requests.get")
     def test_fetch_currencies_success(self, mock_get):
         """Test successful fetching of currency rates."""
@@ -237,6 +250,32 @@ class TestBank(unittest.TestCase):
         self.assertEqual(first_transaction, transaction)
         self.assertEqual(second_transaction, transaction2)
 
+    def test_add_transaction_listener(self):
+        """Test that transaction listeners are notified about new transactions."""
+
+        account_number = "123456789"
+        transaction = {"type": "deposit", "amount": 1000, "date": datetime.now()}
+        received = []
+
+        self.bank.add_transaction_listener(
+            lambda tx, number: received.append((tx, number))
+        )
+        self.bank.add_new_transaction(
+            transaction=transaction, account_number=account_number
+        )
+
+        self.assertEqual(received, [(transaction, account_number)])
+
+    def test_add_pre_commit_check(self):
+        """Test registering a pre-commit check."""
+
+        def check(account, operation, amount, to_account):
+            return None
+
+        self.bank.add_pre_commit_check(check)
+
+        self.assertEqual(self.bank.pre_commit_checks, [check])
+
     def test_get_transactions(self):
         """Test retrieving all transactions for an account."""
         account_number = "123456789"
@@ -271,6 +310,260 @@ class TestBank(unittest.TestCase):
 
         self.assertEqual(transactions, [])
 
+    def test_execute_bulk(self):
+        """Test running several account operations in one call."""
+        source = BankAccount(self.user1, self.bank, "123456", balance=100)
+        target = BankAccount(self.user2, self.bank, "654321")
+
+        results = self.bank.execute_bulk(
+            [
+                (source.account_number, "deposit", 50, "123456"),
+                (target.account_number, "withdraw", 10, "654321"),
+                ("missing", "deposit", 1, "123456"),
+                (
+                    source.account_number,
+                    "transfer",
+                    30,
+                    target.account_number,
+                    "123456",
+                    self.bank,
+                ),
+            ]
+        )
+
+        self.assertEqual(
+            [success for success, _ in results], [True, False, False, True]
+        )
+        self.assertIsInstance(results[1][1], ValueError)
+        self.assertEqual(source.balance, 120)
+        self.assertEqual(target.balance, 30)
+
+        with self.assertRaises(ValueError):
+            self.bank.execute_bulk(
+                [
+                    (source.account_number, "deposit", 1, "123456"),
+                    (source.account_number, "__init__"),
+                ]
+            )
+
+        self.assertEqual(source.balance, 120)
+
+    def test_account_indexes_follow_changes(self):
+        """Test that status and currency indexes track account changes."""
+        account = BankAccount(self.user1, self.bank, "123456", balance=10)
+        number = account.account_number
+
+        self.assertIn(number, self.bank.accounts_by_status[AccountStatus.ACTIVE])
+        self.assertIn(number, self.bank.accounts_by_currency["PLN"])
+
+        account.change_currency("EUR", "123456")
+        account.status = AccountStatus.LOCKED
+
+        self.assertNotIn(number, self.bank.accounts_by_status[AccountStatus.ACTIVE])
+        self.assertIn(number, self.bank.accounts_by_status[AccountStatus.LOCKED])
+        self.assertNotIn(number, self.bank.accounts_by_currency["PLN"])
+        self.assertIn(number, self.bank.accounts_by_currency["EUR"])
+
+    def test_list_accounts(self):
+        """Test paginated and filtered account listing."""
+        accounts = [
+            BankAccount(self.user1, self.bank, "123456", currency=currency)
+            for currency in ("PLN", "EUR", "PLN", "EUR", "PLN")
+        ]
+        accounts[1].status = AccountStatus.LOCKED
+        accounts[2].status = AccountStatus.LOCKED
+
+        self.assertEqual(
+            self.bank.list_accounts(status=AccountStatus.LOCKED),
+            ([accounts[1], accounts[2]], 2),
+        )
+        self.assertEqual(
+            self.bank.list_accounts(currency="pln", offset=1, limit=1),
+            ([accounts[2]], 3),
+        )
+        self.assertEqual(
+            self.bank.list_accounts(status=AccountStatus.ACTIVE, currency="PLN"),
+            ([accounts[0], accounts[4]], 2),
+        )
+        self.assertEqual(self.bank.list_accounts(status=AccountStatus.CLOSED), ([], 0))
+
+        page, total = self.bank.list_accounts(offset=4)
+        self.assertEqual(total, len(self.bank.accounts))
+        self.assertEqual(page, list(self.bank.accounts.values())[4:])
+
+        with self.assertRaises(ValueError):
+            self.bank.list_accounts(offset=-1)
+
+        with self.assertRaises(ValueError):
+            self.bank.list_accounts(limit=0)
+
+    def test_list_users_by_role(self):
+        """Test the role index and role changes."""
+        self.assertEqual(
+            self.bank.list_users(role=UserRole.USER), ([self.user1, self.user2], 2)
+        )
+        self.assertEqual(self.bank.list_users(role=UserRole.ADMIN), ([], 0))
+
+        self.bank.change_user_role(self.user2, UserRole.ADMIN)
+
+        self.assertEqual(self.user2.role, UserRole.ADMIN)
+        self.assertEqual(self.bank.list_users(role=UserRole.ADMIN), ([self.user2], 1))
+        self.assertEqual(self.bank.list_users(limit=1), ([self.user1], 2))
+
+        stranger = User(
+            id=3,
+            name="Alice",
+            last_name="Johnson",
+            email="alice@example.com",
+            password="Password789!",
+            phone="567891234",
+        )
+        with self.assertRaises(ValueError):
+            self.bank.change_user_role(stranger, UserRole.ADMIN)
+
+    def test_role_index_follows_role_changes(self):
+        """Test that direct role assignments and re-added users update the index."""
+        self.user1.role = UserRole.ADMIN
+
+        self.assertEqual(self.bank.list_users(role=UserRole.ADMIN), ([self.user1], 1))
+        self.assertEqual(self.bank.list_users(role=UserRole.USER), ([self.user2], 1))
+
+        replacement = User(
+            id=self.user1.id,
+            name="Alice",
+            last_name="Johnson",
+            email="alice@example.com",
+            password="Password789!",
+            phone="567891234",
+        )
+        self.bank.add_user(replacement)
+        self.user1.role = UserRole.USER
+
+        self.assertEqual(self.bank.list_users(role=UserRole.ADMIN), ([], 0))
+        self.assertEqual(
+            self.bank.list_users(role=UserRole.USER), ([self.user2, replacement], 2)
+        )
+
+    def test_open_accounts_bulk(self):
+        """Test bulk account opening with per-row failures."""
+        users = [
+            User(
+                id=10 + index,
+                name="Anna",
+                last_name="Nowak",
+                email=f"anna{index}@example.com",
+                password="Password123!",
+                phone="781234567",
+            )
+            for index in range(3)
+        ]
+        existing = BankAccount(self.user1, self.bank, "123456")
+        self.user1.bank_accounts[existing.account_number] = existing
+
+        results = self.bank.open_accounts_bulk(
+            [
+                (users[0], "123456"),
+                (users[1], "654321", "EUR", 250),
+                (users[2], "12345"),
+                (users[2], "123456", "XYZ"),
+                (users[2], "123456", "PLN", -1),
+                ("owner", "123456"),
+                (users[0], "111111"),
+                (self.user1, "123456"),
+                (users[2], "123456", "USD", "100"),
+            ]
+        )
+
+        self.assertEqual(
+            [success for success, _ in results], [True, True] + [False] * 6 + [True]
+        )
+        self.assertIsInstance(results[2][1], ValueError)
+        self.assertIsInstance(results[5][1], TypeError)
+        self.assertIn("already have", str(results[6][1]))
+        self.assertIn("already have", str(results[7][1]))
+
+        account = self.bank.accounts[results[1][1]]
+        self.assertEqual(len(account.account_number), 26)
+        self.assertTrue(account.account_number.startswith("1120"))
+        self.assertEqual(account.currency, "EUR")
+        self.assertEqual(account.balance, 250)
+        self.assertIs(users[1].bank_accounts[account.account_number], account)
+        self.assertIs(self.bank.get_user(11), users[1])
+        self.assertIn(account.account_number, self.bank.accounts_by_currency["EUR"])
+
+        account.withdraw(50, "654321")
+        self.assertEqual(account.balance, 200)
+
+    def test_open_accounts_bulk_malformed_rows(self):
+        """Test that rows missing fields fail alone instead of aborting the batch."""
+        results = self.bank.open_accounts_bulk(
+            [(self.user1,), None, (self.user2, "123456")]
+        )
+
+        self.assertEqual([success for success, _ in results], [False, False, True])
+        self.assertIsInstance(results[0][1], ValueError)
+        self.assertIsInstance(results[1][1], ValueError)
+        self.assertIn(results[2][1], self.bank.accounts)
+
+    def test_open_accounts_bulk_numbers_are_unique(self):
+        """Test that a large batch gets distinct account numbers."""
+        results = self.bank.open_accounts_bulk(
+            (
+                User(
+                    id=100 + index,
+                    name="Anna",
+                    last_name="Nowak",
+                    email=f"anna{index}@example.com",
+                    password="Password123!",
+                    phone="781234567",
+                ),
+                "123456",
+            )
+            for index in range(2000)
+        )
+
+        numbers = {number for _, number in results}
+        self.assertEqual(len(numbers), 2000)
+        self.assertTrue(numbers <= set(self.bank.accounts))
+
+    def test_get_transactions_by_date_out_of_order(self):
+        """Test date filtering on a ledger whose entries are not in date order."""
+        account_number = "123456789"
+
+        for month in (3, 1, 2):
+            self.bank.add_new_transaction(
+                {"type": "deposit", "amount": month, "date": datetime(2023, month, 1)},
+                account_number,
+            )
+
+        transactions = self.bank.get_transactions_by_date(
+            datetime(2023, 1, 1), datetime(2023, 2, 1), account_number
+        )
+
+        self.assertIn(account_number, self.bank.unsorted_ledgers)
+        self.assertEqual(
+            [transaction["amount"] for transaction in transactions], [1, 2]
+        )
+
+    def test_get_transactions_by_date_direct_appends(self):
+        """Test date filtering after entries were appended to the ledger directly."""
+        account_number = "123456789"
+        ledger = self.bank.transactions[account_number]
+        ledger.append({"type": "deposit", "amount": 1, "date": datetime(2023, 1, 1)})
+
+        self.bank.get_transactions_by_date(
+            datetime(2023, 1, 1), datetime(2023, 12, 1), account_number
+        )
+        ledger.append({"type": "deposit", "amount": 3, "date": datetime(2023, 3, 1)})
+        ledger.append({"type": "deposit", "amount": 2, "date": datetime(2023, 2, 1)})
+
+        transactions = self.bank.get_transactions_by_date(
+            datetime(2023, 2, 1), datetime(2023, 2, 28), account_number
+        )
+
+        self.assertIn(account_number, self.bank.unsorted_ledgers)
+        self.assertEqual([transaction["amount"] for transaction in transactions], [2])
+
     def test_get_transactions_by_date(self):
         """Test retrieving transactions by date range."""
         account_number = "123456789"
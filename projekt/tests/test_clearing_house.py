@@ -0,0 +1,174 @@
+import unittest
+from unittest.mock import patch
+
+from src.bank import Bank
+from src.user import User
+from src.bank_account import BankAccount, AccountStatus
+from src.clearing_house import ClearingHouse
+
+
+class TestClearingHouse(unittest.TestCase):
+    """Test cases for the ClearingHouse class."""
+
+    @patch("src.bank.Bank._fetch_currencies")
+    def setUp(self, mock_fetch):
+        """Set up test fixtures."""
+        mock_fetch.return_value = {"PLN": 1.0, "EUR": 4.0}
+
+        self.bank1 = Bank(name="PKO BP", bank_code="1020")
+        self.bank2 = Bank(name="ING Bank Śląski", bank_code="1050")
+        self.bank3 = Bank(name="mBank", bank_code="1140")
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+
+        self.account1 = BankAccount(
+            owner=self.user, bank=self.bank1, pin_code="123456", balance=1000
+        )
+        self.account2 = BankAccount(
+            owner=self.user, bank=self.bank2, pin_code="123456", balance=1000
+        )
+        self.account3 = BankAccount(
+            owner=self.user,
+            bank=self.bank3,
+            pin_code="123456",
+            balance=1000,
+            currency="EUR",
+        )
+
+        self.clearing_house = ClearingHouse([self.bank1, self.bank2, self.bank3])
+
+    def test_add_bank_twice(self):
+        """Test registering the same bank twice."""
+        with self.assertRaises(ValueError):
+            self.clearing_house.add_bank(self.bank1)
+
+    def test_submit_debits_and_queues(self):
+        """Test that a submitted transfer debits the source and waits for settlement."""
+        result = self.clearing_house.submit(
+            self.account1, "1050", self.account2.account_number, 100, "123456"
+        )
+
+        self.assertTrue(result)
+        self.assertEqual(self.account1.balance, 900)
+        self.assertEqual(self.account2.balance, 1000)
+        self.assertEqual(self.clearing_house.pending(), 1)
+
+        transaction = self.account1.get_transactions()[0]
+        self.assertEqual(transaction["type"], "interbank_transfer")
+        self.assertEqual(transaction["to_bank"], "1050")
+
+    def test_submit_invalid(self):
+        """Test submitting invalid inter-bank transfers."""
+        with self.assertRaises(ValueError):
+            self.clearing_house.submit(
+                self.account1, "9999", self.account2.account_number, 100, "123456"
+            )
+
+        with self.assertRaises(ValueError):
+            self.clearing_house.submit(
+                self.account1, "1020", self.account1.account_number, 100, "123456"
+            )
+
+        with self.assertRaises(ValueError):
+            self.clearing_house.submit(
+                self.account1, "1050", self.account2.account_number, 5000, "123456"
+            )
+
+        with self.assertRaises(TypeError):
+            self.clearing_house.submit(
+                self.account1, "1050", self.account2.account_number, "abc", "123456"
+            )
+
+        with self.assertRaises(PermissionError):
+            self.clearing_house.submit(
+                self.account1, "1050", self.account2.account_number, 100, "000000"
+            )
+
+        self.assertEqual(self.clearing_house.pending(), 0)
+
+    def test_settle_nets_bank_pairs(self):
+        """Test that settlement credits recipients and nets each bank pair."""
+        self.clearing_house.submit(
+            self.account1, "1050", self.account2.account_number, 300, "123456"
+        )
+        self.clearing_house.submit(
+            self.account2, "1020", self.account1.account_number, 100, "123456"
+        )
+        self.clearing_house.submit(
+            self.account1, "1140", self.account3.account_number, 40, "123456"
+        )
+
+        report = self.clearing_house.settle()
+
+        self.assertEqual(report["cycle"], 1)
+        self.assertEqual(report["settled"], 3)
+        self.assertEqual(report["refunded"], 0)
+        self.assertEqual(
+            report["net_positions"], {("1020", "1050"): 200, ("1020", "1140"): 40}
+        )
+        self.assertEqual(report["positions"], {"1020": -240, "1050": 200, "1140": 40})
+        self.assertEqual(self.account1.balance, 760)
+        self.assertEqual(self.account2.balance, 1200)
+        self.assertEqual(self.account3.balance, 1010)
+        self.assertEqual(self.clearing_house.pending(), 0)
+
+        incoming = self.account3.get_transactions()[0]
+        self.assertEqual(incoming["type"], "incoming_interbank_transfer")
+        self.assertEqual(incoming["from_bank"], "1020")
+        self.assertEqual(incoming["amount"], 10)
+
+    def test_settle_refunds_inactive_recipient(self):
+        """Test that transfers to missing or inactive accounts are refunded."""
+        self.account2.status = AccountStatus.CLOSED
+        self.clearing_house.submit(
+            self.account1, "1050", self.account2.account_number, 300, "123456"
+        )
+        self.clearing_house.submit(self.account1, "1140", "000", 100, "123456")
+
+        report = self.clearing_house.settle()
+
+        self.assertEqual(report["settled"], 0)
+        self.assertEqual(report["refunded"], 2)
+        self.assertEqual(report["net_positions"], {})
+        self.assertEqual(self.account1.balance, 1000)
+        self.assertEqual(self.account2.balance, 1000)
+        self.assertEqual(
+            self.account1.get_transactions()[-1]["type"], "interbank_refund"
+        )
+
+    def test_refund_returns_the_debited_amount(self):
+        """Test that refunds ignore rate changes made before settlement."""
+        self.clearing_house.submit(self.account3, "1050", "000", 33.33, "123456")
+        self.bank3.currencies["EUR"] = 4.5
+
+        self.clearing_house.settle()
+
+        self.assertEqual(self.account3.balance, 1000)
+        self.assertEqual(self.account3.get_transactions()[-1]["amount"], 33.33)
+
+    def test_positions_accumulate_across_cycles(self):
+        """Test that clearing positions carry over between settlement cycles."""
+        self.clearing_house.submit(
+            self.account1, "1050", self.account2.account_number, 100, "123456"
+        )
+        self.clearing_house.settle()
+        self.clearing_house.submit(
+            self.account1, "1050", self.account2.account_number, 50, "123456"
+        )
+
+        report = self.clearing_house.settle()
+
+        self.assertEqual(report["cycle"], 2)
+        self.assertEqual(report["positions"]["1020"], -150)
+        self.assertEqual(report["positions"]["1050"], 150)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,218 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+import src.bank_account
+import src.user
+from src.auth import Auth
+from src.bank import Bank
+from src.bank_account import BankAccount
+from src.differential import (
+    DEFAULT_TARGETS,
+    Recorder,
+    Recording,
+    Ref,
+    SteppingClock,
+    replay,
+)
+from src.ledger import TieredTransactions
+from src.user import User
+
+
+def fee_account_class():
+    """Returns a BankAccount variant that wrongly charges a fee on deposits."""
+
+    class BankAccount(src.bank_account.BankAccount):
+        def deposit(self, amount, pin_code):
+            return super().deposit(amount * 0.99, pin_code)
+
+    return BankAccount
+
+
+class TestDifferentialReplay(unittest.TestCase):
+    """Test cases for the Recorder and replay."""
+
+    def _scenario(self):
+        bank = Bank(
+            name="PKO BP", bank_code="1120", currencies={"PLN": 1.0, "EUR": 4.0}
+        )
+        auth = Auth()
+        user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+        first = BankAccount(user, bank, "123456", balance=1000)
+        second = BankAccount(user, bank, "123456", currency="EUR")
+
+        auth.login(user, "john.doe@example.com", "Password123!")
+        user.open_bank_account(bank, "654321")
+        third = next(iter(user.bank_accounts))
+
+        first.deposit(100, "123456")
+        first.transfer(400, second.account_number, "123456", bank)
+        user.deposit(50, third, "654321", auth)
+
+        with self.assertRaises(ValueError):
+            first.withdraw(5000, "123456")
+
+        user.get_transactions_by_date(
+            third, datetime(2000, 1, 1), datetime(2100, 1, 1), auth
+        )
+        bank.get_transactions(first.account_number)
+
+    def _record(self, **kwargs):
+        recorder = Recorder(**kwargs)
+        with recorder:
+            self._scenario()
+        return recorder.recording()
+
+    def test_records_top_level_operations(self):
+        """Test that top-level calls are recorded with symbolic references."""
+        recording = self._record()
+
+        calls = [(entry[0], entry[1]) for entry in recording.entries]
+
+        self.assertEqual(
+            calls,
+            [
+                ("Bank", "__init__"),
+                ("Auth", "__init__"),
+                ("User", "__init__"),
+                ("BankAccount", "__init__"),
+                ("BankAccount", "__init__"),
+                (Ref("Auth", 0), "login"),
+                (Ref("User", 0), "open_bank_account"),
+                (Ref("BankAccount", 0), "deposit"),
+                (Ref("BankAccount", 0), "transfer"),
+                (Ref("User", 0), "deposit"),
+                (Ref("BankAccount", 0), "withdraw"),
+                (Ref("User", 0), "get_transactions_by_date"),
+                (Ref("Bank", 0), "get_transactions"),
+            ],
+        )
+
+        self.assertEqual(
+            recording.entries[8][2],
+            (400, Ref("account_number", 1), "123456", Ref("Bank", 0)),
+        )
+        self.assertEqual(
+            recording.entries[9][2],
+            (50, Ref("account_number", 2), "654321", Ref("Auth", 0)),
+        )
+        self.assertEqual(
+            recording.entries[10][4],
+            ("error", "ValueError", "Amount cannot be greater than the balance."),
+        )
+        self.assertEqual(
+            [entry["type"] for entry in recording.entries[12][4][1]],
+            ["deposit", "transfer"],
+        )
+        self.assertEqual(
+            recording.state[Ref("BankAccount", 1)][:3],
+            (100.0, "AccountStatus.ACTIVE", "EUR"),
+        )
+
+    def test_ledger_dates_come_from_stepping_clock(self):
+        """Test that ledger dates are deterministic and the clock is restored."""
+        start = datetime(2024, 1, 1)
+
+        recording = self._record(start=start)
+        ledger = recording.state[Ref("BankAccount", 0)][3]
+
+        self.assertTrue(all(entry["date"] > start for entry in ledger))
+        self.assertLess(ledger[-1]["date"], start + timedelta(seconds=1))
+        self.assertIs(src.bank_account.datetime, datetime)
+
+    def test_stepping_clock(self):
+        """Test that the clock advances on every reading."""
+        clock = SteppingClock(datetime(2024, 1, 1), step=timedelta(seconds=1))
+
+        self.assertEqual(clock(), datetime(2024, 1, 1))
+        self.assertEqual(clock(), datetime(2024, 1, 1, 0, 0, 1))
+
+    def test_replay_of_same_implementation_matches(self):
+        """Test that replaying against the recorded classes finds no divergence."""
+        recording = self._record()
+
+        report = replay(recording)
+
+        self.assertEqual(report["operations"], len(recording))
+        self.assertEqual(report["divergences"], [])
+        self.assertEqual(report["state_divergences"], [])
+
+    def test_replay_with_alternative_configuration(self):
+        """Test replaying against a bank with a tiered ledger."""
+        recording = self._record()
+
+        report = replay(
+            recording,
+            setup=lambda bank: TieredTransactions(bank, hot_size=1, segment_size=1),
+        )
+
+        self.assertEqual(report["divergent_operations"], 0)
+        self.assertEqual(report["state_divergences"], [])
+
+    def test_replay_reports_divergences(self):
+        """Test that a changed implementation is reported with outcomes and state."""
+        recording = self._record()
+        targets = [target for target in DEFAULT_TARGETS if target is not BankAccount]
+
+        report = replay(recording, targets=targets + [fee_account_class()])
+
+        self.assertEqual(report["divergent_operations"], 2)
+        self.assertEqual(
+            [
+                (divergence["index"], divergence["method"])
+                for divergence in report["divergences"]
+            ],
+            [(11, "get_transactions_by_date"), (12, "get_transactions")],
+        )
+        self.assertEqual(report["divergences"][1]["expected"][1][0]["amount"], 100.0)
+        self.assertEqual(report["divergences"][1]["actual"][1][0]["amount"], 99.0)
+        self.assertEqual(
+            [
+                (
+                    divergence["account"],
+                    divergence["expected"][0],
+                    divergence["actual"][0],
+                )
+                for divergence in report["state_divergences"]
+            ],
+            [
+                (Ref("BankAccount", 0), 700.0, 699.0),
+                (Ref("BankAccount", 2), 50.0, 49.5),
+            ],
+        )
+        self.assertIs(src.user.BankAccount, BankAccount)
+
+    def test_save_and_load(self):
+        """Test that a recording survives a round trip through a file."""
+        recording = self._record(capture_results=False)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ops.pickle")
+            recording.save(path)
+            loaded = Recording.load(path)
+
+        self.assertEqual(loaded.entries, recording.entries)
+        self.assertEqual(loaded.state, recording.state)
+        self.assertFalse(loaded.capture_results)
+        self.assertEqual(replay(loaded)["divergences"], [])
+
+    def test_invalid_use(self):
+        """Test recording twice and replaying without the recorded classes."""
+        with Recorder():
+            with self.assertRaises(ValueError):
+                Recorder().enable()
+
+        with self.assertRaises(ValueError):
+            replay(self._record(), targets=[Bank, User, Auth])
+
+
+if __name__ == "__main__":
+    unittest.main()
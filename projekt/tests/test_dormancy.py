@@ -0,0 +1,144 @@
+import unittest
+from datetime import datetime, timedelta
+
+from src.bank import Bank
+from src.bank_account import AccountStatus, BankAccount
+from src.dormancy import DormancySweeper
+from src.user import User
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestDormancySweeper(unittest.TestCase):
+    """Test cases for the DormancySweeper class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.bank = Bank(name="PKO BP", bank_code="1120", currencies={"PLN": 1.0})
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+
+        self.existing = BankAccount(self.user, self.bank, "123456", balance=100)
+        self.start = datetime.now()
+        self.clock = FakeClock(self.start)
+        self.sweeper = DormancySweeper(
+            self.bank, threshold=timedelta(days=30), clock=self.clock
+        )
+        self.account = BankAccount(self.user, self.bank, "123456", balance=100)
+
+    def _activity(self, account, days):
+        self.bank.add_new_transaction(
+            {
+                "type": "deposit",
+                "amount": 1,
+                "date": self.start + timedelta(days=days),
+            },
+            account.account_number,
+        )
+
+    def test_invalid_threshold(self):
+        """Test invalid dormancy thresholds."""
+        with self.assertRaises(TypeError):
+            DormancySweeper(self.bank, threshold=30)
+
+        with self.assertRaises(ValueError):
+            DormancySweeper(self.bank, threshold=timedelta(0))
+
+    def test_tracks_existing_and_new_accounts(self):
+        """Test that accounts opened before and after attaching are tracked."""
+        self.assertEqual(len(self.sweeper), 2)
+        self.assertEqual(self.sweeper.sweep(self.start + timedelta(days=29)), [])
+
+        flipped = self.sweeper.sweep(self.start + timedelta(days=31))
+
+        self.assertCountEqual(
+            flipped, [self.existing.account_number, self.account.account_number]
+        )
+        self.assertEqual(self.existing.status, AccountStatus.INACTIVE)
+        self.assertEqual(len(self.sweeper), 0)
+
+    def test_recent_activity_keeps_account_active(self):
+        """Test that activity defers dormancy through the lazy re-push."""
+        self._activity(self.account, 20)
+
+        flipped = self.sweeper.sweep(self.start + timedelta(days=40))
+
+        self.assertEqual(flipped, [self.existing.account_number])
+        self.assertEqual(self.account.status, AccountStatus.ACTIVE)
+        self.assertEqual(
+            self.sweeper.heap,
+            [(self.start + timedelta(days=20), self.account.account_number)],
+        )
+        self.assertEqual(
+            self.sweeper.sweep(self.start + timedelta(days=51)),
+            [self.account.account_number],
+        )
+
+    def test_unlock_rearms_account(self):
+        """Test that a reactivated account is tracked from its reactivation."""
+        self.sweeper.sweep(self.start + timedelta(days=31))
+        self.clock.now = self.start + timedelta(days=35)
+
+        self.account.unlock_account("123456")
+
+        self.assertEqual(self.sweeper.sweep(self.start + timedelta(days=60)), [])
+        self.assertEqual(
+            self.sweeper.sweep(self.start + timedelta(days=66)),
+            [self.account.account_number],
+        )
+
+    def test_only_active_accounts_are_flipped(self):
+        """Test that locked accounts are dropped from tracking, not flipped."""
+        self.account.status = AccountStatus.LOCKED
+
+        flipped = self.sweeper.sweep(self.start + timedelta(days=31))
+
+        self.assertEqual(flipped, [self.existing.account_number])
+        self.assertEqual(self.account.status, AccountStatus.LOCKED)
+        self.assertNotIn(self.account.account_number, self.sweeper.last_activity)
+
+    def test_sweep_touches_only_dormant_accounts(self):
+        """Test that a sweep leaves the entries of recently active accounts alone."""
+        accounts = [BankAccount(self.user, self.bank, "123456") for _ in range(1000)]
+        self.sweeper.sweep(self.start + timedelta(days=31))
+        self.clock.now = self.start + timedelta(days=31)
+        for account in accounts:
+            account.unlock_account("123456")
+
+        heap = list(self.sweeper.heap)
+        self.assertEqual(self.sweeper.sweep(self.start + timedelta(days=60)), [])
+        self.assertEqual(self.sweeper.heap, heap)
+
+    def test_foreign_ledger_entries_are_ignored(self):
+        """Test that entries of accounts held by other banks are not tracked."""
+        other = Bank(name="mBank", bank_code="1140", currencies={"PLN": 1.0})
+        foreign = BankAccount(self.user, other, "123456", balance=100)
+        foreign.transfer(10, self.account.account_number, "123456", self.bank)
+        self.bank.add_new_transaction(
+            {"type": "deposit", "amount": 1, "date": self.start}, "999"
+        )
+
+        flipped = self.sweeper.sweep(self.start + timedelta(days=31))
+
+        self.assertNotIn("999", self.sweeper.last_activity)
+        self.assertNotIn(foreign.account_number, self.sweeper.last_activity)
+        self.assertCountEqual(
+            flipped, [self.existing.account_number, self.account.account_number]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import unittest
+from datetime import datetime
+
+from src.bank import Bank
+from src.bank_account import BankAccount, AccountStatus
+from src.events import AccountEvent, EventStore
+from src.user import User
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+class TestEventStore(unittest.TestCase):
+    """Test cases for the EventStore class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.bank = Bank(
+            name="PKO BP", bank_code="1120", currencies={"PLN": 1.0, "EUR": 4.0}
+        )
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+
+        self.existing = BankAccount(self.user, self.bank, "123456", balance=100)
+        self.clock = FakeClock()
+        self.store = EventStore(self.bank, snapshot_interval=4, clock=self.clock)
+
+    def test_invalid_interval(self):
+        """Test creating a store with a non-positive snapshot interval."""
+        with self.assertRaises(ValueError):
+            EventStore(snapshot_interval=0)
+
+    def test_records_existing_and_new_accounts(self):
+        """Test that attaching records existing accounts and later openings."""
+        account = BankAccount(self.user, self.bank, "654321", balance=5)
+
+        events = list(self.store.events())
+
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(
+            events[0],
+            AccountEvent(
+                0,
+                1001.0,
+                self.existing.account_number,
+                "opened",
+                (100, AccountStatus.ACTIVE, "PLN", "123456", 0),
+            ),
+        )
+        self.assertEqual(events[1].account_number, account.account_number)
+
+    def test_every_mutation_is_an_event(self):
+        """Test that balance, status, currency, pin and failures are recorded."""
+        account = self.existing
+        account.deposit(50, "123456")
+        account.change_currency("EUR", "123456")
+        account.change_pin("123456", "111111")
+
+        with self.assertRaises(PermissionError):
+            account.withdraw(10, "000000")
+
+        fields = [
+            event.field for event in self.store.account_events(account.account_number)
+        ]
+
+        self.assertEqual(
+            fields,
+            ["opened", "balance", "balance", "currency", "pin", "failedWithdrawCount"],
+        )
+
+    def test_replay_account_to_sequence(self):
+        """Test rebuilding one account at several points."""
+        number = self.existing.account_number
+        self.existing.deposit(50, "123456")
+        self.existing.withdraw(30, "123456")
+
+        self.assertEqual(self.store.replay_account(number, 0), None)
+        self.assertEqual(self.store.replay_account(number, 2)["balance"], 150)
+        self.assertEqual(self.store.replay_account(number)["balance"], 120)
+
+    def test_replay_bank_matches_live_state(self):
+        """Test that a full replay through several snapshots matches the bank."""
+        other = BankAccount(self.user, self.bank, "654321")
+        for _ in range(5):
+            self.existing.transfer(10, other.account_number, "123456", self.bank)
+        other.status = AccountStatus.LOCKED
+
+        states = self.store.replay_bank()
+
+        self.assertGreater(len(self.store.snapshots), 2)
+        for number, account in self.bank.accounts.items():
+            self.assertEqual(states[number]["balance"], account.balance)
+            self.assertEqual(states[number]["status"], account.status)
+            self.assertEqual(states[number]["currency"], account.currency)
+
+    def test_replay_to_datetime(self):
+        """Test rebuilding the bank as it was at a given moment."""
+        number = self.existing.account_number
+        self.existing.deposit(50, "123456")
+        moment = datetime.fromtimestamp(self.clock.now)
+        self.existing.deposit(50, "123456")
+
+        self.assertEqual(self.store.replay_bank(moment)[number]["balance"], 150)
+        self.assertEqual(self.store.replay_bank(datetime(1960, 1, 1)), {})
+
+    def test_restore(self):
+        """Test resetting live accounts to an earlier state."""
+        self.existing.deposit(50, "123456")
+        self.existing.status = AccountStatus.LOCKED
+        length = len(self.store)
+
+        restored = self.store.restore(self.bank, 1)
+
+        self.assertEqual(restored, 1)
+        self.assertEqual(self.existing.balance, 100)
+        self.assertEqual(self.existing.status, AccountStatus.ACTIVE)
+        self.assertNotIn(
+            self.existing.account_number,
+            self.bank.accounts_by_status[AccountStatus.LOCKED],
+        )
+        self.assertEqual(len(self.store), length)
+
+    def test_invalid_targets(self):
+        """Test replaying to invalid points."""
+        with self.assertRaises(TypeError):
+            self.store.replay_bank("yesterday")
+
+        with self.assertRaises(ValueError):
+            self.store.replay_bank(-1)
+
+        with self.assertRaises(ValueError):
+            self.store.append("missing", "balance", 1)
+
+        with self.assertRaises(ValueError):
+            self.store.append(self.existing.account_number, "owner", 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
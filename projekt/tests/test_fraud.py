@@ -0,0 +1,186 @@
+import unittest
+
+from src.bank import Bank
+from src.bank_account import BankAccount
+from src.clearing_house import ClearingHouse
+from src.fraud import AccountFeatures, FeatureStore, FraudScorer
+from src.user import User
+
+
+class FakeClock:
+    """Manually advanced clock used to drive the velocity window."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestAccountFeatures(unittest.TestCase):
+    """Test cases for the AccountFeatures class."""
+
+    def test_running_mean_and_variance(self):
+        """Test that the running statistics match the batch ones."""
+        features = AccountFeatures(window=60, buckets=6)
+
+        for amount in [2, 4, 4, 4, 5, 5, 7, 9]:
+            features.add(amount)
+
+        self.assertEqual(features.count, 8)
+        self.assertAlmostEqual(features.mean, 5.0)
+        self.assertAlmostEqual(features.std(), 2.138089935)
+
+
+class TestFraudScorer(unittest.TestCase):
+    """Test cases for the FeatureStore and FraudScorer classes."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.bank = Bank(
+            name="PKO BP", bank_code="1120", currencies={"PLN": 1.0, "EUR": 4.0}
+        )
+        self.clock = FakeClock(1000.0)
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+
+        self.account = BankAccount(self.user, self.bank, "123456", balance=100000)
+        self.friend = BankAccount(self.user, self.bank, "123456")
+        self.stranger = BankAccount(self.user, self.bank, "123456")
+        self.euro_account = BankAccount(self.user, self.bank, "123456", currency="EUR")
+
+    def _transfer(self, amount, to_account):
+        self.account.transfer(amount, to_account.account_number, "123456", self.bank)
+
+    def test_unknown_weight(self):
+        """Test that weights must name known features."""
+        with self.assertRaises(ValueError):
+            FraudScorer(self.bank, weights={"ip_address": 1.0})
+
+    def test_store_is_backfilled_and_updated(self):
+        """Test that features cover transfers before and after attaching."""
+        for _ in range(3):
+            self._transfer(100, self.friend)
+
+        store = FeatureStore(self.bank, clock=self.clock)
+        self._transfer(200, self.friend)
+
+        features = store.get(self.account.account_number)
+
+        self.assertEqual(features.count, 4)
+        self.assertAlmostEqual(features.mean, 125.0)
+        self.assertEqual(features.counterparties, {self.friend.account_number})
+        self.assertEqual(features.velocity.totals(self.clock())[0], 1)
+        self.assertEqual(store.get(self.friend.account_number).count, 0)
+
+    def test_transfers_to_other_banks_are_recorded(self):
+        """Test that transfers filed in another bank's ledger update the features."""
+        other = Bank(name="mBank", bank_code="1140", currencies={"PLN": 1.0})
+        clearing_house = ClearingHouse([self.bank, other])
+        target = BankAccount(self.user, other, "123456")
+        scorer = FraudScorer(self.bank, store=FeatureStore(self.bank, clock=self.clock))
+
+        clearing_house.submit(self.account, "1140", "000", 50, "123456")
+        self.account.transfer(100, target.account_number, "123456", other)
+        self.account.transfer(150, target.account_number, "123456", other)
+
+        features = scorer.store.get(self.account.account_number)
+        scores = scorer.features(self.account, 100, target)
+
+        self.assertEqual(features.count, 3)
+        self.assertAlmostEqual(features.mean, 100.0)
+        self.assertEqual(features.counterparties, {"1140/000", target.account_number})
+        self.assertEqual(scores[1], 0.0)
+        self.assertAlmostEqual(scores[3], 0.3)
+
+    def test_features(self):
+        """Test the scaled features of a pending transfer."""
+        store = FeatureStore(self.bank, clock=self.clock)
+        scorer = FraudScorer(self.bank, store=store, velocity_cap=10)
+
+        for amount in [90, 110, 100, 90, 110]:
+            self._transfer(amount, self.friend)
+
+        self.assertEqual(
+            scorer.features(self.account, 100, self.friend), (0.0, 0.0, 0.0, 0.5)
+        )
+
+        zscore, new, mismatch, velocity = scorer.features(
+            self.account, 10000, self.euro_account
+        )
+        self.assertEqual((zscore, new, mismatch), (1.0, 1.0, 1.0))
+
+    def test_rejects_suspicious_transfer(self):
+        """Test that a transfer scoring over the threshold is rejected."""
+        store = FeatureStore(self.bank, clock=self.clock)
+        FraudScorer(self.bank, store=store, threshold=0.7)
+
+        for amount in [90, 110, 100, 90, 110]:
+            self._transfer(amount, self.friend)
+
+        self._transfer(100, self.stranger)
+        balance = self.account.balance
+
+        with self.assertRaises(PermissionError):
+            self._transfer(50000, self.euro_account)
+
+        self.assertEqual(self.account.balance, balance)
+
+    def test_velocity_window_expires(self):
+        """Test that old operations stop counting towards velocity."""
+        store = FeatureStore(self.bank, window=60, buckets=6, clock=self.clock)
+        scorer = FraudScorer(self.bank, store=store, velocity_cap=2)
+
+        self._transfer(10, self.friend)
+        self._transfer(10, self.friend)
+        self.assertEqual(scorer.features(self.account, 10, self.friend)[3], 1.0)
+
+        self.clock.now += 120
+        self.assertEqual(scorer.features(self.account, 10, self.friend)[3], 0.0)
+
+    def test_score_batch_matches_single_scores(self):
+        """Test that batch scoring gives the same scores as single scoring."""
+        store = FeatureStore(self.bank, clock=self.clock)
+        scorer = FraudScorer(self.bank, store=store)
+
+        for amount in [90, 110, 100, 90, 110, 95]:
+            self._transfer(amount, self.friend)
+
+        pending = [
+            (self.account.account_number, self.friend.account_number, 100),
+            (self.account.account_number, self.stranger.account_number, 300),
+            (self.account.account_number, self.euro_account.account_number, 9000),
+            (self.friend.account_number, self.account.account_number, 5),
+        ]
+        accounts = self.bank.accounts
+
+        scores = scorer.score_batch(pending)
+
+        for (source, target, amount), score in zip(pending, scores):
+            self.assertAlmostEqual(
+                score, scorer.score(accounts[source], amount, accounts[target])
+            )
+
+        self.assertEqual(
+            scorer.evaluate_batch(pending),
+            [score < scorer.threshold for score in scores],
+        )
+        self.assertEqual(self.account.balance, 100000 - 595)
+
+    def test_score_batch_unknown_account(self):
+        """Test that batch scoring rejects unknown accounts."""
+        scorer = FraudScorer(self.bank)
+
+        with self.assertRaises(ValueError):
+            scorer.score_batch([(self.account.account_number, "missing", 10)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+import os
+import tempfile
+import unittest
+import urllib.request
+
+from src.auth import Auth
+from src.bank import Bank
+from src.bank_account import BankAccount
+from src.instrumentation import Instrumentation, LatencyHistogram
+from src.user import User
+
+
+class FakeClock:
+    def __init__(self, step):
+        self.now = 0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Test cases for the LatencyHistogram class."""
+
+    def test_percentiles_within_precision(self):
+        """Test that percentiles keep the configured relative precision."""
+        histogram = LatencyHistogram(precision=7)
+        for value in range(1, 100001):
+            histogram.record(value * 10)
+
+        self.assertEqual(histogram.count, 100000)
+        self.assertEqual(histogram.max, 1000000)
+        self.assertAlmostEqual(histogram.percentile(0.5), 500000, delta=500000 / 128)
+        self.assertAlmostEqual(histogram.percentile(0.99), 990000, delta=990000 / 128)
+        self.assertEqual(histogram.percentile(1), 1000000)
+
+    def test_small_values_are_exact(self):
+        """Test that values below the sub-bucket count are stored exactly."""
+        histogram = LatencyHistogram(precision=3)
+        for value in (0, 1, 5, 15):
+            histogram.record(value)
+
+        self.assertEqual(histogram.percentile(0.25), 0)
+        self.assertEqual(histogram.percentile(0.75), 5)
+        self.assertEqual(histogram.cumulative([1, 10, 100]), [2, 3, 4])
+
+    def test_invalid_arguments(self):
+        """Test invalid precision and percentile values."""
+        with self.assertRaises(ValueError):
+            LatencyHistogram(precision=0)
+
+        with self.assertRaises(ValueError):
+            LatencyHistogram().percentile(2)
+
+        self.assertEqual(LatencyHistogram().percentile(0.5), 0)
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test cases for the Instrumentation class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.bank = Bank(name="PKO BP", bank_code="1120", currencies={"PLN": 1.0})
+        self.auth = Auth()
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+        self.auth.login(self.user, self.user.email, "Password123!")
+        self.user.open_bank_account(self.bank, "123456", balance=100)
+        self.account_number = next(iter(self.user.bank_accounts))
+
+        self.instrumentation = Instrumentation(clock=FakeClock(1000))
+        self.addCleanup(self.instrumentation.disable)
+
+    def test_disabled_layer_leaves_classes_untouched(self):
+        """Test that disabling restores the original functions."""
+        original = BankAccount.deposit
+
+        self.instrumentation.enable()
+        self.assertIsNot(BankAccount.deposit, original)
+        self.assertEqual(BankAccount.deposit.__name__, "deposit")
+
+        self.instrumentation.disable()
+        self.assertIs(BankAccount.deposit, original)
+
+    def test_records_calls_and_nested_operations(self):
+        """Test that each layer of a call chain is counted."""
+        with self.instrumentation:
+            self.user.deposit(10, self.account_number, "123456", self.auth)
+            self.user.deposit(10, self.account_number, "123456", self.auth)
+
+        snapshot = self.instrumentation.snapshot()
+
+        self.assertEqual(snapshot["User.deposit"]["calls"], 2)
+        self.assertEqual(snapshot["BankAccount.deposit"]["calls"], 2)
+        self.assertEqual(snapshot["Bank.add_new_transaction"]["calls"], 2)
+        self.assertEqual(snapshot["Auth.is_logged_in"]["calls"], 2)
+        self.assertGreater(
+            snapshot["User.deposit"]["p50"], snapshot["BankAccount.deposit"]["p50"]
+        )
+
+    def test_records_errors_by_type(self):
+        """Test that failing calls are counted by exception type and re-raised."""
+        with self.instrumentation:
+            with self.assertRaises(ValueError):
+                self.user.withdraw(1000, self.account_number, "123456", self.auth)
+            with self.assertRaises(PermissionError):
+                self.user.withdraw(1, self.account_number, "000000", self.auth)
+
+        errors = self.instrumentation.snapshot()["BankAccount.withdraw"]["errors"]
+
+        self.assertEqual(errors, {"ValueError": 1, "PermissionError": 1})
+
+    def test_cannot_enable_twice(self):
+        """Test that the same classes cannot be instrumented twice."""
+        self.instrumentation.enable()
+
+        with self.assertRaises(ValueError):
+            Instrumentation().enable()
+
+        Instrumentation().disable()
+        self.assertTrue(self.instrumentation.enabled)
+
+    def test_reset(self):
+        """Test that reset discards recorded data."""
+        with self.instrumentation:
+            self.user.get_total_balance(self.auth)
+
+        self.instrumentation.reset()
+
+        self.assertEqual(self.instrumentation.snapshot(), {})
+
+    def test_prometheus_export(self):
+        """Test the Prometheus text format of counters and histograms."""
+        with self.instrumentation:
+            self.user.deposit(10, self.account_number, "123456", self.auth)
+            with self.assertRaises(ValueError):
+                self.user.withdraw(1000, self.account_number, "123456", self.auth)
+
+        text = self.instrumentation.export_prometheus()
+
+        self.assertIn('bank_operation_calls_total{operation="User.deposit"} 1', text)
+        self.assertIn(
+            'bank_operation_errors_total{operation="BankAccount.withdraw",'
+            'exception="ValueError"} 1',
+            text,
+        )
+        self.assertIn(
+            'bank_operation_latency_seconds_bucket{operation="User.deposit",le="+Inf"} 1',
+            text,
+        )
+        self.assertIn("# TYPE bank_operation_latency_seconds histogram", text)
+
+    def test_write_prometheus(self):
+        """Test writing the metrics to a file."""
+        with self.instrumentation:
+            self.user.get_total_balance(self.auth)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bank.prom")
+            self.instrumentation.write_prometheus(path)
+
+            with open(path, encoding="utf-8") as stream:
+                self.assertIn("User.get_total_balance", stream.read())
+
+    def test_serve_metrics_endpoint(self):
+        """Test serving the metrics over local HTTP."""
+        with self.instrumentation:
+            self.user.get_total_balance(self.auth)
+
+        server = self.instrumentation.serve()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+
+        with urllib.request.urlopen(url) as response:
+            body = response.read().decode()
+
+        self.assertIn("User.get_total_balance", body)
+
+
+if __name__ == "__main__":
+    unittest.main()
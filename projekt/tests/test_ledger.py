@@ -0,0 +1,232 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from src.bank import Bank
+from src.bank_account import BankAccount
+from src.ledger import TieredLedger, TieredTransactions
+from src.snapshot import BankSnapshot
+from src.user import User
+
+
+class TestTieredTransactions(unittest.TestCase):
+    """Test cases for the TieredTransactions class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.bank = Bank(name="PKO BP", bank_code="1120", currencies={"PLN": 1.0})
+        self.other = Bank(name="mBank", bank_code="1140", currencies={"PLN": 1.0})
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+
+        self.account = BankAccount(self.user, self.bank, "123456", balance=100)
+        self.start = datetime(2024, 1, 1)
+
+    def _record(self, count, first=0):
+        for day in range(first, first + count):
+            self.bank.add_new_transaction(
+                {
+                    "type": "deposit",
+                    "amount": day,
+                    "date": self.start + timedelta(days=day),
+                },
+                self.account.account_number,
+            )
+
+    def test_invalid_sizes(self):
+        """Test that tier sizes must be positive."""
+        with self.assertRaises(ValueError):
+            TieredTransactions(self.bank, hot_size=0)
+
+        with self.assertRaises(ValueError):
+            TieredTransactions(self.bank, segment_size=-1)
+
+    def test_old_entries_are_compacted(self):
+        """Test that only the newest entries stay hot."""
+        tiers = TieredTransactions(self.bank, hot_size=10, segment_size=5)
+        self._record(27)
+
+        ledger = self.bank.transactions[self.account.account_number]
+
+        self.assertIsInstance(ledger, TieredLedger)
+        self.assertEqual(len(ledger), 27)
+        self.assertEqual(ledger.cold_count, 15)
+        self.assertEqual(len(ledger.hot), 12)
+        self.assertEqual(len(ledger.segments), 3)
+        self.assertGreater(tiers.cold_bytes(), 0)
+
+    def test_reads_are_transparent(self):
+        """Test that reads return the same entries as an untiered ledger."""
+        self._record(40)
+        expected = list(self.bank.get_transactions(self.account.account_number))
+
+        TieredTransactions(self.bank, hot_size=7, segment_size=4, cache_segments=2)
+        ledger = self.bank.transactions[self.account.account_number]
+
+        self.assertEqual(
+            self.bank.get_transactions(self.account.account_number), expected
+        )
+        self.assertEqual(ledger[0], expected[0])
+        self.assertEqual(ledger[-1], expected[-1])
+        self.assertEqual(ledger[5:30], expected[5:30])
+        self.assertEqual(ledger[::3], expected[::3])
+
+        for first, last in [(0, 39), (3, 9), (10, 35), (36, 38), (50, 60)]:
+            self.assertEqual(
+                self.bank.get_transactions_by_date(
+                    self.start + timedelta(days=first),
+                    self.start + timedelta(days=last),
+                    self.account.account_number,
+                ),
+                expected[first : last + 1],
+            )
+
+    def test_get_transactions_returns_a_copy(self):
+        """Test that tiered ledgers are returned as a new list on every call."""
+        number = self.account.account_number
+        self.assertIs(
+            self.bank.get_transactions(number), self.bank.transactions[number]
+        )
+
+        TieredTransactions(self.bank, hot_size=10, segment_size=5)
+        self._record(20)
+
+        transactions = self.bank.get_transactions(self.account.account_number)
+        transactions.clear()
+
+        again = self.bank.get_transactions(self.account.account_number)
+        self.assertEqual(len(again), 20)
+        self.assertIsNot(again, transactions)
+
+    def test_recent_reads_stay_hot(self):
+        """Test that a range within the hot tier pages nothing in."""
+        tiers = TieredTransactions(self.bank, hot_size=10, segment_size=10)
+        self._record(100)
+
+        result = self.bank.get_transactions_by_date(
+            self.start + timedelta(days=95),
+            self.start + timedelta(days=99),
+            self.account.account_number,
+        )
+
+        self.assertEqual(len(result), 5)
+        self.assertEqual(tiers.loads, 0)
+
+    def test_cache_is_bounded(self):
+        """Test that decoded segments are kept in a bounded LRU."""
+        tiers = TieredTransactions(
+            self.bank, hot_size=5, segment_size=5, cache_segments=2
+        )
+        self._record(50)
+
+        self.bank.get_transactions(self.account.account_number)
+        self.assertEqual(len(tiers.cache), 2)
+        self.assertEqual(tiers.loads, 9)
+
+        ledger = self.bank.transactions[self.account.account_number]
+        ledger[40]
+        ledger[40]
+        self.assertEqual(tiers.loads, 9)
+
+        ledger[0]
+        self.assertEqual(tiers.loads, 10)
+
+    def test_unsorted_ledger(self):
+        """Test date queries on a ledger recorded out of order."""
+        TieredTransactions(self.bank, hot_size=3, segment_size=3)
+        self._record(10, first=20)
+        self._record(10)
+
+        result = self.bank.get_transactions_by_date(
+            self.start + timedelta(days=5),
+            self.start + timedelta(days=24),
+            self.account.account_number,
+        )
+
+        self.assertEqual(
+            [transaction["amount"] for transaction in result],
+            [20, 21, 22, 23, 24, 5, 6, 7, 8, 9],
+        )
+
+    def test_direct_appends_out_of_order(self):
+        """Test date queries after entries were appended to a tiered ledger directly."""
+        TieredTransactions(self.bank, hot_size=3, segment_size=3)
+        self._record(10, first=20)
+        ledger = self.bank.transactions[self.account.account_number]
+        ledger.append({"type": "deposit", "amount": 5, "date": self.start})
+
+        result = self.bank.get_transactions_by_date(
+            self.start, self.start + timedelta(days=20), self.account.account_number
+        )
+
+        self.assertFalse(ledger.ordered)
+        self.assertEqual([transaction["amount"] for transaction in result], [20, 5])
+
+    def test_bank_references_survive_compaction(self):
+        """Test that banks stored in entries are restored by identity."""
+        TieredTransactions(self.bank, hot_size=1, segment_size=2)
+
+        for day, bank in enumerate([self.bank, self.other, self.bank]):
+            self.bank.add_new_transaction(
+                {
+                    "type": "transfer",
+                    "amount": 1,
+                    "bank": bank,
+                    "date": self.start + timedelta(days=day),
+                },
+                self.account.account_number,
+            )
+
+        ledger = self.bank.transactions[self.account.account_number]
+
+        self.assertEqual(ledger.cold_count, 2)
+        self.assertIs(ledger[0]["bank"], self.bank)
+        self.assertIs(ledger[1]["bank"], self.other)
+
+    def test_segments_on_disk(self):
+        """Test that cold segments can be kept in a directory."""
+        with tempfile.TemporaryDirectory() as directory:
+            tiers = TieredTransactions(
+                self.bank, hot_size=4, segment_size=4, directory=directory
+            )
+            self._record(20)
+
+            self.assertEqual(len(os.listdir(directory)), 4)
+            self.assertEqual(tiers.blobs, {})
+            self.assertEqual(
+                [
+                    transaction["amount"]
+                    for transaction in self.bank.get_transactions(
+                        self.account.account_number
+                    )
+                ],
+                list(range(20)),
+            )
+
+    def test_snapshot_of_tiered_ledger(self):
+        """Test that snapshots keep working over a tiered ledger."""
+        TieredTransactions(self.bank, hot_size=2, segment_size=2)
+        self._record(6)
+
+        with BankSnapshot(self.bank) as snapshot:
+            self._record(6, first=6)
+
+            self.assertEqual(
+                len(snapshot.get_transactions(self.account.account_number)), 6
+            )
+
+        self.assertEqual(
+            len(self.bank.get_transactions(self.account.account_number)), 12
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+from src.auth import Auth
+from src.passwords import (
+    DEFAULT_COSTS,
+    PasswordHasher,
+    VerificationPool,
+    verify_password,
+)
+from src.user import User
+
+
+class TestPasswordHasher(unittest.TestCase):
+    """Test cases for the PasswordHasher class and verify_password."""
+
+    def test_default_scrypt_hash(self):
+        """Test that the default hasher uses scrypt at the default cost."""
+        encoded = PasswordHasher().hash("Password123!")
+        algorithm, cost, salt, digest = encoded.split("$")
+
+        self.assertEqual(algorithm, "scrypt")
+        self.assertEqual(int(cost), DEFAULT_COSTS["scrypt"])
+        self.assertEqual(len(bytes.fromhex(salt)), 16)
+        self.assertEqual(len(bytes.fromhex(digest)), 32)
+        self.assertTrue(verify_password("Password123!", encoded))
+        self.assertFalse(verify_password("Password124!", encoded))
+
+    def test_pbkdf2_hash(self):
+        """Test PBKDF2 hashing with a custom cost."""
+        encoded = PasswordHasher("pbkdf2_sha256", cost=10).hash("Password123!")
+
+        self.assertTrue(encoded.startswith("pbkdf2_sha256$10$"))
+        self.assertTrue(verify_password("Password123!", encoded))
+        self.assertFalse(verify_password("password123!", encoded))
+
+    def test_salt_is_random(self):
+        """Test that hashing the same password twice gives different hashes."""
+        hasher = PasswordHasher(cost=4)
+
+        self.assertNotEqual(hasher.hash("Password123!"), hasher.hash("Password123!"))
+
+    def test_invalid_arguments(self):
+        """Test invalid hasher parameters and malformed hashes."""
+        with self.assertRaises(ValueError):
+            PasswordHasher("md5")
+
+        with self.assertRaises(ValueError):
+            PasswordHasher(cost=0)
+
+        with self.assertRaises(ValueError):
+            PasswordHasher(salt_size=4)
+
+        with self.assertRaises(ValueError):
+            verify_password("Password123!", "Password123!")
+
+        with self.assertRaises(ValueError):
+            verify_password("Password123!", "md5$4$00$00")
+
+
+class TestVerificationPool(unittest.TestCase):
+    """Test cases for the VerificationPool class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.pool = VerificationPool(workers=2)
+        self.addCleanup(self.pool.close)
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+
+    def test_invalid_workers(self):
+        """Test that the pool needs at least one worker."""
+        with self.assertRaises(ValueError):
+            VerificationPool(workers=0)
+
+    def test_verify(self):
+        """Test verifying passwords in worker processes."""
+        futures = [
+            self.pool.submit(password, self.user.password_hash)
+            for password in ("Password123!", "Password124!")
+        ]
+
+        self.assertEqual([future.result() for future in futures], [True, False])
+
+    def test_auth_login_with_pool(self):
+        """Test that Auth verifies logins through the pool."""
+        auth = Auth(pool=self.pool)
+
+        with self.assertRaises(PermissionError):
+            auth.login(self.user, self.user.email, "Password124!")
+
+        self.assertTrue(auth.login(self.user, self.user.email, "Password123!"))
+        self.assertTrue(auth.is_logged_in(self.user))
+
+
+if __name__ == "__main__":
+    unittest.main()
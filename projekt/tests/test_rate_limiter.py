@@ -0,0 +1,179 @@
+import unittest
+from unittest.mock import patch
+
+from src.bank import Bank
+from src.user import User
+from src.bank_account import BankAccount
+from src.rate_limiter import TokenBucketTable, PinAttemptLimiter
+
+
+class FakeClock:
+    """Manually advanced clock used to drive the token buckets."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucketTable(unittest.TestCase):
+    """Test cases for the TokenBucketTable class."""
+
+    def test_consume_until_empty(self):
+        """Test that a bucket rejects consumption once empty."""
+        table = TokenBucketTable(capacity=2, refill_rate=1)
+
+        first = table.consume("client", now=0)
+        second = table.consume("client", now=0)
+        third = table.consume("client", now=0)
+
+        self.assertTrue(first)
+        self.assertTrue(second)
+        self.assertFalse(third)
+
+    def test_refill_over_time(self):
+        """Test that tokens are regained at the refill rate."""
+        table = TokenBucketTable(capacity=2, refill_rate=0.5)
+        table.consume("client", now=0)
+        table.consume("client", now=0)
+
+        self.assertEqual(table.tokens("client", now=1), 0.5)
+        self.assertEqual(table.tokens("client", now=100), 2)
+
+    def test_purge_drops_refilled_buckets(self):
+        """Test that fully refilled buckets are removed from the table."""
+        table = TokenBucketTable(capacity=2, refill_rate=1)
+        table.consume("old", now=0)
+        table.consume("new", now=10)
+
+        removed = table.purge(now=10.5)
+
+        self.assertEqual(removed, 1)
+        self.assertNotIn("old", table.entries)
+        self.assertIn("new", table.entries)
+
+    def test_table_is_bounded(self):
+        """Test that the table never grows past max entries."""
+        table = TokenBucketTable(capacity=5, refill_rate=0.001, max_entries=3)
+
+        for key in range(10):
+            table.consume(key, now=0)
+
+        self.assertLessEqual(len(table.entries), 3)
+        self.assertIn(9, table.entries)
+
+    def test_key_spray_purges_rarely(self):
+        """Test that a full table is not rescanned for every new key."""
+        table = TokenBucketTable(capacity=5, refill_rate=0.001, max_entries=100)
+        for key in range(100):
+            table.consume(key, now=0)
+
+        with patch.object(table, "purge", wraps=table.purge) as purge:
+            for key in range(100, 1100):
+                table.consume(key, now=0)
+
+        self.assertLessEqual(purge.call_count, 1000 // 25)
+        self.assertLessEqual(len(table.entries), 100)
+        self.assertIn(1099, table.entries)
+
+    def test_invalid_parameters(self):
+        """Test table creation with invalid parameters."""
+        with self.assertRaises(ValueError):
+            TokenBucketTable(capacity=0, refill_rate=1)
+
+        with self.assertRaises(ValueError):
+            TokenBucketTable(capacity=1, refill_rate=1, max_entries=0)
+
+
+class TestPinAttemptLimiter(unittest.TestCase):
+    """Test cases for the PinAttemptLimiter class."""
+
+    @patch("src.bank.Bank._fetch_currencies")
+    def setUp(self, mock_fetch):
+        """Set up test fixtures."""
+        mock_fetch.return_value = {"PLN": 1.0}
+
+        self.bank = Bank(name="PKO BP", bank_code="1120")
+        self.clock = FakeClock()
+        self.limiter = PinAttemptLimiter(
+            self.bank,
+            client_capacity=3,
+            client_refill_rate=1 / 60,
+            account_capacity=2,
+            account_refill_rate=1 / 60,
+            clock=self.clock,
+        )
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+
+        self.accounts = [
+            BankAccount(owner=self.user, bank=self.bank, pin_code="123456")
+            for _ in range(4)
+        ]
+
+    def test_limiter_attached_to_bank(self):
+        """Test that the limiter registers itself on the bank."""
+        self.assertIs(self.bank.pin_attempt_limiter, self.limiter)
+
+    def test_account_throttled_before_pin_check(self):
+        """Test that an exhausted account rejects even the correct PIN."""
+        account = self.accounts[0]
+
+        for _ in range(2):
+            with self.assertRaises(PermissionError):
+                account.deposit(10, "000000")
+
+        with self.assertRaisesRegex(PermissionError, "Too many failed"):
+            account.deposit(10, "123456")
+
+        self.clock.now += 60
+        result = account.deposit(10, "123456")
+
+        self.assertTrue(result)
+
+    def test_client_spraying_accounts_is_throttled(self):
+        """Test that one client guessing PINs across accounts gets blocked."""
+        with self.limiter.client("10.0.0.1"):
+            for account in self.accounts[:3]:
+                with self.assertRaisesRegex(PermissionError, "Incorrect PIN"):
+                    account.deposit(10, "000000")
+
+            with self.assertRaisesRegex(PermissionError, "Too many failed"):
+                self.accounts[3].deposit(10, "123456")
+
+        with self.limiter.client("10.0.0.2"):
+            result = self.accounts[3].deposit(10, "123456")
+
+        self.assertTrue(result)
+
+    def test_success_does_not_consume_tokens(self):
+        """Test that successful PIN checks leave the tables empty."""
+        with self.limiter.client("10.0.0.1"):
+            for _ in range(5):
+                self.accounts[0].deposit(10, "123456")
+
+        self.assertEqual(self.limiter.accounts.entries, {})
+        self.assertEqual(self.limiter.clients.entries, {})
+
+    def test_unlock_account_is_throttled(self):
+        """Test that unlocking with a wrong PIN also counts against the limits."""
+        account = self.accounts[0]
+
+        for _ in range(2):
+            with self.assertRaises(PermissionError):
+                account.unlock_account("000000")
+
+        with self.assertRaisesRegex(PermissionError, "Too many failed"):
+            account.unlock_account("123456")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+from datetime import date, datetime
+
+from src.bank import Bank
+from src.bank_account import BankAccount
+from src.rollups import DailyRollups
+from src.user import User
+
+
+class TestDailyRollups(unittest.TestCase):
+    """Test cases for the DailyRollups class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.bank = Bank(
+            name="PKO BP", bank_code="1120", currencies={"PLN": 1.0, "EUR": 4.0}
+        )
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+
+        self.account = BankAccount(self.user, self.bank, "123456", balance=1000)
+        self.number = self.account.account_number
+        self.bank.add_new_transaction(
+            {"type": "deposit", "amount": 100, "date": datetime(2024, 1, 31, 9)},
+            self.number,
+        )
+        self.rollups = DailyRollups(self.bank)
+
+    def _add(self, transaction_type, amount, day):
+        self.bank.add_new_transaction(
+            {"type": transaction_type, "amount": amount, "date": day}, self.number
+        )
+
+    def test_backfills_existing_ledgers(self):
+        """Test that transactions recorded before attaching are rolled up."""
+        self.assertEqual(self.rollups.monthly(self.number, 2024, 1)["sum_in"], 100)
+
+    def test_daily_buckets(self):
+        """Test that each day gets its own bucket with in and out totals."""
+        self._add("deposit", 50, datetime(2024, 2, 1, 10))
+        self._add("withdraw", 20, datetime(2024, 2, 1, 18))
+        self._add("transfer", 5, datetime(2024, 2, 3))
+
+        daily = self.rollups.daily(self.number, date(2024, 2, 1), date(2024, 2, 29))
+
+        self.assertEqual(
+            [day for day, _ in daily], [date(2024, 2, 1), date(2024, 2, 3)]
+        )
+        self.assertEqual(daily[0][1]["count"], 2)
+        self.assertEqual(daily[0][1]["sum_in"], 50)
+        self.assertEqual(daily[0][1]["sum_out"], 20)
+        self.assertEqual(
+            daily[1][1]["by_type"], {"transfer": {"count": 1, "amount": 5}}
+        )
+
+    def test_monthly_derived_from_daily(self):
+        """Test that monthly totals sum the days of the month only."""
+        self._add("deposit", 50, datetime(2024, 2, 1))
+        self._add("withdraw", 20, datetime(2024, 2, 29, 23, 59))
+        self._add("withdraw", 7, datetime(2024, 3, 1))
+
+        february = self.rollups.monthly(self.number, 2024, 2)
+
+        self.assertEqual(february["count"], 2)
+        self.assertEqual(february["sum_in"], 50)
+        self.assertEqual(february["sum_out"], 20)
+        self.assertEqual(self.rollups.monthly(self.number, 2024, 12)["count"], 0)
+
+    def test_live_operations_are_rolled_up(self):
+        """Test that account operations update the buckets."""
+        self.account.deposit(10, "123456")
+        self.account.withdraw(4, "123456")
+
+        today = date.today()
+        totals = self.rollups.summary(self.number, today, today)
+
+        self.assertEqual(totals["sum_in"], 10)
+        self.assertEqual(totals["sum_out"], 4)
+
+    def test_non_monetary_transactions(self):
+        """Test that transactions without an amount are counted only."""
+        self.account.change_currency("EUR", "123456")
+        today = date.today()
+
+        totals = self.rollups.summary(self.number, today, today)
+
+        self.assertEqual(
+            totals["by_type"]["currency_change"], {"count": 1, "amount": 0}
+        )
+        self.assertEqual(totals["sum_in"], 0)
+
+    def test_invalid_ranges(self):
+        """Test validation of ranges and months."""
+        with self.assertRaises(TypeError):
+            self.rollups.summary(self.number, "2024-01-01", date(2024, 1, 2))
+
+        with self.assertRaises(ValueError):
+            self.rollups.summary(self.number, date(2024, 2, 1), date(2024, 1, 1))
+
+        with self.assertRaises(ValueError):
+            self.rollups.monthly(self.number, 2024, 13)
+
+    def test_unknown_account(self):
+        """Test that an account without activity has empty totals."""
+        self.assertEqual(
+            self.rollups.summary("missing", date(2024, 1, 1), date(2024, 12, 31)),
+            {"count": 0, "sum_in": 0, "sum_out": 0, "by_type": {}},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
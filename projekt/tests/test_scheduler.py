@@ -0,0 +1,222 @@
+import time
+import unittest
+
+from src.bank import Bank
+from src.bank_account import BankAccount
+from src.scheduler import DAY, Scheduler, SimulatedClock
+from src.user import User
+
+
+class TestScheduler(unittest.TestCase):
+    """Test cases for the Scheduler class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.bank = Bank(name="PKO BP", bank_code="1120", currencies={"PLN": 1.0})
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+
+        self.source = BankAccount(self.user, self.bank, "123456", balance=1000)
+        self.target = BankAccount(self.user, self.bank, "123456")
+        self.clock = SimulatedClock()
+        self.scheduler = Scheduler(self.bank, clock=self.clock)
+
+    def test_invalid_arguments(self):
+        """Test invalid scheduler and job parameters."""
+        with self.assertRaises(ValueError):
+            Scheduler(self.bank, batch_size=0)
+
+        with self.assertRaises(ValueError):
+            self.scheduler.schedule(("x", "deposit", 1, "123456"), interval=0)
+
+        with self.assertRaises(ValueError):
+            self.scheduler.schedule(("x", "deposit", 1, "123456"), interval=1, times=0)
+
+        with self.assertRaises(ValueError):
+            self.scheduler.schedule(("x", "withdrew", 1, "123456"))
+
+        with self.assertRaises(ValueError):
+            self.scheduler.cancel(99)
+
+        with self.assertRaises(ValueError):
+            self.clock.advance(-1)
+
+        with self.assertRaises(TypeError):
+            Scheduler(self.bank).run_until(10)
+
+    def test_one_shot_job(self):
+        """Test that a job without an interval runs once when due."""
+        self.scheduler.schedule(
+            (self.source.account_number, "withdraw", 100, "123456"), at=10
+        )
+
+        self.assertEqual(self.scheduler.run_pending(), (0, []))
+        self.clock.advance(10)
+        self.assertEqual(self.scheduler.run_pending(), (1, []))
+        self.assertEqual(self.scheduler.run_pending(), (0, []))
+        self.assertEqual(self.source.balance, 900)
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_standing_order_for_a_month(self):
+        """Test a daily transfer fast-forwarded through a month."""
+        self.scheduler.schedule(
+            (
+                self.source.account_number,
+                "transfer",
+                10,
+                self.target.account_number,
+                "123456",
+                self.bank,
+            ),
+            at=DAY,
+            interval=DAY,
+        )
+
+        executed, failures = self.scheduler.run_until(30 * DAY)
+
+        self.assertEqual(executed, 30)
+        self.assertEqual(failures, [])
+        self.assertEqual(self.target.balance, 300)
+        self.assertEqual(self.clock.now, 30 * DAY)
+        self.assertEqual(self.scheduler.next_run(), 31 * DAY)
+
+    def test_missed_runs_catch_up(self):
+        """Test that a recurring job runs once per missed interval."""
+        self.scheduler.schedule(
+            (self.source.account_number, "withdraw", 1, "123456"),
+            at=0,
+            interval=DAY,
+            times=5,
+        )
+
+        executed, _ = self.scheduler.run_pending(now=10 * DAY)
+
+        self.assertEqual(executed, 5)
+        self.assertEqual(self.source.balance, 995)
+        self.assertIsNone(self.scheduler.next_run())
+
+    def test_interest_posting_computed_at_run_time(self):
+        """Test that callable jobs build their operation when they fire."""
+
+        def post_interest():
+            interest = self.source.calculate_intrest(30)
+            return (self.source.account_number, "deposit", interest, "123456")
+
+        self.scheduler.schedule(post_interest, at=30 * DAY, interval=30 * DAY)
+
+        self.scheduler.run_until(60 * DAY)
+
+        self.assertAlmostEqual(self.source.balance, 1002.47, places=2)
+
+    def test_failures_are_reported(self):
+        """Test that failing runs do not stop the batch and are reported."""
+        fee = self.scheduler.schedule(
+            (self.target.account_number, "withdraw", 5, "123456"), at=0
+        )
+        self.scheduler.schedule(
+            (self.source.account_number, "withdraw", 5, "123456"), at=0
+        )
+
+        executed, failures = self.scheduler.run_pending(now=0)
+
+        self.assertEqual(executed, 2)
+        self.assertEqual(failures[0][0], fee)
+        self.assertIsInstance(failures[0][1], ValueError)
+        self.assertEqual(self.source.balance, 995)
+
+    def test_raising_job_is_reported(self):
+        """Test that a callable job that raises does not lose the other runs."""
+
+        def broken():
+            raise RuntimeError("rate service down")
+
+        self.scheduler.schedule(
+            (self.source.account_number, "withdraw", 5, "123456"),
+            at=0,
+            interval=DAY,
+        )
+        job = self.scheduler.schedule(broken, at=0, interval=DAY)
+        self.scheduler.schedule(
+            (self.source.account_number, "withdraw", 5, "123456"), at=0
+        )
+
+        executed, failures = self.scheduler.run_pending(now=0)
+
+        self.assertEqual(executed, 3)
+        self.assertEqual(failures[0][0], job)
+        self.assertIsInstance(failures[0][1], RuntimeError)
+        self.assertEqual(self.source.balance, 990)
+        self.assertEqual(self.scheduler.next_run(), DAY)
+        self.assertEqual(self.scheduler.jobs[job].failures, 1)
+
+    def test_unsupported_operation_fails_alone(self):
+        """Test that an unsupported operation does not block jobs due with it."""
+        self.scheduler.schedule(
+            (self.source.account_number, "withdraw", 5, "123456"), at=10
+        )
+        job = self.scheduler.schedule(
+            lambda: (self.source.account_number, "withdrew", 5, "123456"), at=10
+        )
+
+        executed, failures = self.scheduler.run_until(10)
+
+        self.assertEqual(executed, 2)
+        self.assertEqual([job_id for job_id, _ in failures], [job])
+        self.assertIsInstance(failures[0][1], ValueError)
+        self.assertEqual(self.source.balance, 995)
+
+    def test_cancel(self):
+        """Test that cancelled jobs are skipped."""
+        job_id = self.scheduler.schedule(
+            (self.source.account_number, "withdraw", 1, "123456"), at=0, interval=DAY
+        )
+        self.scheduler.cancel(job_id)
+
+        self.assertEqual(self.scheduler.run_until(10 * DAY), (0, []))
+        self.assertEqual(self.source.balance, 1000)
+
+    def test_batches_are_bounded(self):
+        """Test that due runs are split into bulk calls of the batch size."""
+        scheduler = Scheduler(self.bank, clock=self.clock, batch_size=2)
+        calls = []
+        execute_bulk = self.bank.execute_bulk
+        self.bank.execute_bulk = lambda batch: calls.append(len(batch)) or execute_bulk(
+            batch
+        )
+
+        for _ in range(5):
+            scheduler.schedule((self.source.account_number, "deposit", 1, "123456"))
+
+        scheduler.run_pending()
+
+        self.assertEqual(calls, [2, 2, 1])
+
+    def test_month_for_many_accounts_is_fast(self):
+        """Test fast-forwarding a month of daily fees for thousands of accounts."""
+        accounts = [
+            BankAccount(self.user, self.bank, "123456", balance=100)
+            for _ in range(2000)
+        ]
+        for account in accounts:
+            self.scheduler.schedule(
+                (account.account_number, "withdraw", 1, "123456"), at=DAY, interval=DAY
+            )
+
+        start = time.perf_counter()
+        executed, failures = self.scheduler.run_until(30 * DAY)
+
+        self.assertEqual(executed, 60000)
+        self.assertEqual(failures, [])
+        self.assertEqual(accounts[0].balance, 70)
+        self.assertLess(time.perf_counter() - start, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
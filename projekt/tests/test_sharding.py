@@ -0,0 +1,230 @@
+import multiprocessing
+import unittest
+from unittest.mock import patch
+
+from src.user import User
+from src.sharding import ShardedBank, _ShardWorker, shard_of
+
+
+class TestShardOf(unittest.TestCase):
+    """Test cases for the shard_of function."""
+
+    def test_shard_of_is_stable(self):
+        """Test that account placement is deterministic and within range."""
+        shards = [shard_of(f"1120{number:022d}", 4) for number in range(100)]
+
+        self.assertEqual(shards, [shard_of(f"1120{n:022d}", 4) for n in range(100)])
+        self.assertTrue(all(0 <= shard < 4 for shard in shards))
+        self.assertEqual(set(shards), {0, 1, 2, 3})
+
+
+class TestShardedBank(unittest.TestCase):
+    """Test cases for the ShardedBank class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the shard workers once for all tests."""
+        cls.bank = ShardedBank(
+            name="PKO BP",
+            bank_code="1120",
+            currencies={"PLN": 1.0, "EUR": 4.0},
+            shards=2,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the shard workers."""
+        cls.bank.close()
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+
+    def _open_on_shard(self, shard, balance=1000, currency="PLN"):
+        while True:
+            account_number = self.bank.open_account(
+                self.user, "123456", balance=balance, currency=currency
+            )
+            if shard_of(account_number, self.bank.shards) == shard:
+                return account_number
+
+    def test_invalid_shard_count(self):
+        """Test creating a sharded bank without shards."""
+        with self.assertRaises(ValueError):
+            ShardedBank("PKO BP", "1120", {"PLN": 1.0}, shards=0)
+
+    def test_open_account_and_operations(self):
+        """Test that account operations are routed to the owning shard."""
+        account_number = self.bank.open_account(self.user, "123456", balance=100)
+
+        self.bank.deposit(50, account_number, "123456")
+        self.bank.withdraw(30, account_number, "123456")
+
+        self.assertEqual(self.bank.get_balance(account_number), (120.0, "PLN"))
+        self.assertEqual(len(self.bank.get_transactions(account_number)), 2)
+
+    def test_errors_are_raised_in_router(self):
+        """Test that exceptions raised on a shard reach the caller."""
+        account_number = self.bank.open_account(self.user, "123456", balance=100)
+
+        with self.assertRaises(PermissionError):
+            self.bank.withdraw(10, account_number, "000000")
+
+        with self.assertRaises(ValueError):
+            self.bank.get_balance("missing")
+
+        with self.assertRaises(ValueError):
+            self.bank.call(account_number, "transfer", 10)
+
+    def test_same_shard_transfer(self):
+        """Test a transfer between accounts on the same shard."""
+        source = self._open_on_shard(0)
+        target = self._open_on_shard(0, balance=0)
+
+        result = self.bank.transfer(100, source, target, "123456")
+
+        self.assertTrue(result)
+        self.assertEqual(self.bank.get_balance(source), (900.0, "PLN"))
+        self.assertEqual(self.bank.get_balance(target), (100.0, "PLN"))
+        self.assertEqual(self.bank.get_transactions(source)[0]["bank"], "1120")
+
+    def test_cross_shard_transfer(self):
+        """Test a two-phase transfer between shards with currency conversion."""
+        source = self._open_on_shard(0)
+        target = self._open_on_shard(1, balance=0, currency="EUR")
+
+        result = self.bank.transfer(100, source, target, "123456")
+
+        self.assertTrue(result)
+        self.assertEqual(self.bank.get_balance(source), (900.0, "PLN"))
+        self.assertEqual(self.bank.get_balance(target), (25.0, "EUR"))
+
+        incoming = self.bank.get_transactions(target)[0]
+        self.assertEqual(incoming["type"], "incoming_transfer")
+        self.assertEqual(incoming["from"], source)
+
+    def test_cross_shard_transfer_aborts(self):
+        """Test that a failed prepare on the target drops the prepared debit."""
+        source = self._open_on_shard(0)
+        target = self._open_on_shard(1, balance=0)
+        self.bank.call(target, "close", "123456")
+
+        with self.assertRaises(ValueError):
+            self.bank.transfer(100, source, target, "123456")
+
+        with self.assertRaises(ValueError):
+            self.bank.transfer(5000, source, target, "123456")
+
+        self.assertEqual(self.bank.get_balance(source), (1000.0, "PLN"))
+        self.assertEqual(self.bank.get_transactions(source), [])
+
+    def test_failed_commit_leaves_no_reply_behind(self):
+        """Test that a failing commit does not desynchronize the source shard."""
+        with patch.object(
+            _ShardWorker, "op_commit_credit", side_effect=RuntimeError("disk full")
+        ):
+            bank = ShardedBank(
+                "PKO BP",
+                "1120",
+                {"PLN": 1.0},
+                shards=2,
+                context=multiprocessing.get_context("fork"),
+            )
+
+        with bank:
+            source = bank.open_account(self.user, "123456", balance=1000)
+            while True:
+                target = bank.open_account(self.user, "123456")
+                if shard_of(target, 2) != shard_of(source, 2):
+                    break
+
+            with self.assertRaises(RuntimeError):
+                bank.transfer(100, source, target, "123456")
+
+            self.assertEqual(bank.get_balance(source), (900.0, "PLN"))
+            self.assertEqual(bank.get_balance(target), (0, "PLN"))
+
+    def test_execute_batch(self):
+        """Test that batched operations return results in input order."""
+        first = self._open_on_shard(0, balance=0)
+        second = self._open_on_shard(1, balance=0)
+
+        results = self.bank.execute_batch(
+            [
+                (first, "deposit", 10, "123456"),
+                (second, "deposit", 20, "123456"),
+                (first, "withdraw", 50, "123456"),
+            ]
+        )
+
+        self.assertEqual(results[0], (True, True))
+        self.assertEqual(results[1], (True, True))
+        self.assertFalse(results[2][0])
+        self.assertIsInstance(results[2][1], ValueError)
+        self.assertEqual(self.bank.get_balance(second), (20.0, "PLN"))
+
+
+class TestShardWorker(unittest.TestCase):
+    """Test cases for the two-phase transfer steps of a shard worker."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.source = _ShardWorker("PKO BP", "1120", {"PLN": 1.0, "EUR": 4.0})
+        self.target = _ShardWorker("PKO BP", "1120", {"PLN": 1.0, "EUR": 4.0})
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+        self.from_number = self.source.handle(
+            "open_account", (self.user, "123456", 1000, "PLN", "1120" + "0" * 22)
+        )
+        self.to_number = self.target.handle(
+            "open_account", (self.user, "123456", 0, "PLN", "1120" + "1" * 22)
+        )
+
+    def test_prepare_debit_runs_pre_commit_checks(self):
+        """Test that cross-shard debits go through the bank's pre-commit checks."""
+        calls = []
+
+        def check(account, operation, amount, to_account):
+            calls.append((operation, amount, to_account))
+            raise PermissionError("Velocity limit exceeded.")
+
+        self.source.bank.add_pre_commit_check(check)
+
+        with self.assertRaises(PermissionError):
+            self.source.handle("prepare_debit", (1, self.from_number, 100, "123456"))
+
+        self.assertEqual(calls, [("transfer", 100.0, None)])
+        self.assertEqual(self.source.prepared, {})
+
+    def test_commit_rounds_like_bank_account_transfer(self):
+        """Test that same-currency debits are rounded to cents."""
+        amount, currency = self.source.handle(
+            "prepare_debit", (1, self.from_number, 10.004, "123456")
+        )
+        target_currency = self.target.handle(
+            "prepare_credit", (1, self.to_number, amount, currency)
+        )
+        self.target.handle("commit_credit", (1, self.from_number, None))
+        self.source.handle(
+            "commit_debit", (1, self.to_number, None, target_currency == currency)
+        )
+
+        self.assertEqual(self.source.bank.accounts[self.from_number].balance, 990.0)
+        self.assertEqual(self.target.bank.accounts[self.to_number].balance, 10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import gc
+import unittest
+from datetime import datetime
+
+from src.bank import Bank
+from src.bank_account import BankAccount, AccountStatus
+from src.user import User
+
+
+class TestBankSnapshot(unittest.TestCase):
+    """Test cases for the BankSnapshot class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.bank = Bank(
+            name="PKO BP", bank_code="1120", currencies={"PLN": 1.0, "EUR": 4.0}
+        )
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+
+        self.account1 = BankAccount(self.user, self.bank, "123456", balance=1000)
+        self.account2 = BankAccount(self.user, self.bank, "123456", balance=500)
+        self.account1.deposit(100, "123456")
+
+    def test_snapshot_sees_state_at_creation(self):
+        """Test that the view keeps showing balances from when it was taken."""
+        snapshot = self.bank.snapshot_view()
+
+        self.account1.transfer(300, self.account2.account_number, "123456", self.bank)
+        self.account2.change_currency("EUR", "123456")
+
+        self.assertEqual(
+            snapshot.get_account(self.account1.account_number)["balance"], 1100
+        )
+        self.assertEqual(
+            snapshot.get_account(self.account2.account_number),
+            {"balance": 500, "status": AccountStatus.ACTIVE, "currency": "PLN"},
+        )
+        self.assertEqual(snapshot.total_balances(), {"PLN": 1600})
+        self.assertEqual(self.account1.balance, 800)
+
+    def test_snapshot_ledger_uses_watermark(self):
+        """Test that ledger entries appended after the view are hidden."""
+        snapshot = self.bank.snapshot_view()
+
+        self.account1.withdraw(50, "123456")
+        self.account2.deposit(10, "123456")
+
+        ledger1 = snapshot.get_transactions(self.account1.account_number)
+        ledger2 = snapshot.get_transactions(self.account2.account_number)
+
+        self.assertEqual([transaction["type"] for transaction in ledger1], ["deposit"])
+        self.assertEqual(ledger2, [])
+        self.assertEqual(len(self.account1.get_transactions()), 2)
+
+    def test_snapshot_by_date(self):
+        """Test date filtering on the view."""
+        snapshot = self.bank.snapshot_view()
+        self.account1.withdraw(50, "123456")
+
+        transactions = snapshot.get_transactions_by_date(
+            datetime(2000, 1, 1), datetime(2100, 1, 1), self.account1.account_number
+        )
+
+        self.assertEqual(len(transactions), 1)
+
+        with self.assertRaises(TypeError):
+            snapshot.get_transactions_by_date("2000", "2100", "x")
+
+        with self.assertRaises(ValueError):
+            snapshot.get_transactions_by_date(
+                datetime(2100, 1, 1), datetime(2000, 1, 1), "x"
+            )
+
+    def test_accounts_opened_later_are_hidden(self):
+        """Test that accounts opened after the view are not part of it."""
+        snapshot = self.bank.snapshot_view()
+        account3 = BankAccount(self.user, self.bank, "123456", balance=1)
+
+        self.assertNotIn(account3.account_number, snapshot.account_numbers())
+
+        with self.assertRaises(ValueError):
+            snapshot.get_account(account3.account_number)
+
+    def test_status_changes_are_isolated(self):
+        """Test that status changes after the view are not visible in it."""
+        snapshot = self.bank.snapshot_view()
+
+        self.account2.withdraw(500, "123456")
+        self.account2.close("123456")
+
+        state = snapshot.get_account(self.account2.account_number)
+        self.assertEqual(state["status"], AccountStatus.ACTIVE)
+        self.assertEqual(state["balance"], 500)
+
+    def test_close_stops_tracking(self):
+        """Test that a closed view no longer receives copies and cannot be read."""
+        with self.bank.snapshot_view() as snapshot:
+            self.assertEqual(len(self.bank.snapshots), 1)
+
+        self.account1.withdraw(50, "123456")
+
+        self.assertEqual(self.bank.snapshots, {})
+        self.assertEqual(snapshot.preserved, {})
+
+        with self.assertRaises(ValueError):
+            snapshot.get_account(self.account1.account_number)
+
+    def test_dropped_snapshot_unregisters(self):
+        """Test that garbage-collected views stop costing writers anything."""
+        self.bank.snapshot_view()
+        gc.collect()
+
+        self.assertEqual(self.bank.snapshots, {})
+
+    def test_multiple_snapshots(self):
+        """Test that each view keeps its own point in time."""
+        first = self.bank.snapshot_view()
+        self.account1.withdraw(100, "123456")
+        second = self.bank.snapshot_view()
+        self.account1.withdraw(100, "123456")
+
+        number = self.account1.account_number
+        self.assertEqual(first.get_account(number)["balance"], 1100)
+        self.assertEqual(second.get_account(number)["balance"], 1000)
+        self.assertEqual(len(first.get_transactions(number)), 1)
+        self.assertEqual(len(second.get_transactions(number)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
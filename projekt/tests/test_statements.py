@@ -0,0 +1,179 @@
+import csv
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from src.bank import Bank
+from src.bank_account import BankAccount
+from src.rollups import DailyRollups
+from src.statements import StatementGenerator, build_statement
+from src.storage import SQLiteStorage
+from src.user import User
+
+PERIOD = (datetime(2024, 1, 1), datetime(2024, 1, 31, 23, 59, 59))
+
+
+class TestStatements(unittest.TestCase):
+    """Test cases for statement building and the StatementGenerator class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.bank = Bank(name="PKO BP", bank_code="1120", currencies={"PLN": 1.0})
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+
+        self.accounts = [
+            BankAccount(self.user, self.bank, "123456", balance=100) for _ in range(6)
+        ]
+        for index, account in enumerate(self.accounts):
+            for day, transaction_type in ((5, "deposit"), (20, "withdraw")):
+                self.bank.add_new_transaction(
+                    {
+                        "type": transaction_type,
+                        "amount": 10 * (index + 1),
+                        "date": datetime(2024, 1, day),
+                    },
+                    account.account_number,
+                )
+            self.bank.add_new_transaction(
+                {"type": "deposit", "amount": 1, "date": datetime(2024, 2, 1)},
+                account.account_number,
+            )
+
+    def tearDown(self):
+        """Remove generated files."""
+        self.directory.cleanup()
+
+    def test_build_statement(self):
+        """Test that a statement holds the period's transactions and totals."""
+        statement = build_statement(self.bank, self.accounts[1].account_number, *PERIOD)
+
+        self.assertEqual(statement["owner"], "John Doe")
+        self.assertEqual(len(statement["transactions"]), 2)
+        self.assertEqual(
+            statement["totals"], {"count": 2, "sum_in": 20.0, "sum_out": 20.0}
+        )
+
+        with self.assertRaises(ValueError):
+            build_statement(self.bank, "missing", *PERIOD)
+
+    def test_build_statement_with_rollups(self):
+        """Test that rollup totals are used for periods of whole days."""
+        rollups = DailyRollups(self.bank)
+
+        statement = build_statement(
+            self.bank,
+            self.accounts[0].account_number,
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 31, 23, 59, 59, 999999),
+            rollups=rollups,
+        )
+
+        self.assertEqual(statement["totals"]["sum_in"], 10)
+        self.assertEqual(statement["totals"]["by_type"]["withdraw"]["count"], 1)
+
+    def test_partial_day_period_ignores_rollups(self):
+        """Test that totals match the listed transactions of partial-day periods."""
+        rollups = DailyRollups(self.bank)
+
+        statement = build_statement(
+            self.bank,
+            self.accounts[0].account_number,
+            datetime(2024, 1, 5, 12),
+            datetime(2024, 2, 1, 12),
+            rollups=rollups,
+        )
+
+        self.assertEqual(len(statement["transactions"]), 2)
+        self.assertEqual(
+            statement["totals"], {"count": 2, "sum_in": 1.0, "sum_out": 10.0}
+        )
+
+    def test_generate_text_in_process(self):
+        """Test rendering text statements without worker processes."""
+        generator = StatementGenerator(
+            self.bank, self.directory.name, workers=1, shards=3
+        )
+
+        paths, count = generator.generate(*PERIOD)
+
+        self.assertEqual(count, 6)
+        self.assertEqual(len(paths), 3)
+        content = "".join(open(path, encoding="utf-8").read() for path in paths)
+        for account in self.accounts:
+            self.assertIn(f"Statement for account {account.account_number}", content)
+        self.assertNotIn("2024-02-01", content)
+
+    def test_generate_csv_with_workers(self):
+        """Test rendering CSV statements across forked workers."""
+        generator = StatementGenerator(
+            self.bank, self.directory.name, workers=2, format="csv"
+        )
+
+        paths, count = generator.generate(*PERIOD)
+
+        rows = []
+        for path in paths:
+            with open(path, newline="", encoding="utf-8") as stream:
+                reader = csv.reader(stream)
+                self.assertEqual(next(reader)[0], "account_number")
+                rows.extend(reader)
+
+        self.assertEqual(count, 6)
+        self.assertEqual(len(rows), 12)
+        self.assertTrue(all(os.path.basename(path).endswith(".csv") for path in paths))
+
+    def test_storage_backed_bank_is_rendered_serially(self):
+        """Test that banks with a database connection are not forked."""
+        storage = SQLiteStorage(":memory:")
+        bank = Bank(
+            name="PKO BP", bank_code="1120", currencies={"PLN": 1.0}, storage=storage
+        )
+        account = BankAccount(self.user, bank, "123456", balance=100)
+        account.deposit(10, "123456")
+        generator = StatementGenerator(bank, self.directory.name, workers=2)
+
+        with patch("src.statements.multiprocessing.get_context") as get_context:
+            _, count = generator.generate(datetime(2000, 1, 1), datetime(2100, 1, 1))
+
+        get_context.assert_not_called()
+        self.assertEqual(count, 1)
+        storage.close()
+
+    def test_generate_selected_accounts(self):
+        """Test rendering statements for a subset of accounts."""
+        generator = StatementGenerator(self.bank, self.directory.name, workers=1)
+
+        _, count = generator.generate(*PERIOD, [self.accounts[0].account_number])
+
+        self.assertEqual(count, 1)
+
+    def test_invalid_arguments(self):
+        """Test invalid formats, counts and periods."""
+        with self.assertRaises(ValueError):
+            StatementGenerator(self.bank, self.directory.name, format="pdf")
+
+        with self.assertRaises(ValueError):
+            StatementGenerator(self.bank, self.directory.name, workers=-1)
+
+        generator = StatementGenerator(self.bank, self.directory.name, workers=1)
+
+        with self.assertRaises(TypeError):
+            generator.generate("2024-01-01", "2024-01-31")
+
+        with self.assertRaises(ValueError):
+            generator.generate(PERIOD[1], PERIOD[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
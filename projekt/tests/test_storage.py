@@ -0,0 +1,225 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from src.auth import Auth
+from src.bank import Bank
+from src.bank_account import BankAccount, AccountStatus
+from src.storage import SQLiteStorage
+from src.user import User
+
+CURRENCIES = {"PLN": 1.0, "EUR": 4.0}
+
+
+class TestSQLiteStorage(unittest.TestCase):
+    """Test cases for the SQLiteStorage backend."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "bank.db")
+        self.storage = SQLiteStorage(self.path)
+        self.bank = Bank(
+            name="PKO BP",
+            bank_code="1120",
+            currencies=CURRENCIES,
+            storage=self.storage,
+        )
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+        self.auth = Auth()
+        self.auth.login(self.user, "john.doe@example.com", "Password123!")
+
+    def tearDown(self):
+        """Close the database and remove its files."""
+        self.storage.connection.close()
+        self.directory.cleanup()
+
+    def _reopen(self):
+        self.storage.close()
+        self.storage = SQLiteStorage(self.path)
+        self.bank = Bank(
+            name="PKO BP",
+            bank_code="1120",
+            currencies=CURRENCIES,
+            storage=self.storage,
+        )
+
+    def test_invalid_parameters(self):
+        """Test creating storage with invalid cache or batch sizes."""
+        with self.assertRaises(ValueError):
+            SQLiteStorage(":memory:", cache_size=0)
+
+        with self.assertRaises(ValueError):
+            SQLiteStorage(":memory:", batch_size=0)
+
+    def test_wal_journal_mode(self):
+        """Test that the database uses write-ahead logging."""
+        mode = self.storage.connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+        self.assertEqual(mode, "wal")
+
+    def test_user_api_works_unchanged(self):
+        """Test that User operations work on a storage-backed bank."""
+        self.user.open_bank_account(self.bank, "123456", balance=100)
+        account_number = next(iter(self.user.bank_accounts))
+
+        self.user.deposit(50, account_number, "123456", self.auth)
+        self.user.withdraw(30, account_number, "123456", self.auth)
+
+        self.assertEqual(self.user.get_balance(account_number, self.auth), "120.0 PLN")
+        self.assertEqual(len(self.bank.get_transactions(account_number)), 2)
+        self.assertIn(account_number, self.bank.accounts)
+        self.assertEqual(len(self.bank.accounts), 1)
+
+    def test_state_survives_reopen(self):
+        """Test that users, accounts and ledgers are durable."""
+        self.user.open_bank_account(self.bank, "123456", balance=100, currency="EUR")
+        account_number = next(iter(self.user.bank_accounts))
+        account = self.bank.accounts[account_number]
+        account.deposit(25, "123456")
+        account.status = AccountStatus.LOCKED
+
+        self._reopen()
+        account = self.bank.accounts[account_number]
+
+        self.assertEqual(account.balance, 125)
+        self.assertEqual(account.currency, "EUR")
+        self.assertEqual(account.status, AccountStatus.LOCKED)
+        self.assertEqual(
+            self.bank.list_accounts(status=AccountStatus.LOCKED), ([account], 1)
+        )
+        self.assertEqual(account.owner.email, "john.doe@example.com")
+        self.assertIs(account.owner, self.bank.get_user(1))
+        self.assertTrue(account.owner.check_password("Password123!"))
+        self.assertEqual(account.get_transactions()[0]["amount"], 25)
+        self.assertIsInstance(account.get_transactions()[0]["date"], datetime)
+
+    def test_reopened_user_api(self):
+        """Test that reloaded users own their stored accounts."""
+        self.user.open_bank_account(self.bank, "123456", balance=100)
+        account_number = next(iter(self.user.bank_accounts))
+
+        self._reopen()
+        user = self.bank.get_user(1)
+        self.auth = Auth()
+        self.auth.login(user, "john.doe@example.com", "Password123!")
+
+        self.assertEqual(list(user.bank_accounts), [account_number])
+        self.assertIs(
+            user.bank_accounts[account_number], self.bank.accounts[account_number]
+        )
+        self.assertEqual(user.get_balance(account_number, self.auth), "100.0 PLN")
+
+        user.deposit(20, account_number, "123456", self.auth)
+
+        self.assertEqual(user.get_total_balance(self.auth), {"PLN": 120.0})
+
+    def test_state_changes_are_queued(self):
+        """Test that status and PIN changes are written with the next batch."""
+        account = BankAccount(self.user, self.bank, "123456")
+        self.storage.flush()
+
+        account.status = AccountStatus.LOCKED
+        account.pin = "654321"
+        self.storage._write_pending()
+
+        row = self.storage.connection.execute(
+            "SELECT status, pin FROM accounts WHERE account_number = ?",
+            (account.account_number,),
+        ).fetchone()
+        self.assertEqual(row, (AccountStatus.LOCKED.value, "654321"))
+
+    def test_transfer_restores_bank_reference(self):
+        """Test that stored transfers refer back to the bank object."""
+        source = BankAccount(self.user, self.bank, "123456", balance=100)
+        target = BankAccount(self.user, self.bank, "123456")
+
+        source.transfer(40, target.account_number, "123456", self.bank)
+
+        transfer = source.get_transactions()[0]
+        incoming = target.get_transactions()[0]
+        self.assertIs(transfer["bank"], self.bank)
+        self.assertEqual(incoming["from"], source.account_number)
+        self.assertEqual(target.balance, 40)
+
+    def test_get_transactions_by_date(self):
+        """Test date-range queries against the indexed ledger."""
+        account_number = "11200000000000000000000001"
+        for month in (1, 2, 3):
+            self.bank.add_new_transaction(
+                {"type": "deposit", "amount": month, "date": datetime(2023, month, 15)},
+                account_number,
+            )
+
+        transactions = self.bank.get_transactions_by_date(
+            datetime(2023, 2, 1), datetime(2023, 3, 31), account_number
+        )
+
+        self.assertEqual(
+            [transaction["amount"] for transaction in transactions], [2, 3]
+        )
+
+        with self.assertRaises(ValueError):
+            self.bank.get_transactions_by_date(
+                datetime(2023, 3, 1), datetime(2023, 1, 1), account_number
+            )
+
+    def test_writes_are_batched(self):
+        """Test that ledger writes are queued until the batch is full."""
+        self.storage.batch_size = 3
+        account_number = "11200000000000000000000001"
+        transaction = {"type": "deposit", "amount": 1, "date": datetime.now()}
+
+        self.bank.add_new_transaction(transaction, account_number)
+        self.bank.add_new_transaction(transaction, account_number)
+        queued = len(self.storage.pending_transactions)
+        self.bank.add_new_transaction(transaction, account_number)
+
+        self.assertEqual(queued, 2)
+        self.assertEqual(self.storage.pending_transactions, [])
+
+    def test_account_cache_is_bounded(self):
+        """Test that only the hottest accounts are cached in memory."""
+        self.storage.cache_size = 2
+        numbers = [
+            BankAccount(self.user, self.bank, "123456", balance=index).account_number
+            for index in range(5)
+        ]
+
+        cached = list(self.bank.accounts.cache)
+        first = self.bank.accounts[numbers[0]]
+
+        self.assertEqual(cached, numbers[-2:])
+        self.assertEqual(first.balance, 0)
+        self.assertLessEqual(len(self.bank.accounts.cache), 2)
+        self.assertEqual(list(self.bank.accounts), numbers)
+
+    def test_live_account_keeps_identity(self):
+        """Test that an evicted account still referenced elsewhere is reused."""
+        self.storage.cache_size = 1
+        account = BankAccount(self.user, self.bank, "123456", balance=10)
+        BankAccount(self.user, self.bank, "123456")
+
+        account.balance = 99
+
+        self.assertIs(self.bank.accounts[account.account_number], account)
+
+    def test_accounts_cannot_be_deleted(self):
+        """Test that accounts cannot be removed from storage."""
+        account = BankAccount(self.user, self.bank, "123456")
+
+        with self.assertRaises(TypeError):
+            del self.bank.accounts[account.account_number]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+import unittest
+from datetime import datetime, timedelta
+
+from src.bank import Bank
+from src.bank_account import BankAccount
+from src.transfer_graph import TimeWindow, TransferGraph
+from src.user import User
+
+
+class TestTimeWindow(unittest.TestCase):
+    """Test cases for the TimeWindow class."""
+
+    def test_csr_groups_edges_by_source_in_time_order(self):
+        """Test the CSR layout of a window with out-of-order edges."""
+        window = TimeWindow()
+        window.add(2, 0, 5.0, 30)
+        window.add(0, 1, 1.0, 20)
+        window.add(0, 2, 2.0, 10)
+        window.add(1, 2, 3.0, 15)
+
+        nodes, offsets, targets, amounts, times = window.index()
+
+        self.assertEqual(list(nodes), [0, 1, 2])
+        self.assertEqual(list(offsets), [0, 2, 3, 4])
+        self.assertEqual(list(targets), [2, 1, 2, 0])
+        self.assertEqual(list(amounts), [2.0, 1.0, 3.0, 5.0])
+        self.assertEqual(list(times), [10, 20, 15, 30])
+        self.assertIs(window.index(), window.csr)
+
+        window.add(1, 0, 4.0, 40)
+        self.assertIsNone(window.csr)
+
+
+class TestTransferGraph(unittest.TestCase):
+    """Test cases for the TransferGraph class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.bank = Bank(
+            name="PKO BP", bank_code="1120", currencies={"PLN": 1.0, "EUR": 4.0}
+        )
+        self.start = datetime(2024, 1, 1, 12)
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+
+        self.accounts = [
+            BankAccount(self.user, self.bank, "123456", balance=1000) for _ in range(5)
+        ]
+        self.a, self.b, self.c, self.d, self.e = [
+            account.account_number for account in self.accounts
+        ]
+
+    def _transfer(self, source, target, amount, minutes):
+        self.bank.add_new_transaction(
+            {
+                "type": "transfer",
+                "to": target,
+                "bank": self.bank,
+                "amount": amount,
+                "date": self.start + timedelta(minutes=minutes),
+            },
+            source,
+        )
+
+    def test_invalid_window(self):
+        """Test graph creation with an invalid window."""
+        with self.assertRaises(TypeError):
+            TransferGraph(self.bank, window=3600)
+
+        with self.assertRaises(ValueError):
+            TransferGraph(self.bank, window=timedelta(0))
+
+    def test_backfill_and_listener(self):
+        """Test that edges come from the existing ledger and new transfers."""
+        self._transfer(self.a, self.b, 10, 0)
+        graph = TransferGraph(self.bank)
+        self._transfer(self.b, self.c, 10, 5)
+        self.bank.add_new_transaction(
+            {"type": "deposit", "amount": 5, "date": self.start}, self.a
+        )
+
+        self.assertEqual(len(graph), 2)
+
+    def test_trace_follows_time_ordered_chains(self):
+        """Test that money only moves on after it arrived."""
+        graph = TransferGraph(self.bank, window=timedelta(minutes=30))
+        self._transfer(self.a, self.b, 100, 10)
+        self._transfer(self.b, self.c, 90, 70)
+        self._transfer(self.c, self.d, 80, 130)
+        self._transfer(self.b, self.e, 50, 5)
+
+        trace = graph.trace(self.a, self.start, timedelta(hours=3))
+
+        self.assertEqual(
+            [(edge["from"], edge["to"], edge["hop"]) for edge in trace],
+            [(self.a, self.b, 1), (self.b, self.c, 2), (self.c, self.d, 3)],
+        )
+        self.assertEqual(trace[1]["date"], self.start + timedelta(minutes=70))
+        self.assertEqual(trace[2]["amount"], 80)
+
+    def test_trace_bounds(self):
+        """Test that traces stop at the hop, time and amount bounds."""
+        graph = TransferGraph(self.bank, window=timedelta(minutes=30))
+        self._transfer(self.a, self.b, 100, 10)
+        self._transfer(self.b, self.c, 90, 70)
+        self._transfer(self.c, self.d, 80, 130)
+        self._transfer(self.a, self.e, 1, 20)
+
+        self.assertEqual(
+            graph.reachable(self.a, self.start, timedelta(hours=3), max_hops=2),
+            {self.b: 1, self.e: 1, self.c: 2},
+        )
+        self.assertEqual(
+            graph.reachable(self.a, self.start, timedelta(hours=2)),
+            {self.b: 1, self.e: 1, self.c: 2},
+        )
+        self.assertEqual(
+            graph.reachable(self.a, self.start, timedelta(hours=3), min_amount=5),
+            {self.b: 1, self.c: 2, self.d: 3},
+        )
+        self.assertEqual(
+            graph.reachable(
+                self.a, self.start + timedelta(minutes=15), timedelta(hours=3)
+            ),
+            {self.e: 1},
+        )
+
+    def test_trace_uses_earliest_arrival(self):
+        """Test that a longer but earlier path opens later transfers."""
+        graph = TransferGraph(self.bank)
+        self._transfer(self.a, self.b, 10, 50)
+        self._transfer(self.a, self.c, 10, 10)
+        self._transfer(self.c, self.b, 10, 20)
+        self._transfer(self.b, self.d, 10, 30)
+
+        self.assertEqual(
+            graph.reachable(self.a, self.start, timedelta(hours=1)),
+            {self.b: 1, self.c: 1, self.d: 3},
+        )
+
+    def test_trace_converts_amounts_and_names_other_banks(self):
+        """Test amounts in PLN and nodes of other banks."""
+        euro = BankAccount(self.user, self.bank, "123456", currency="EUR")
+        graph = TransferGraph(self.bank)
+        self._transfer(euro.account_number, self.a, 10, 0)
+        self.bank.add_new_transaction(
+            {
+                "type": "interbank_transfer",
+                "to": "99",
+                "to_bank": "1140",
+                "amount": 20,
+                "date": self.start + timedelta(minutes=5),
+            },
+            self.a,
+        )
+
+        trace = graph.trace(euro.account_number, self.start, timedelta(hours=1))
+
+        self.assertEqual(
+            [(edge["to"], edge["amount"]) for edge in trace],
+            [(self.a, 40.0), ("1140/99", 20.0)],
+        )
+
+    def test_foreign_source_legs_are_skipped(self):
+        """Test that transfers of accounts held by other banks add no edges."""
+        other = Bank(
+            name="mBank", bank_code="1140", currencies={"PLN": 1.0, "EUR": 4.0}
+        )
+        foreign = BankAccount(self.user, other, "123456", balance=100, currency="EUR")
+        graph = TransferGraph(self.bank)
+
+        foreign.transfer(10, self.a, "123456", self.bank)
+
+        self.assertEqual(len(graph), 0)
+        self.assertEqual(
+            graph.trace(foreign.account_number, self.start, timedelta(days=3650)), []
+        )
+
+    def test_trace_invalid_arguments(self):
+        """Test traces with invalid arguments."""
+        graph = TransferGraph(self.bank)
+
+        with self.assertRaises(TypeError):
+            graph.trace(self.a, "2024-01-01", timedelta(hours=1))
+
+        with self.assertRaises(ValueError):
+            graph.trace(self.a, self.start, timedelta(hours=1), max_hops=0)
+
+        self.assertEqual(graph.trace("missing", self.start, timedelta(hours=1)), [])
+
+    def test_nodes_added_after_indexing(self):
+        """Test tracing from nodes without edges in an indexed window."""
+        graph = TransferGraph(self.bank)
+        self._transfer(self.a, self.b, 10, 0)
+        graph.trace(self.a, self.start, timedelta(hours=1))
+
+        graph.node("1140/99")
+        self._transfer(self.c, self.d, 10, 70)
+
+        self.assertEqual(graph.reachable("1140/99", self.start, timedelta(hours=3)), {})
+        self.assertEqual(
+            graph.reachable(self.c, self.start, timedelta(hours=3)), {self.d: 1}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -66,7 +66,9 @@ class TestUser(unittest.TestCase):
         self.assertEqual(user.name, "John")
         self.assertEqual(user.last_name, "Doe")
         self.assertEqual(user.email, "example@gmail.com")
-        self.assertEqual(user.password, "Password123!")
+        self.assertNotIn("Password123!", user.password_hash)
+        self.assertTrue(user.check_password("Password123!"))
+        self.assertFalse(user.check_password("Password124!"))
         self.assertEqual(user.phone, "+48 523-456-789")
         self.assertEqual(user.role, UserRole.USER)
         self.assertEqual(user.bank_accounts, {})
@@ -337,9 +339,7 @@ class TestUser(unittest.TestCase):
     def test_close_bank_account_success(self):
         """Test that user can successfully close a bank account."""
 
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         self.user.withdraw(
             account_number="123456789", pin_code="123456", amount=1000, auth=self.auth
@@ -362,9 +362,7 @@ class TestUser(unittest.TestCase):
             bank=self.bank2, pin_code="654321", balance=500, currency="EUR"
         )
 
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         result = self.user.get_total_balance(auth=self.auth)
 
@@ -381,9 +379,7 @@ class TestUser(unittest.TestCase):
 
         self.user.open_bank_account(bank=self.bank2, pin_code="654321", balance=500)
 
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         result = self.user.get_total_balance(auth=self.auth)
 
@@ -393,9 +389,7 @@ class TestUser(unittest.TestCase):
     def test_get_balance_success(self):
         """Test that user can get balance from a bank account."""
 
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         result = self.user.get_balance(auth=self.auth, account_number="123456789")
 
@@ -408,9 +402,7 @@ class TestUser(unittest.TestCase):
 
         self.assertEqual(bank_account.pin, "123456")
 
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
         result = self.user.change_pin(
             account_number="123456789",
             old_pin="123456",
@@ -428,9 +420,7 @@ class TestUser(unittest.TestCase):
 
         self.assertEqual(bank_account.balance, 1000)
 
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         result = self.user.withdraw(
             amount=100, account_number="123456789", pin_code="123456", auth=self.auth
@@ -446,9 +436,7 @@ class TestUser(unittest.TestCase):
 
         self.assertEqual(bank_account.balance, 1000)
 
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         result = self.user.deposit(
             amount=100, account_number="123456789", pin_code="123456", auth=self.auth
@@ -473,9 +461,7 @@ class TestUser(unittest.TestCase):
         )
         user2.open_bank_account(bank=self.bank, pin_code="654321", balance=500)
 
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         account_from = self.user.bank_accounts["123456789"]
         account_to = user2.bank_accounts["987654321"]
@@ -494,9 +480,7 @@ class TestUser(unittest.TestCase):
 
     def test_transfer_nonexistent_source_account(self):
         """Test that transfer fails if the source account doesn't exist."""
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         with self.assertRaises(ValueError):
             self.user.transfer(
@@ -523,9 +507,7 @@ class TestUser(unittest.TestCase):
     def test_get_transactions_success(self):
         """Test that user can get transactions successfully."""
 
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         self.user.deposit(
             amount=100, account_number="123456789", pin_code="123456", auth=self.auth
@@ -549,9 +531,7 @@ class TestUser(unittest.TestCase):
 
         mock_now.now.side_effect = [datetime(2025, 5, 10), datetime(2025, 5, 11)]
 
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         self.user.deposit(
             amount=100, account_number="123456789", pin_code="123456", auth=self.auth
@@ -600,9 +580,7 @@ class TestUser(unittest.TestCase):
         """Test that user can't get transactions by date if he tries to get it from not valid bank account."""
         from datetime import datetime
 
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         with self.assertRaises(ValueError):
             self.user.get_transactions_by_date(
@@ -615,9 +593,7 @@ class TestUser(unittest.TestCase):
     def test_unlock_account_success(self):
         """Test that a locked account can be successfully unlocked."""
 
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         bank_account = self.user.bank_accounts["123456789"]
         bank_account.status = AccountStatus.LOCKED
@@ -632,9 +608,7 @@ class TestUser(unittest.TestCase):
     def test_calculate_interest_success(self):
         """Test that an interest can be successfully calculated."""
 
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         result = self.user.calculate_intrest(
             days=10, account_number="123456789", auth=self.auth
@@ -645,9 +619,7 @@ class TestUser(unittest.TestCase):
 
     def test_change_currency_success(self):
         """Test that the currency of an account can be successfully changed."""
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         bank_account = self.user.bank_accounts["123456789"]
         initial_currency = bank_account.currency
@@ -668,7 +640,7 @@ class TestUser(unittest.TestCase):
         """Test that a user can be successfully retrieved."""
 
         self.auth.login(
-            user=self.admin, email=self.admin.email, password=self.admin.password
+            user=self.admin, email=self.admin.email, password="Password123!"
         )
 
         if self.user.id not in self.bank.users:
@@ -691,9 +663,7 @@ class TestUser(unittest.TestCase):
 
     def test_get_user_not_admin(self):
         """Test that non-admin users cannot retrieve user information."""
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         with self.assertRaises(PermissionError):
             self.user.get_user(user_id=3, bank=self.bank, auth=self.auth)
@@ -701,7 +671,7 @@ class TestUser(unittest.TestCase):
     def test_get_users_success(self):
         """Test that an admin can successfully retrieve all users."""
         self.auth.login(
-            user=self.admin, email=self.admin.email, password=self.admin.password
+            user=self.admin, email=self.admin.email, password="Password123!"
         )
 
         test_user = User(
@@ -730,9 +700,7 @@ class TestUser(unittest.TestCase):
     def test_get_users_not_admin(self):
         """Test that non-admin users cannot retrieve all users."""
 
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         with self.assertRaises(PermissionError):
             self.user.get_users(bank=self.bank, auth=self.auth)
@@ -741,7 +709,7 @@ class TestUser(unittest.TestCase):
         """Test retrieving users from an empty bank."""
 
         self.auth.login(
-            user=self.admin, email=self.admin.email, password=self.admin.password
+            user=self.admin, email=self.admin.email, password="Password123!"
         )
 
         empty_bank = Bank(name="Empty Bank", bank_code="0000")
@@ -751,12 +719,72 @@ class TestUser(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(len(result), 0)
 
+    def test_list_accounts_success(self):
+        """Test that an admin can page through filtered accounts."""
+        self.auth.login(
+            user=self.admin, email=self.admin.email, password="Password123!"
+        )
+        account = self.user.bank_accounts["123456789"]
+        account.status = AccountStatus.LOCKED
+
+        active = self.admin.list_accounts(
+            bank=self.bank, auth=self.auth, status=AccountStatus.ACTIVE
+        )
+        in_pln = self.admin.list_accounts(
+            bank=self.bank, auth=self.auth, currency="PLN", limit=10
+        )
+        locked = self.admin.get_accounts_by_status(
+            bank=self.bank, status=AccountStatus.LOCKED, auth=self.auth
+        )
+
+        self.assertEqual(active, ([], 0))
+        self.assertEqual(in_pln, ([account], 1))
+        self.assertEqual(locked, [account])
+
+    def test_list_users_success(self):
+        """Test that an admin can list users by role."""
+        self.auth.login(
+            user=self.admin, email=self.admin.email, password="Password123!"
+        )
+        self.bank.add_user(self.admin)
+
+        result = self.admin.list_users(
+            bank=self.bank, auth=self.auth, role=UserRole.ADMIN
+        )
+
+        self.assertEqual(result, ([self.admin], 1))
+
+    def test_admin_listing_errors(self):
+        """Test permissions and filter types of the admin listings."""
+        with self.assertRaises(PermissionError):
+            self.admin.list_users(bank=self.bank, auth=self.auth)
+
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
+
+        with self.assertRaises(PermissionError):
+            self.user.list_accounts(bank=self.bank, auth=self.auth)
+
+        with self.assertRaises(PermissionError):
+            self.user.get_accounts_by_status(
+                bank=self.bank, status=AccountStatus.LOCKED, auth=self.auth
+            )
+
+        self.auth.login(
+            user=self.admin, email=self.admin.email, password="Password123!"
+        )
+
+        with self.assertRaises(TypeError):
+            self.admin.list_accounts(bank=self.bank, auth=self.auth, status="locked")
+
+        with self.assertRaises(TypeError):
+            self.admin.list_users(bank=self.bank, auth=self.auth, role="admin")
+
     @patch("src.bank.Bank._fetch_currencies")
     def test_update_currencies_success(self, mock_fetch_currencies):
         """Test that an admin can successfully update currency exchange rates."""
 
         self.auth.login(
-            user=self.admin, email=self.admin.email, password=self.admin.password
+            user=self.admin, email=self.admin.email, password="Password123!"
         )
 
         initial_currencies = self.bank.currencies.copy()
@@ -780,9 +808,7 @@ class TestUser(unittest.TestCase):
     def test_update_currencies_not_admin(self):
         """Test that non-admin users cannot update currencies."""
 
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         with self.assertRaises(PermissionError):
             self.user.update_currencies(bank=self.bank, auth=self.auth)
@@ -902,9 +928,7 @@ class TestUser(unittest.TestCase):
                 {"days": 30, "account_number": "987654321"},
             ),
         ]
-        self.auth.login(
-            user=self.user, email=self.user.email, password=self.user.password
-        )
+        self.auth.login(user=self.user, email=self.user.email, password="Password123!")
 
         for method_name, method, kwargs in methods_to_test:
             with self.subTest(f"{method_name} - account not found"):
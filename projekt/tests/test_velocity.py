@@ -0,0 +1,251 @@
+import unittest
+from unittest.mock import patch
+
+from src.bank import Bank
+from src.user import User
+from src.bank_account import BankAccount
+from src.clearing_house import ClearingHouse
+from src.velocity import SlidingWindowCounter, VelocityLimit, VelocityLimiter
+
+
+class FakeClock:
+    """Manually advanced clock used to drive the sliding windows."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestSlidingWindowCounter(unittest.TestCase):
+    """Test cases for the SlidingWindowCounter class."""
+
+    def test_counts_events_inside_window(self):
+        """Test that events inside the window are summed."""
+        counter = SlidingWindowCounter(window=60, buckets=6)
+
+        counter.add(0, 10.0)
+        counter.add(15, 20.0)
+        count, total = counter.totals(30)
+
+        self.assertEqual(count, 2)
+        self.assertEqual(total, 30.0)
+
+    def test_expires_old_buckets(self):
+        """Test that events older than the window are dropped."""
+        counter = SlidingWindowCounter(window=60, buckets=6)
+
+        counter.add(0, 10.0)
+        counter.add(35, 20.0)
+        count, total = counter.totals(65)
+
+        self.assertEqual(count, 1)
+        self.assertEqual(total, 20.0)
+
+    def test_long_gap_resets_counter(self):
+        """Test that a gap longer than the window clears every bucket."""
+        counter = SlidingWindowCounter(window=60, buckets=6)
+
+        counter.add(0, 10.0)
+        counter.add(5, 10.0)
+
+        self.assertEqual(counter.totals(1000), (0, 0.0))
+
+    def test_invalid_parameters(self):
+        """Test counter creation with invalid parameters."""
+        with self.assertRaises(ValueError):
+            SlidingWindowCounter(window=0)
+
+        with self.assertRaises(ValueError):
+            SlidingWindowCounter(window=60, buckets=0)
+
+
+class TestVelocityLimiter(unittest.TestCase):
+    """Test cases for the VelocityLimiter class."""
+
+    @patch("src.bank.Bank._fetch_currencies")
+    def setUp(self, mock_fetch):
+        """Set up test fixtures."""
+        mock_fetch.return_value = {"PLN": 1.0, "EUR": 4.0}
+
+        self.bank = Bank(name="PKO BP", bank_code="1120")
+        self.clock = FakeClock(1000.0)
+
+        self.user = User(
+            id=1,
+            name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            password="Password123!",
+            phone="781234567",
+        )
+
+        self.account = BankAccount(
+            owner=self.user, bank=self.bank, pin_code="123456", balance=10000
+        )
+        self.euro_account = BankAccount(
+            owner=self.user,
+            bank=self.bank,
+            pin_code="123456",
+            balance=1000,
+            currency="EUR",
+        )
+
+    def test_invalid_limit(self):
+        """Test creating a limit without any maximum."""
+        with self.assertRaises(ValueError):
+            VelocityLimit()
+
+    def test_withdraw_count_limit(self):
+        """Test that withdrawals over the count limit are rejected."""
+        VelocityLimiter(
+            self.bank,
+            account_limits=[VelocityLimit(max_count=2, window=3600)],
+            clock=self.clock,
+        )
+
+        self.account.withdraw(10, "123456")
+        self.account.withdraw(10, "123456")
+
+        with self.assertRaises(PermissionError):
+            self.account.withdraw(10, "123456")
+
+        self.assertEqual(self.account.balance, 9980)
+
+    def test_limit_resets_after_window(self):
+        """Test that the limit frees up once the window has passed."""
+        VelocityLimiter(
+            self.bank,
+            account_limits=[VelocityLimit(max_count=1, window=3600)],
+            clock=self.clock,
+        )
+
+        self.account.withdraw(10, "123456")
+        self.clock.now += 3600
+
+        result = self.account.withdraw(10, "123456")
+
+        self.assertTrue(result)
+
+    def test_amount_limit_in_pln(self):
+        """Test that amount limits are evaluated in PLN."""
+        VelocityLimiter(
+            self.bank,
+            account_limits=[VelocityLimit(max_amount=1000, window=3600)],
+            clock=self.clock,
+        )
+
+        self.euro_account.withdraw(200, "123456")
+
+        with self.assertRaises(PermissionError):
+            self.euro_account.withdraw(60, "123456")
+
+        result = self.euro_account.withdraw(50, "123456")
+
+        self.assertTrue(result)
+
+    def test_user_limit_spans_accounts(self):
+        """Test that per-user limits count operations of all the owner's accounts."""
+        VelocityLimiter(
+            self.bank,
+            user_limits=[VelocityLimit(max_count=2, window=3600)],
+            clock=self.clock,
+        )
+
+        self.account.withdraw(10, "123456")
+        self.account.transfer(
+            10, self.euro_account.account_number, "123456", self.bank
+        )
+
+        with self.assertRaises(PermissionError):
+            self.euro_account.withdraw(10, "123456")
+
+    def test_limit_ignores_other_operations(self):
+        """Test that limits only apply to the configured operations."""
+        VelocityLimiter(
+            self.bank,
+            account_limits=[VelocityLimit(max_count=1, operations=("withdraw",))],
+            clock=self.clock,
+        )
+
+        self.account.transfer(
+            10, self.euro_account.account_number, "123456", self.bank
+        )
+        self.account.transfer(
+            10, self.euro_account.account_number, "123456", self.bank
+        )
+        self.account.deposit(10, "123456")
+
+        result = self.account.withdraw(10, "123456")
+
+        self.assertTrue(result)
+
+    def test_interbank_transfers_are_limited(self):
+        """Test that clearing-house transfers count against the default limits."""
+        other = Bank(name="mBank", bank_code="1140", currencies={"PLN": 1.0})
+        clearing_house = ClearingHouse([self.bank, other])
+        VelocityLimiter(
+            self.bank,
+            account_limits=[VelocityLimit(max_count=2, window=3600)],
+            clock=self.clock,
+        )
+
+        clearing_house.submit(self.account, "1140", "000", 10, "123456")
+        self.account.withdraw(10, "123456")
+
+        with self.assertRaises(PermissionError):
+            clearing_house.submit(self.account, "1140", "000", 10, "123456")
+
+    def test_transfers_through_other_banks_are_counted(self):
+        """Test that transfers filed in another bank's ledger count for the source."""
+        other = Bank(name="mBank", bank_code="1140", currencies={"PLN": 1.0})
+        target = BankAccount(owner=self.user, bank=other, pin_code="123456")
+        VelocityLimiter(
+            self.bank,
+            account_limits=[VelocityLimit(max_count=2, window=3600)],
+            clock=self.clock,
+        )
+
+        self.account.transfer(10, target.account_number, "123456", other)
+        self.account.transfer(10, target.account_number, "123456", other)
+
+        with self.assertRaises(PermissionError):
+            self.account.withdraw(10, "123456")
+
+        self.assertEqual(target.balance, 20)
+
+    def test_evaluate_batch(self):
+        """Test scoring a batch of pending transfers against the limits."""
+        limiter = VelocityLimiter(
+            self.bank,
+            account_limits=[VelocityLimit(max_count=2, max_amount=500)],
+            clock=self.clock,
+        )
+        self.account.withdraw(100, "123456")
+
+        results = limiter.evaluate_batch(
+            [
+                (self.account.account_number, "transfer", 300),
+                (self.account.account_number, "transfer", 50),
+                (self.euro_account.account_number, "transfer", 100),
+                (self.euro_account.account_number, "transfer", 100),
+                (self.euro_account.account_number, "deposit", 1000),
+            ]
+        )
+
+        self.assertEqual(results, [True, False, True, False, True])
+        self.assertEqual(self.account.balance, 9900)
+
+    def test_evaluate_batch_unknown_account(self):
+        """Test scoring a batch that references a missing account."""
+        limiter = VelocityLimiter(
+            self.bank, account_limits=[VelocityLimit(max_count=1)], clock=self.clock
+        )
+
+        with self.assertRaises(ValueError):
+            limiter.evaluate_batch([("000", "withdraw", 10)])
+
+
+if __name__ == "__main__":
+    unittest.main()
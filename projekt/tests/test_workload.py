@@ -0,0 +1,91 @@
+import unittest
+
+from src.workload import DEFAULT_MIX, LOCAL_RATES, WorkloadGenerator, run_workload
+
+
+class TestWorkloadGenerator(unittest.TestCase):
+    """Test cases for the workload generator and runner."""
+
+    def test_invalid_parameters(self):
+        """Test creating generators with invalid sizes or mixes."""
+        with self.assertRaises(ValueError):
+            WorkloadGenerator(users=1)
+
+        with self.assertRaises(ValueError):
+            WorkloadGenerator(mix={})
+
+        with self.assertRaises(ValueError):
+            WorkloadGenerator(mix={"rob_bank": 1})
+
+        with self.assertRaises(ValueError):
+            next(WorkloadGenerator().operations(1))
+
+    def test_build_creates_valid_users_and_accounts(self):
+        """Test that users pass validation and accounts use local currencies."""
+        generator = WorkloadGenerator(users=50, seed=1)
+        bank = generator.build()
+
+        self.assertEqual(len(bank.users), 50)
+        self.assertEqual(len(bank.accounts), 50)
+        self.assertEqual(bank.currencies, LOCAL_RATES)
+        self.assertLessEqual(
+            {account.currency for account in bank.accounts.values()}, set(LOCAL_RATES)
+        )
+        self.assertTrue(
+            all(generator.auth.is_logged_in(user) for user, _, _ in generator.accounts)
+        )
+
+    def test_operations_are_deterministic(self):
+        """Test that the same seed produces the same operation sequence."""
+
+        def names(seed):
+            generator = WorkloadGenerator(users=20, seed=seed)
+            generator.build()
+            return [name for name, _, _ in generator.operations(200)]
+
+        self.assertEqual(names(3), names(3))
+        self.assertNotEqual(names(3), names(4))
+        self.assertLessEqual(set(names(3)), set(DEFAULT_MIX))
+
+    def test_mix_is_respected(self):
+        """Test that only operations from the mix are generated."""
+        generator = WorkloadGenerator(users=5, mix={"deposit": 1, "withdraw": 1})
+        generator.build()
+
+        names = {name for name, _, _ in generator.operations(100)}
+
+        self.assertEqual(names, {"deposit", "withdraw"})
+
+    def test_run_workload_reports_per_operation(self):
+        """Test that the runner reports counts, errors and latency percentiles."""
+        generator = WorkloadGenerator(users=20, seed=2)
+        generator.build()
+
+        report = run_workload(generator.operations(500))
+
+        self.assertEqual(report["operations"], 500)
+        self.assertEqual(
+            sum(stats["count"] for stats in report["by_operation"].values()), 500
+        )
+        self.assertGreater(report["throughput"], 0)
+        self.assertGreater(report["peak_rss_kb"], 0)
+
+        for stats in report["by_operation"].values():
+            self.assertLessEqual(stats["p50"], stats["p99"])
+            self.assertLessEqual(stats["p99"], stats["max"])
+            self.assertLessEqual(stats["errors"], stats["count"])
+
+    def test_failed_operations_are_counted(self):
+        """Test that operations raising domain errors count as errors."""
+
+        def failing():
+            raise ValueError("Insufficient funds.")
+
+        report = run_workload([("withdraw", failing, ()), ("withdraw", len, ("",))])
+
+        self.assertEqual(report["by_operation"]["withdraw"]["errors"], 1)
+        self.assertEqual(report["by_operation"]["withdraw"]["count"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()